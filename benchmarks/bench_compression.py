@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the size/time trade-offs of the compression codecs and levels supported by yadopt.save.
+"""
+
+# Import standard libraries.
+import argparse
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+# For type hints.
+from collections.abc import Callable
+from typing          import Any, TypeAlias
+
+# Type aliases.
+Path: TypeAlias = pathlib.Path
+
+# Docstring used in this benchmark.
+DOCSTR: str = """
+Arguments:
+    files...        Input files.
+
+Options:
+    --epochs INT    The number of training epochs.   [default: 100]
+    --model STR     Neural network model name.       [default: mlp]
+    --lr FLT        Learning rate.                   [default: 1.0E-3]
+    --output PATH   Path to output directory.        [default: runs]
+"""
+
+# Pairs of the compression suffix and the compression level to be measured. None means the default level.
+CODECS: list[tuple[str, int | None]] = [
+    ("",     None),
+    (".gz",  1), (".gz",  6), (".gz",  None),
+    (".bz2", 1), (".bz2", None),
+    (".xz",  0), (".xz",  None),
+]
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-l", "--local", action="store_true", help="Use local package")
+    parser.add_argument("-n", "--num_files", type=int, nargs="+", default=[10, 100_000],
+                        help="Number of input files (typical and huge payloads)")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Number of repetitions")
+    parser.add_argument("-f", "--formats", nargs="+", default=["json", "yadopt"], help="File formats to be measured")
+    return parser.parse_args()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Returns the best elapsed time of the given function in seconds.
+    """
+    elapsed: list[float] = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - time_start)
+    return min(elapsed)
+
+
+def main(args: argparse.Namespace) -> None:
+    """
+    Main function of this benchmark script.
+    """
+    for num_files in args.num_files:
+
+        # Create parsed arguments with a list of paths.
+        argv: list[str] = [f"data/shard_{idx:08d}/sample.bin" for idx in range(num_files)] + ["--model", "cnn"]
+        parsed = yadopt.parse(DOCSTR, argv)
+        parsed = yadopt.overlay(parsed, {"files": [yadopt.Path(path) for path in parsed.files]}).flatten()
+
+        print(f"Number of files: {num_files}")
+        print(f"{'format':<12} {'level':>6} {'size [KiB]':>12} {'save [ms]':>12} {'load [ms]':>12}")
+
+        with tempfile.TemporaryDirectory() as dirpath:
+
+            for fmt in args.formats:
+                for (suffix, level) in CODECS:
+
+                    path: Path = Path(dirpath) / f"args.{fmt}{suffix}"
+
+                    time_save: float = measure(lambda: yadopt.save(path, parsed, metadata=False, compresslevel=level),
+                                               args.repeat)
+                    time_load: float = measure(lambda: yadopt.load(path), args.repeat)
+
+                    # Check the written file.
+                    assert yadopt.load(path) == parsed
+
+                    print(f"{fmt + suffix:<12} {'-' if level is None else level:>6} "
+                          f"{os.path.getsize(path) / 1024:12.1f} {1000 * time_save:12.2f} {1000 * time_load:12.2f}")
+
+        print()
+
+
+if __name__ == "__main__":
+
+    # Parse command line arguments.
+    args: argparse.Namespace = parse_args()
+
+    if args.local:
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    # Import Yadopt.
+    import yadopt
+
+    # Call the main function.
+    main(args)
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
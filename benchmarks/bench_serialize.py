@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the file formats supported by yadopt.save and yadopt.load.
+"""
+
+# Import standard libraries.
+import argparse
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+# For type hints.
+from collections.abc import Callable
+from typing          import Any, TypeAlias
+
+# Type aliases.
+Path: TypeAlias = pathlib.Path
+
+# Docstring used in this benchmark.
+DOCSTR: str = """
+Arguments:
+    files...        Input files.
+
+Options:
+    --epochs INT    The number of training epochs.   [default: 100]
+    --model STR     Neural network model name.       [default: mlp]
+    --lr FLT        Learning rate.                   [default: 1.0E-3]
+    --output PATH   Path to output directory.        [default: runs]
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-l", "--local", action="store_true", help="Use local package")
+    parser.add_argument("-n", "--num_files", type=int, default=100_000, help="Number of input files")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Number of repetitions")
+    parser.add_argument("-f", "--formats", nargs="+", default=["json", "json.gz", "toml", "yadopt", "yadopt.gz"],
+                        help="File formats to be measured")
+    return parser.parse_args()
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Returns the best elapsed time of the given function in seconds.
+    """
+    elapsed: list[float] = []
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - time_start)
+    return min(elapsed)
+
+
+def main(args: argparse.Namespace) -> None:
+    """
+    Main function of this benchmark script.
+    """
+    # Create parsed arguments with a huge list of paths.
+    argv: list[str] = [f"data/shard_{idx:08d}/sample.bin" for idx in range(args.num_files)] + ["--model", "cnn"]
+    parsed = yadopt.parse(DOCSTR, argv)
+    parsed = yadopt.overlay(parsed, {"files": [yadopt.Path(path) for path in parsed.files]}).flatten()
+
+    print(f"Number of files: {args.num_files}")
+    print(f"{'format':<12} {'size [KiB]':>12} {'save [ms]':>12} {'load [ms]':>12} {'partial [ms]':>12}")
+
+    with tempfile.TemporaryDirectory() as dirpath:
+
+        for suffix in args.formats:
+
+            path: Path = Path(dirpath) / f"args.{suffix}"
+
+            time_save: float = measure(lambda: yadopt.save(path, parsed, metadata=False), args.repeat)
+            time_load: float = measure(lambda: yadopt.load(path), args.repeat)
+            time_part: float = measure(lambda: yadopt.load(path, groups=["Options"]), args.repeat)
+
+            # Check the restored arguments.
+            assert yadopt.load(path) == parsed
+
+            print(f"{suffix:<12} {os.path.getsize(path) / 1024:12.1f} {1000 * time_save:12.1f} {1000 * time_load:12.1f}"
+                  f" {1000 * time_part:12.1f}")
+
+
+if __name__ == "__main__":
+
+    # Parse command line arguments.
+    args: argparse.Namespace = parse_args()
+
+    if args.local:
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    # Import Yadopt.
+    import yadopt
+
+    # Call the main function.
+    main(args)
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the peak memory usage of yadopt.save with TOML files holding huge lists.
+"""
+
+# Import standard libraries.
+import argparse
+import gzip
+import os
+import pathlib
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# For type hints.
+from collections.abc import Callable
+from typing          import Any, TypeAlias
+
+# Type aliases.
+Path: TypeAlias = pathlib.Path
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-l", "--local", action="store_true", help="Use local package")
+    parser.add_argument("-n", "--num_items", type=int, default=1_000_000, help="Number of list items")
+    return parser.parse_args()
+
+
+def measure(func: Callable[[], Any]) -> tuple[float, float]:
+    """
+    Returns the elapsed time in seconds and the peak memory usage in MiB of the given function.
+    """
+    tracemalloc.start()
+    time_start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - time_start
+    (_, peak) = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (elapsed, peak / 1024 / 1024)
+
+
+def main(args: argparse.Namespace) -> None:
+    """
+    Main function of this benchmark script.
+    """
+    # Values of the saved file: a huge list of strings and a huge list of floats.
+    data_dict: dict[str, Any] = {
+        "Arguments": {"files": [f"data/shard_{idx:08d}/sample.bin" for idx in range(args.num_items)]},
+        "Options"  : {"weights": [0.001 * idx for idx in range(args.num_items)]},
+    }
+
+    print(f"Number of items: {args.num_items}")
+    print(f"{'method':<24} {'time [ms]':>12} {'peak [MiB]':>12}")
+
+    with tempfile.TemporaryDirectory() as dirpath:
+
+        for suffix in ["toml", "toml.gz"]:
+
+            path: Path = Path(dirpath) / f"args.{suffix}"
+            open_fn: Callable = gzip.open if suffix.endswith(".gz") else open
+
+            # Method 1: Build the whole TOML string in memory, then write it.
+            def dump_string() -> None:
+                with open_fn(path, "wt") as ofp:
+                    ofp.write(yadopt.toml.dump_toml(data_dict))
+
+            # Method 2: Write the TOML string in chunks.
+            def dump_stream() -> None:
+                with open_fn(path, "wt") as ofp:
+                    yadopt.toml.dump_toml(data_dict, ofp)
+
+            for (name, func) in [("string", dump_string), ("stream", dump_stream)]:
+                (elapsed, peak) = measure(func)
+                print(f"{suffix + ' ' + name:<24} {1000 * elapsed:12.1f} {peak:12.1f}")
+
+            # Check the written file.
+            with open_fn(path, "rb") as ifp:
+                assert yadopt.toml.load_toml(ifp) == data_dict
+            print(f"{suffix + ' file size':<24} {os.path.getsize(path) / 1024 / 1024:12.1f} MiB")
+
+
+if __name__ == "__main__":
+
+    # Parse command line arguments.
+    args: argparse.Namespace = parse_args()
+
+    if args.local:
+        sys.path.insert(0, str(Path(__file__).parent.parent))
+
+    # Import Yadopt.
+    import yadopt
+    import yadopt.toml
+
+    # Call the main function.
+    main(args)
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
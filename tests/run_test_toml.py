@@ -9,6 +9,7 @@ testing those cases instead.
 # Import standard libraries.
 import pathlib
 import sys
+import tempfile
 
 # For type hinting.
 from typing import TypeAlias
@@ -69,6 +70,31 @@ def test_legacy_toml():
     assert args.lr == 1.0E-4
 
 
+def test_streaming_toml():
+    """
+    Test for TOML files written in chunks, including quoted group names and huge lists.
+    """
+    docstr = """
+    Arguments:
+        files...        Input files.
+
+    Training options:
+        --lr FLT        Learning rate.   [default: 1.0E-3]
+    """
+    files = [f"data/file_{idx:06d}.bin" for idx in range(10_000)]
+    args = yadopt.parse(docstr, files + ["--lr", "0.1"])
+
+    with tempfile.TemporaryDirectory() as dirpath:
+        for suffix in [".toml", ".toml.gz"]:
+            path = Path(dirpath) / f"args{suffix}"
+            yadopt.save(path, args)
+            args_restored = yadopt.load(path)
+            assert args_restored == args
+            assert yadopt.get_group(args_restored, "Training options").lr == 0.1
+
+    print("PASSED: Streaming TOML")
+
+
 if __name__ == "__main__":
 
     # Test for broken JSON/TOML format.
@@ -78,5 +104,8 @@ if __name__ == "__main__":
     # Test for legacy TOML format.
     test_legacy_toml()
 
+    # Test for TOML files written in chunks.
+    test_streaming_toml()
+
 
 # vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -3,18 +3,33 @@ yadopt.__init__ - initialize yadopt module
 """
 
 # Import custom modules.
-from .errors    import YadOptError
-from .datamodel import YadOptArgs
-from .dtypes    import Path
-from .serialize import load, save
-from .yadopt    import parse, wrap, to_dict, to_namedtuple, get_group
+from .background  import BackgroundSaver
+from .catalog     import Catalog
+from .errors      import YadOptError
+from .datamodel   import YadOptArgs, replace
+from .dtypes      import Path
+from .fingerprint import diff, fingerprint, group_fingerprints
+from .handoff     import export_env, from_env
+from .journal     import append_journal, read_journal
+from .memoize     import memoize_run
+from .metadata    import register_metadata_provider, unregister_metadata_provider
+from .overlay     import YadOptOverlay, overlay
+from .serialize   import load, load_many, save
+from .sharedmem   import release_memory, share_memory
+from .store       import gc_store
+from .tracking    import accessed, track
+from .watch       import ArgsWatcher, watch
+from .yadopt      import parse, wrap, to_dict, to_namedtuple, get_group
 
 # Version information.
 __version__ = "2026.6.26"
 
 # Declare published functions and variables.
-__all__ = ["parse", "wrap", "to_dict", "to_namedtuple", "save", "load", "get_group",
-           "YadOptArgs", "YadOptError", "Path", "__version__"]
+__all__ = ["parse", "wrap", "memoize_run", "to_dict", "to_namedtuple", "save", "load", "load_many", "get_group",
+           "fingerprint", "group_fingerprints", "diff", "overlay", "register_metadata_provider",
+           "unregister_metadata_provider", "append_journal", "read_journal", "gc_store", "track", "accessed",
+           "replace", "export_env", "from_env", "share_memory", "release_memory", "watch", "ArgsWatcher",
+           "BackgroundSaver", "Catalog", "YadOptArgs", "YadOptOverlay", "YadOptError", "Path", "__version__"]
 
 
 # vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,192 @@
+"""
+yadopt.background - write-behind saver of parsed command line arguments.
+
+The background saver accepts save requests without touching the file system, and writes them on
+a worker thread. Only the latest request is kept for each path, so a training loop that saves the
+arguments at every checkpoint never waits on the file system, and the worker writes each file at
+most once per round. Files are written atomically, so readers never see a partially written file.
+The worker thread exits when no request is pending, and the savers are referred to weakly at exit,
+so a saver that is no longer used is freed.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import atexit
+import threading
+import weakref
+
+# For type hinting.
+from typing import Any
+
+# Import custom modules.
+from .datamodel import YadOptArgs
+from .dtypes    import Path
+from .errors    import YadOptError
+from .serialize import SUFFIXES_ALL, save
+
+# Declare published functions and variables.
+__all__ = ["BackgroundSaver"]
+
+# Keyword arguments of "yadopt.save" that are fixed by the background saver.
+FIXED_KWARGS: tuple[str, ...] = ("atomic",)
+
+
+class BackgroundSaver:
+    """
+    Write-behind saver that writes the latest requested arguments of each path on a worker thread.
+    Pending requests are flushed when the saver is closed, and at the latest when the interpreter exits.
+
+    Examples:
+        >>> saver = BackgroundSaver(metadata="cheap")
+        >>> saver.save("runs/args.json", args)  # doctest: +SKIP
+        >>> saver.close()
+    """
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        Constructor.
+
+        Args:
+            kwargs (Any): [IN] Default keyword arguments of "yadopt.save", for example, `metadata="cheap"`.
+        """
+        self.kwargs : dict[str, Any]                                = kwargs
+        self.pending: dict[Path, tuple[YadOptArgs, dict[str, Any]]] = {}
+        self.errors : list[tuple[Path, BaseException]]              = []
+        self.cond   : threading.Condition                           = threading.Condition()
+        self.thread : threading.Thread | None                       = None
+        self.busy   : bool                                          = False
+        self.closed : bool                                          = False
+
+        # Flush pending requests when the interpreter exits.
+        SAVERS.add(self)
+
+    def __enter__(self) -> BackgroundSaver:
+        """
+        Enter the context.
+        """
+        return self
+
+    def __exit__(self, *pargs: Any) -> None:
+        """
+        Flush pending requests and stop the worker when exiting the context.
+        """
+        self.close()
+
+    def save(self, path: str | Path, args: YadOptArgs, **kwargs: Any) -> None:
+        """
+        Request to save the parsed command line arguments. This function returns immediately, and
+        replaces the pending request of the same path if it is not written yet.
+
+        Args:
+            path   (str | Path): [IN] Destination path.
+            args   (YadOptArgs): [IN] Parsed command line arguments to be saved. The arguments must not
+                                      be modified until they are written.
+            kwargs (Any)       : [IN] Keyword arguments of "yadopt.save" that override the defaults.
+        """
+        # Convert the given path as an instance of Path.
+        path_out: Path = Path(path) if isinstance(path, str) else path
+
+        # Validate the file format here, because errors on the worker thread are reported later.
+        if not any(path_out.name.endswith(sfx) for sfx in SUFFIXES_ALL):
+            raise YadOptError.InvalidFileFormat(suffix=path_out.suffix)
+
+        # Files are always written atomically, so the keyword arguments must not change it.
+        kwargs = {**self.kwargs, **kwargs}
+        for name in (name for name in FIXED_KWARGS if name in kwargs):
+            raise YadOptError.CannotSaveInBackground(path=str(path_out),
+                                                     reason=f"The keyword argument '{name}' cannot be given.")
+
+        with self.cond:
+
+            if self.closed:
+                raise YadOptError.CannotSaveInBackground(path=str(path_out), reason="The saver is already closed.")
+
+            # Replace the pending request of the same path, and move it to the end of the queue.
+            self.pending.pop(path_out, None)
+            self.pending[path_out] = (args, kwargs)
+
+            # Start the worker thread lazily. The thread exits when no request is pending.
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="yadopt-background-saver", daemon=True)
+                self.thread.start()
+
+            self.cond.notify_all()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all pending requests are written.
+
+        Args:
+            timeout (float | None): [IN] Timeout in seconds. Wait forever if None.
+
+        Returns:
+            (bool): True if all pending requests are written, False if timed out.
+        """
+        with self.cond:
+            done: bool = self.cond.wait_for(lambda: not (self.pending or self.busy), timeout)
+            errors: list[tuple[Path, BaseException]] = self.errors
+            self.errors = []
+
+        # Report the first error on the worker thread.
+        if errors:
+            (path, error) = errors[0]
+            raise YadOptError.CannotSaveInBackground(path=str(path), reason=str(error)) from error
+
+        return done
+
+    def close(self) -> None:
+        """
+        Write all pending requests and stop the worker thread. This function is called at exit.
+        """
+        with self.cond:
+            self.closed = True
+            thread: threading.Thread | None = self.thread
+
+        if thread is not None:
+            thread.join()
+
+        SAVERS.discard(self)
+        self.flush()
+
+    def run(self) -> None:
+        """
+        Main loop of the worker thread.
+        """
+        while True:
+
+            # Take the oldest request. The thread exits if no request is pending, so that the thread
+            # does not keep an unused saver alive.
+            with self.cond:
+                if not self.pending:
+                    self.thread = None
+                    return
+                path: Path = next(iter(self.pending))
+                (args, kwargs) = self.pending.pop(path)
+                self.busy = True
+
+            # Write the file outside the lock, so that new requests are accepted meanwhile.
+            try:
+                save(path, args, atomic=True, **kwargs)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                with self.cond:
+                    self.errors.append((path, error))
+
+            with self.cond:
+                self.busy = False
+                self.cond.notify_all()
+
+
+# Savers to be closed when the interpreter exits. Savers are referred to weakly, so that savers no
+# longer used are freed without being closed.
+SAVERS: weakref.WeakSet[BackgroundSaver] = weakref.WeakSet()
+
+
+@atexit.register
+def close_savers() -> None:
+    """
+    Close all savers when the interpreter exits.
+    """
+    for saver in list(SAVERS):
+        saver.close()
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,371 @@
+"""
+yadopt.binfmt - compact binary format for saving parsed command line arguments.
+
+The binary file consists of a fixed-size header and a body. The header contains the magic bytes
+and the format version. Every value is stored with a one-byte type tag, and lists of strings or paths
+are packed into a single NUL-separated blob so that huge lists can be encoded and decoded without
+per-item overhead.
+
+Version 2 (current): the body consists of the size of the index block, the index block, and the
+values block. The index block contains the class name, the metadata, and the groups, where each
+name in a group has the offset and the size of its value in the values block. Therefore, a subset
+of values can be decoded without reading the other values.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import dataclasses
+import struct
+
+# For type hinting.
+from collections.abc import Callable, Collection
+from typing          import IO, Any
+
+# Import custom modules.
+from .blob   import BlobSequence
+from .dtypes import Path
+from .errors import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["BinaryContents", "dump_binary", "load_binary", "select_contents"]
+
+# Magic bytes at the beginning of the binary file.
+MAGIC: bytes = b"YADOPT\x00\x00"
+
+# Current version of the binary format.
+VERSION: int = 2
+
+# Header structure: magic bytes, format version, and reserved flags.
+HEADER: struct.Struct = struct.Struct("<8sHH")
+
+# Structures of numbers.
+U32: struct.Struct = struct.Struct("<I")
+U64: struct.Struct = struct.Struct("<Q")
+I64: struct.Struct = struct.Struct("<q")
+F64: struct.Struct = struct.Struct("<d")
+
+
+@dataclasses.dataclass
+class BinaryContents:
+    """
+    Contents of a binary file.
+    """
+    class_name: str                   # Name of the class of the saved YadOptArgs.
+    metadata  : dict[str, Any]        # Metadata dictionary.
+    groups    : dict[str, list[str]]  # Map from group name to the names in the group.
+    values    : dict[str, Any]        # Map from name to value.
+
+
+def dump_binary(contents: BinaryContents, ofp: IO[bytes]) -> None:
+    """
+    Write the given contents to the file object in the binary format.
+
+    Args:
+        contents (BinaryContents): [IN] Contents to be written.
+        ofp      (IO[bytes])     : [IN] Output file object opened in binary mode.
+
+    Examples:
+        >>> import io
+        >>> (buffer, values) = (io.BytesIO(), {"lr": 0.1, "model": "cnn"})
+        >>> dump_binary(BinaryContents("YadOptArgs", {}, {"Options": ["lr", "model"]}, values), buffer)
+        >>> load_binary(io.BytesIO(buffer.getvalue())).values
+        {'lr': 0.1, 'model': 'cnn'}
+        >>> load_binary(io.BytesIO(buffer.getvalue()), keys=["model"]).values
+        {'model': 'cnn'}
+    """
+    # Encode the values first to know their offsets and sizes.
+    chunks_value: list[bytes] = []
+    entries: dict[str, list[tuple[str, int, int]]] = {}
+    offset: int = 0
+    for group_name, names in contents.groups.items():
+        entries[group_name] = []
+        for name in filter(lambda name: name in contents.values, names):
+            chunks: list[bytes] = []
+            encode_item(contents.values[name], chunks)
+            size: int = sum(map(len, chunks))
+            entries[group_name].append((name, offset, size))
+            chunks_value.extend(chunks)
+            offset += size
+
+    # Write the class name, the metadata, and the groups with the offsets of values to the index block.
+    chunks_index: list[bytes] = []
+    encode_str(contents.class_name, chunks_index)
+    chunks_index.append(U32.pack(len(contents.metadata)))
+    for key, value in contents.metadata.items():
+        encode_str(key, chunks_index)
+        encode_item(value, chunks_index)
+    chunks_index.append(U32.pack(len(entries)))
+    for group_name, group_entries in entries.items():
+        encode_str(group_name, chunks_index)
+        chunks_index.append(U32.pack(len(group_entries)))
+        for (name, offset, size) in group_entries:
+            encode_str(name, chunks_index)
+            chunks_index.append(U64.pack(offset) + U64.pack(size))
+
+    ofp.write(HEADER.pack(MAGIC, VERSION, 0) + U64.pack(sum(map(len, chunks_index))))
+    ofp.writelines(chunks_index)
+    ofp.writelines(chunks_value)
+
+
+def load_binary(ifp: IO[bytes], groups: Collection[str] | None = None,
+                keys: Collection[str] | None = None) -> BinaryContents:
+    """
+    Read the contents of a binary file. If groups or keys are given, only the requested values
+    are read and decoded.
+
+    Args:
+        ifp    (IO[bytes])              : [IN] Input file object opened in binary mode.
+        groups (Collection[str] | None) : [IN] Groups to be decoded. All groups are decoded if None.
+        keys   (Collection[str] | None) : [IN] Keys to be decoded. All keys are decoded if None.
+
+    Returns:
+        (BinaryContents): Contents of the binary file.
+    """
+    # Validate the header.
+    header: bytes = ifp.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise YadOptError.InvalidBinaryFile(reason="The binary file is too short.")
+    (magic, version, _) = HEADER.unpack(header)
+    if magic != MAGIC:
+        raise YadOptError.InvalidBinaryFile(reason="Invalid magic bytes of the binary file.")
+    if version != VERSION:
+        raise YadOptError.InvalidBinaryFile(reason=f"Unsupported binary format version {version}.")
+
+    try:
+        # Read the index block.
+        (size_index,) = U64.unpack(read_exact(ifp, U64.size))
+        (class_name, metadata, entries) = BinaryDecoder(read_exact(ifp, size_index), 0).decode_index()
+
+        # Select the requested entries.
+        selected: dict[str, list[tuple[str, int, int]]] = {
+            group_name: [entry for entry in group_entries if (keys is None) or (entry[0] in keys)]
+            for group_name, group_entries in entries.items() if (groups is None) or (group_name in groups)
+        }
+
+        # Read the values. The whole values block is read at once if all values are requested,
+        # otherwise only the requested values are read in the order of the offsets.
+        values: dict[str, Any] = {}
+        if (groups is None) and (keys is None):
+            decoder: BinaryDecoder = BinaryDecoder(ifp.read(), 0)
+            for (name, offset, _) in (entry for group_entries in selected.values() for entry in group_entries):
+                decoder.offset = offset
+                values[name] = decoder.read_item()
+        else:
+            position: int = HEADER.size + U64.size + size_index
+            for (name, offset, size) in sorted((entry for group_entries in selected.values()
+                                                for entry in group_entries), key=lambda entry: entry[1]):
+                ifp.seek(position + offset)
+                values[name] = BinaryDecoder(read_exact(ifp, size), 0).read_item()
+
+        groups_out: dict[str, list[str]] = {group_name: [name for (name, _, _) in group_entries]
+                                            for group_name, group_entries in selected.items()}
+
+        return BinaryContents(class_name, metadata, groups_out, values)
+
+    except (struct.error, IndexError, KeyError, UnicodeDecodeError, EOFError) as error:
+        raise YadOptError.InvalidBinaryFile(reason="The binary file is broken.") from error
+
+
+def select_contents(contents: BinaryContents, groups: Collection[str] | None = None,
+                    keys: Collection[str] | None = None) -> BinaryContents:
+    """
+    Returns the contents that contain only the requested groups and keys.
+
+    Args:
+        contents (BinaryContents)         : [IN] Contents to be filtered.
+        groups   (Collection[str] | None) : [IN] Groups to be kept. All groups are kept if None.
+        keys     (Collection[str] | None) : [IN] Keys to be kept. All keys are kept if None.
+
+    Returns:
+        (BinaryContents): Filtered contents.
+    """
+    if (groups is None) and (keys is None):
+        return contents
+
+    groups_out: dict[str, list[str]] = {
+        group_name: [name for name in names if ((keys is None) or (name in keys)) and (name in contents.values)]
+        for group_name, names in contents.groups.items() if (groups is None) or (group_name in groups)
+    }
+    values_out: dict[str, Any] = {name: contents.values[name] for names in groups_out.values() for name in names}
+
+    return BinaryContents(contents.class_name, contents.metadata, groups_out, values_out)
+
+
+def read_exact(ifp: IO[bytes], size: int) -> bytes:
+    """
+    Read exactly the given size of bytes from the file object.
+    """
+    data: bytes = ifp.read(size)
+    if len(data) != size:
+        raise EOFError("Unexpected end of the binary file")
+    return data
+
+
+def encode_str(text: str, chunks: list[bytes]) -> None:
+    """
+    Append the binary expression of the given string to the chunks.
+    """
+    data: bytes = text.encode()
+    chunks.append(U32.pack(len(data)))
+    chunks.append(data)
+
+
+def encode_item(value: Any, chunks: list[bytes]) -> None:
+    """
+    Append the binary expression of the given value to the chunks.
+
+    Args:
+        value  (Any)        : [IN]  Value to be encoded.
+        chunks (list[bytes]): [OUT] List of binary chunks.
+    """
+    # Case 1: Singletons. Note that bool is a subclass of int, therefore checked before int.
+    if value is None:
+        chunks.append(b"N")
+    elif value is True or value is False:
+        chunks.append(b"T" if value else b"F")
+
+    # Case 2: Numbers. Integers out of 64-bit range are stored as decimal strings.
+    elif isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            chunks.append(b"i" + I64.pack(value))
+        else:
+            chunks.append(b"I")
+            encode_str(str(value), chunks)
+    elif isinstance(value, float):
+        chunks.append(b"d" + F64.pack(value))
+
+    # Case 3: Strings and paths.
+    elif isinstance(value, str):
+        chunks.append(b"s")
+        encode_str(value, chunks)
+    elif isinstance(value, Path):
+        chunks.append(b"p")
+        encode_str(str(value), chunks)
+
+    # Case 4: Lists and tuples. Lazy sequences loaded from sidecar files are stored as lists.
+    elif isinstance(value, (list, tuple)):
+        encode_sequence(value, chunks)
+    elif isinstance(value, BlobSequence):
+        encode_sequence(list(value), chunks)
+
+    # Case 5: Dictionaries.
+    elif isinstance(value, dict):
+        chunks.append(b"m" + U32.pack(len(value)))
+        for key, item in value.items():
+            encode_item(key, chunks)
+            encode_item(item, chunks)
+
+    else:
+        raise TypeError(f"Object of type {value.__class__.__name__} is not serializable")
+
+
+def encode_sequence(value: list | tuple, chunks: list[bytes]) -> None:
+    """
+    Append the binary expression of the given list or tuple to the chunks.
+    Non-empty lists of strings or paths are packed into a NUL-separated blob.
+    """
+    # Case 1: Packed list of strings or paths.
+    if isinstance(value, list) and value:
+        for (tag, dtype) in ((b"S", str), (b"P", Path)):
+            if all(isinstance(item, dtype) for item in value):
+                blob: bytes = "\0".join(map(str, value)).encode()
+                if blob.count(b"\0") == len(value) - 1:
+                    chunks.append(tag + U32.pack(len(value)) + U32.pack(len(blob)))
+                    chunks.append(blob)
+                    return
+
+    # Case 2: Generic list or tuple.
+    chunks.append((b"l" if isinstance(value, list) else b"t") + U32.pack(len(value)))
+    for item in value:
+        encode_item(item, chunks)
+
+
+class BinaryDecoder:
+    """
+    Decoder of the body of a binary file.
+    """
+    def __init__(self, data: bytes, offset: int) -> None:
+        """
+        Constructor.
+
+        Args:
+            data   (bytes): [IN] Contents of the binary file.
+            offset (int)  : [IN] Offset of the body.
+        """
+        self.data  : bytes = data
+        self.offset: int   = offset
+
+        # Map from type tag to decoding function.
+        self.decoders: dict[int, Callable[[], Any]] = {
+            ord("N"): lambda: None,
+            ord("T"): lambda: True,
+            ord("F"): lambda: False,
+            ord("i"): lambda: self.read_struct(I64),
+            ord("I"): lambda: int(self.read_str()),
+            ord("d"): lambda: self.read_struct(F64),
+            ord("s"): self.read_str,
+            ord("p"): lambda: Path(self.read_str()),
+            ord("l"): lambda: [self.read_item() for _ in range(self.read_struct(U32))],
+            ord("t"): lambda: tuple(self.read_item() for _ in range(self.read_struct(U32))),
+            ord("m"): lambda: {self.read_item(): self.read_item() for _ in range(self.read_struct(U32))},
+            ord("S"): self.read_packed,
+            ord("P"): lambda: list(map(Path, self.read_packed())),
+        }
+
+    def decode_index(self) -> tuple[str, dict[str, Any], dict[str, list[tuple[str, int, int]]]]:
+        """
+        Decode the index block.
+
+        Returns:
+            (tuple): Class name, metadata, and a map from group name to the list of (name, offset, size).
+        """
+        class_name: str = self.read_str()
+
+        metadata: dict[str, Any] = {}
+        for _ in range(self.read_struct(U32)):
+            key: str = self.read_str()
+            metadata[key] = self.read_item()
+
+        entries: dict[str, list[tuple[str, int, int]]] = {}
+        for _ in range(self.read_struct(U32)):
+            group: list[tuple[str, int, int]] = entries.setdefault(self.read_str(), [])
+            for _ in range(self.read_struct(U32)):
+                name: str = self.read_str()
+                group.append((name, self.read_struct(U64), self.read_struct(U64)))
+
+        return (class_name, metadata, entries)
+
+    def read_struct(self, fmt: struct.Struct) -> Any:
+        """
+        Read a number of the given structure.
+        """
+        value: Any = fmt.unpack_from(self.data, self.offset)[0]
+        self.offset += fmt.size
+        return value
+
+    def read_str(self) -> str:
+        """
+        Read a string.
+        """
+        size: int = self.read_struct(U32)
+        self.offset += size
+        return self.data[self.offset-size:self.offset].decode()
+
+    def read_packed(self) -> list[str]:
+        """
+        Read a packed list of strings.
+        """
+        (count, size) = (self.read_struct(U32), self.read_struct(U32))
+        self.offset += size
+        return self.data[self.offset-size:self.offset].decode().split("\0") if count > 0 else []
+
+    def read_item(self) -> Any:
+        """
+        Read a value with a type tag.
+        """
+        tag: int = self.data[self.offset]
+        self.offset += 1
+        return self.decoders[tag]()
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,220 @@
+"""
+yadopt.blob - packed blob of strings or paths, and a lazy sequence backed by the blob.
+
+A blob consists of a fixed-size header, an offsets array, and the concatenated UTF-8 bytes of
+the items. The offsets array has (count + 1) entries, and the i-th item is the bytes between the
+i-th and (i+1)-th offsets. Therefore, a blob on a memory-mapped file can be exposed as a sequence
+in O(1) time, and each item is decoded only when it is accessed.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import mmap
+import os
+import struct
+import sys
+
+# For type hinting.
+from collections.abc import Iterator, Sequence
+from typing          import Any
+
+# Import custom modules.
+from .dtypes import Path
+from .errors import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["BlobSequence", "encode_blob", "write_blob", "is_blob_candidate", "is_blob_file"]
+
+# Magic bytes at the beginning of the blob.
+MAGIC: bytes = b"YADOPTBL"
+
+# Current version of the blob format.
+VERSION: int = 1
+
+# Header structure: magic bytes, format version, item kind, and the number of items.
+HEADER: struct.Struct = struct.Struct("<8sHHQ")
+
+# Item kinds: strings or paths.
+KIND_STR : int = 0
+KIND_PATH: int = 1
+
+
+def is_blob_candidate(value: Any, threshold: int) -> bool:
+    """
+    Returns True if the given value is a list of strings (or a list of paths) whose length is
+    equal to or larger than the threshold.
+    """
+    if not (isinstance(value, (list, BlobSequence)) and len(value) > 0 and len(value) >= threshold):
+        return False
+    return all(isinstance(item, str) for item in value) or all(isinstance(item, Path) for item in value)
+
+
+def is_blob_file(path: str | Path) -> bool:
+    """
+    Returns True if the given file starts with the magic bytes of the blob.
+    """
+    try:
+        with open(path, "rb") as ifp:
+            return ifp.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def encode_blob(items: Sequence[str] | Sequence[Path]) -> list[bytes]:
+    """
+    Encode the given strings or paths as a blob.
+
+    Args:
+        items (Sequence[str] | Sequence[Path]): [IN] Items to be encoded. All items must have the same type.
+
+    Returns:
+        (list[bytes]): Chunks of the blob, that is, the header, the offsets array, and the data.
+    """
+    kind: int = KIND_PATH if (len(items) > 0 and isinstance(items[0], Path)) else KIND_STR
+    datas: list[bytes] = [str(item).encode() for item in items]
+
+    # Compute the offsets array.
+    offsets: list[int] = [0] * (len(datas) + 1)
+    position: int = 0
+    for index, data in enumerate(datas, start=1):
+        position += len(data)
+        offsets[index] = position
+
+    return [HEADER.pack(MAGIC, VERSION, kind, len(datas)), struct.pack(f"<{len(offsets)}Q", *offsets), b"".join(datas)]
+
+
+def write_blob(path: str | Path, items: Sequence[str] | Sequence[Path]) -> None:
+    """
+    Write the given strings or paths to a blob file. The file is replaced atomically, therefore
+    sequences that are memory-mapping the old file are not affected.
+
+    Args:
+        path  (str | Path)                    : [IN] Path to the blob file.
+        items (Sequence[str] | Sequence[Path]): [IN] Items to be written.
+    """
+    path_tmp: str = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(path_tmp, "wb") as ofp:
+            ofp.writelines(encode_blob(items))
+        os.replace(path_tmp, path)
+    finally:
+        if os.path.exists(path_tmp):
+            os.remove(path_tmp)
+
+
+class BlobSequence(Sequence):
+    """
+    Read-only sequence of strings or paths backed by a blob. Items are decoded lazily.
+    This sequence is compared equal to a list of the same items, and converted to a list by
+    `copy.deepcopy`, `pickle`, and `dataclasses.asdict`.
+    """
+    def __init__(self, buffer: Any, owner: Any = None) -> None:
+        """
+        Constructor.
+
+        Args:
+            buffer (Any): [IN] Buffer that contains the blob, for example, mmap or bytes.
+            owner  (Any): [IN] Object that must be kept alive while this sequence is used.
+        """
+        view: memoryview = memoryview(buffer)
+
+        # Validate the header.
+        if len(view) < HEADER.size:
+            raise YadOptError.InvalidBinaryFile(reason="The blob is too short.")
+        (magic, version, kind, count) = HEADER.unpack_from(view, 0)
+        if (magic != MAGIC) or (version != VERSION) or (kind not in (KIND_STR, KIND_PATH)):
+            raise YadOptError.InvalidBinaryFile(reason="Invalid header of the blob.")
+
+        # The offsets array is used without copy. The byte order of the blob is little endian.
+        end_offsets: int = HEADER.size + 8 * (count + 1)
+        if len(view) < end_offsets:
+            raise YadOptError.InvalidBinaryFile(reason="The blob is broken.")
+        offsets: Sequence[int] = view[HEADER.size:end_offsets].cast("Q")
+        if sys.byteorder != "little":
+            offsets = list(struct.unpack_from(f"<{count + 1}Q", view, HEADER.size))
+        if len(view) < end_offsets + offsets[count]:
+            raise YadOptError.InvalidBinaryFile(reason="The blob is broken.")
+
+        self._owner_  : Any             = owner
+        self._buffer_ : Any             = buffer
+        self._kind_   : int             = kind
+        self._count_  : int             = count
+        self._offsets_: Sequence[int]   = offsets
+        self._data_   : memoryview      = view[end_offsets:]
+
+    @classmethod
+    def open(cls, path: str | Path) -> BlobSequence:
+        """
+        Memory-map the given blob file and returns a sequence on it.
+
+        Args:
+            path (str | Path): [IN] Path to the blob file.
+
+        Returns:
+            (BlobSequence): Lazy sequence of the items in the blob file.
+        """
+        with open(path, "rb") as ifp:
+            buffer: mmap.mmap = mmap.mmap(ifp.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of items.
+        """
+        return self._count_
+
+    def __getitem__(self, index: Any) -> Any:
+        """
+        Returns the item at the given index, or a list of items for a slice.
+        """
+        if isinstance(index, slice):
+            return [self.decode(idx) for idx in range(*index.indices(self._count_))]
+        if index < 0:
+            index += self._count_
+        if not 0 <= index < self._count_:
+            raise IndexError("BlobSequence index out of range")
+        return self.decode(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the items.
+        """
+        return (self.decode(index) for index in range(self._count_))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare with a list or another sequence of items.
+        """
+        if isinstance(other, (list, BlobSequence)):
+            return (len(self) == len(other)) and all(lhs == rhs for lhs, rhs in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """
+        Returns string expression of this sequence.
+        """
+        return f"{self.__class__.__name__}(len={self._count_})"
+
+    def __deepcopy__(self, memo: dict) -> list:
+        """
+        Deep copy of this sequence is a list.
+        """
+        return list(self)
+
+    def __reduce__(self) -> tuple:
+        """
+        This sequence is pickled as a list.
+        """
+        return (list, (list(self),))
+
+    def decode(self, index: int) -> Any:
+        """
+        Decode the item at the given index.
+        """
+        text: str = str(self._data_[self._offsets_[index]:self._offsets_[index + 1]], "utf-8")
+        return Path(text) if self._kind_ == KIND_PATH else text
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
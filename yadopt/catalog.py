@@ -0,0 +1,285 @@
+"""
+yadopt.catalog - SQLite-backed catalog of files written by "yadopt.save".
+
+The catalog stores the values of saved files in a key/value table with indexes, so that filter
+queries like "which runs used lr < 1e-3 and model = cnn" are answered without opening the saved
+files. Ingestion is incremental: a file is decoded again only if its (path, mtime, size) changed.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import json
+import os
+import sqlite3
+
+# For type hinting.
+from collections.abc import Iterable
+from typing          import Any
+
+# Import custom modules.
+from .binfmt    import BinaryContents
+from .codec     import decode_value, encode_value
+from .dtypes    import Path
+from .errors    import YadOptError, YadOptErrorBase
+from .serialize import SUFFIXES_ALL, load_contents
+
+# Declare published functions and variables.
+__all__ = ["Catalog"]
+
+# Schema of the catalog database.
+SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id     INTEGER PRIMARY KEY,
+    path       TEXT    NOT NULL UNIQUE,
+    mtime_ns   INTEGER NOT NULL,
+    size       INTEGER NOT NULL,
+    class_name TEXT    NOT NULL,
+    metadata   TEXT    NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vals (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    grp    TEXT    NOT NULL,
+    key    TEXT    NOT NULL,
+    num    REAL,
+    txt    TEXT,
+    raw    TEXT    NOT NULL
+);
+CREATE INDEX IF NOT EXISTS vals_key_num ON vals(key, num);
+CREATE INDEX IF NOT EXISTS vals_key_txt ON vals(key, txt);
+CREATE INDEX IF NOT EXISTS vals_run_id  ON vals(run_id);
+"""
+
+# Operators available in the catalog query.
+OPERATORS: tuple[str, ...] = ("==", "!=", "<", "<=", ">", ">=", "in", "like")
+
+
+class Catalog:
+    """
+    Catalog of files written by "yadopt.save".
+
+    Examples:
+        >>> catalog = Catalog()
+        >>> catalog.ingest(["runs/"])                    # doctest: +SKIP
+        >>> catalog.query(model="cnn", lr=("<", 1.0E-3))  # doctest: +SKIP
+    """
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        """
+        Constructor.
+
+        Args:
+            path (str | Path): [IN] Path to the database file. The catalog is kept in memory if ":memory:".
+        """
+        self.conn: sqlite3.Connection = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        if str(path) != ":memory:":
+            self.conn.execute("PRAGMA journal_mode = WAL")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def __enter__(self) -> Catalog:
+        """
+        Enter the context.
+        """
+        return self
+
+    def __exit__(self, *pargs: Any) -> None:
+        """
+        Close the database when exiting the context.
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Returns the number of files in the catalog.
+        """
+        return self.conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close the database.
+        """
+        self.conn.close()
+
+    def ingest(self, paths: str | Path | Iterable[str | Path], skip_errors: bool = True) -> int:
+        """
+        Add files written by "yadopt.save" to the catalog. Directories are searched recursively.
+        Files whose path, mtime, and size are unchanged since the last ingestion are skipped.
+
+        Args:
+            paths       (str | Path | Iterable[str | Path]): [IN] Files or directories to be ingested.
+            skip_errors (bool)                              : [IN] If True, files that cannot be loaded are skipped.
+
+        Returns:
+            (int): Number of files that were (re)ingested.
+        """
+        # Map from path to (mtime, size) of the files already in the catalog.
+        known: dict[str, tuple[int, int]] = {path: (mtime, size) for (path, mtime, size)
+                                             in self.conn.execute("SELECT path, mtime_ns, size FROM runs")}
+
+        count: int = 0
+        with self.conn:
+            for path in expand_paths(paths):
+
+                # Skip unchanged files.
+                try:
+                    stat: os.stat_result = os.stat(path)
+                except OSError:
+                    continue
+                key: str = os.path.abspath(path)
+                if known.get(key) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+
+                # Load the contents of the file without creating YadOptArgs class.
+                try:
+                    contents: BinaryContents = load_contents(path)
+                except (YadOptErrorBase, OSError, ValueError):
+                    if skip_errors:
+                        continue
+                    raise
+
+                self.insert(key, stat, contents)
+                count += 1
+
+        return count
+
+    def insert(self, key: str, stat: os.stat_result, contents: BinaryContents) -> None:
+        """
+        Insert (or replace) the contents of a file to the catalog.
+
+        Args:
+            key      (str)            : [IN] Absolute path of the file.
+            stat     (os.stat_result) : [IN] Status of the file.
+            contents (BinaryContents) : [IN] Contents of the file.
+        """
+        # Values in the old entry are deleted by the cascade.
+        self.conn.execute("DELETE FROM runs WHERE path = ?", (key,))
+        cursor = self.conn.execute("INSERT INTO runs(path, mtime_ns, size, class_name, metadata) "
+                                   "VALUES (?, ?, ?, ?, ?)",
+                                   (key, stat.st_mtime_ns, stat.st_size, contents.class_name,
+                                    json.dumps(contents.metadata, default=str)))
+
+        self.conn.executemany("INSERT INTO vals(run_id, grp, key, num, txt, raw) VALUES (?, ?, ?, ?, ?, ?)",
+                              [(cursor.lastrowid, group_name, name) + to_columns(contents.values[name])
+                               for group_name, names in contents.groups.items()
+                               for name in names if name in contents.values])
+
+    def prune(self) -> int:
+        """
+        Remove the files that no longer exist from the catalog.
+
+        Returns:
+            (int): Number of removed files.
+        """
+        removed: list[tuple[str]] = [(path,) for (path,) in self.conn.execute("SELECT path FROM runs")
+                                     if not os.path.exists(path)]
+        with self.conn:
+            self.conn.executemany("DELETE FROM runs WHERE path = ?", removed)
+        return len(removed)
+
+    def query(self, **conditions: Any) -> list[Path]:
+        """
+        Returns the paths of the files that satisfy all the given conditions. A condition is either
+        a value for the equality check, or a pair of an operator and a value.
+
+        Args:
+            conditions (Any): [IN] Map from name to condition, for example, `lr=("<", 1.0E-3), model="cnn"`.
+
+        Returns:
+            (list[Path]): Paths of the matched files in the order of ingestion.
+
+        Examples:
+            >>> Catalog().query(lr=("<", 1.0E-3), model="cnn")
+            []
+        """
+        sql: str = "SELECT path FROM runs"
+        params: list[Any] = []
+
+        clauses: list[str] = []
+        for name, cond in conditions.items():
+            (clause, values) = to_where_clause(cond)
+            clauses.append(f"run_id IN (SELECT run_id FROM vals WHERE key = ? AND {clause})")
+            params.extend([name] + values)
+
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+
+        return [Path(path) for (path,) in self.conn.execute(sql + " ORDER BY run_id", params)]
+
+    def values(self, path: str | Path) -> dict[str, Any]:
+        """
+        Returns the values of the given file stored in the catalog without opening the file.
+
+        Args:
+            path (str | Path): [IN] Path to the file.
+
+        Returns:
+            (dict[str, Any]): Map from name to value.
+        """
+        rows = self.conn.execute("SELECT vals.key, vals.raw FROM vals JOIN runs USING (run_id) "
+                                 "WHERE runs.path = ? ORDER BY vals.rowid", (os.path.abspath(path),))
+        return {key: decode_value(json.loads(raw)) for (key, raw) in rows}
+
+
+def expand_paths(paths: str | Path | Iterable[str | Path]) -> Iterable[Path]:
+    """
+    Expand directories into the files with the supported suffixes.
+    """
+    for path in ([paths] if isinstance(paths, (str, Path)) else paths):
+        path = Path(path)
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob("*") if any(p.name.endswith(sfx) for sfx in SUFFIXES_ALL))
+        else:
+            yield path
+
+
+def to_columns(value: Any) -> tuple[float | None, str | None, str]:
+    """
+    Returns the numeric column, the text column, and the raw JSON column of the given value.
+    """
+    raw: str = json.dumps(encode_value(value))
+    if isinstance(value, (bool, int, float)):
+        return (value, None, raw)
+    if isinstance(value, (str, Path)):
+        return (None, str(value), raw)
+    return (None, None, raw)
+
+
+def to_where_clause(cond: Any) -> tuple[str, list[Any]]:
+    """
+    Convert a condition of the catalog query to a SQL expression and its parameters.
+
+    Args:
+        cond (Any): [IN] Value or a pair of an operator and a value.
+
+    Returns:
+        (tuple[str, list[Any]]): SQL expression and parameters.
+    """
+    (op, value) = cond if isinstance(cond, tuple) else ("==", cond)
+
+    if op not in OPERATORS:
+        raise YadOptError.InvalidCatalogQuery(cond=repr(cond))
+
+    # Case 1: Membership test.
+    if op == "in":
+        if not (isinstance(value, (list, tuple, set)) and value):
+            raise YadOptError.InvalidCatalogQuery(cond=repr(cond))
+        clauses: list[tuple[str, list[Any]]] = [to_where_clause(("==", v)) for v in value]
+        return ("(" + " OR ".join(clause for clause, _ in clauses) + ")", [p for _, ps in clauses for p in ps])
+
+    # Case 2: None matches the raw JSON expression.
+    if value is None:
+        if op not in ("==", "!="):
+            raise YadOptError.InvalidCatalogQuery(cond=repr(cond))
+        return (f"raw {'=' if op == '==' else '!='} ?", [json.dumps(encode_value(None))])
+
+    # Case 3: Numbers are compared with the numeric column, and strings with the text column.
+    column: str = "num" if isinstance(value, (bool, int, float)) else "txt"
+    if op == "like":
+        if column != "txt":
+            raise YadOptError.InvalidCatalogQuery(cond=repr(cond))
+        return ("txt LIKE ?", [str(value)])
+
+    return (f"{column} {'=' if op == '==' else op} ?", [value if column == "num" else str(value)])
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,110 @@
+"""
+yadopt.codec - encode and decode values for JSON/TOML serialization.
+"""
+from __future__ import annotations
+
+# For type hinting.
+from typing import Any
+
+# Import custom modules.
+from .blob   import BlobSequence
+from .dtypes import Path
+
+# Declare published functions and variables.
+__all__ = ["encode_value", "decode_value", "encode_canonical"]
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Convert the value to a safer representation for JSON/TOML serialization.
+
+    Args:
+        value (Any): [IN] Value to be encoded.
+
+    Returns:
+        (Any): Encoded value suitable for JSON/TOML serialization.
+    """
+    # Case 1: None value.
+    if value is None:
+        return '"None"'
+
+    # Case 2: Path object.
+    if isinstance(value, Path):
+        return f"Path({value})"
+
+    # Case 3: List of values. Lazy sequences loaded from sidecar files are also encoded as lists.
+    if isinstance(value, (list, BlobSequence)) and len(value) > 0:
+        return [encode_value(v) for v in value]
+
+    # Otherwise, return the value as is.
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    """
+    Convert the encoded value back to its original representation.
+
+    Args:
+        value (Any): [IN] Encoded value.
+
+    Returns:
+        (Any): Decoded value in its original representation.
+    """
+    # Case 1: None value.
+    if value == '"None"':
+        return None
+
+    # Case 2: Path object.
+    if isinstance(value, str) and value.startswith("Path(") and value.endswith(")"):
+        return Path(value[5:-1])
+
+    # Case 3: List of values.
+    if isinstance(value, list) and len(value) > 0:
+        return [decode_value(v) for v in value]
+
+    # Otherwise, return the value as is.
+    return value
+
+
+def encode_canonical(value: Any) -> Any:
+    """
+    Convert the value to a canonical and type-aware representation for fingerprints. The result is
+    JSON serializable, and values of different types never share the same representation, unlike
+    "encode_value" where, for example, None and the string '"None"' are encoded in the same way.
+
+    Args:
+        value (Any): [IN] Value to be encoded.
+
+    Returns:
+        (Any): Canonical representation of the value.
+
+    Examples:
+        >>> [encode_canonical(v) for v in [None, '"None"', 1, 1.0, Path("a"), [Path("a"), Path("b")]]]
+        [None, '"None"', 1, 1.0, {'Path': 'a'}, {'Paths': ['a', 'b']}]
+    """
+    # Case 1: Values that JSON distinguishes natively, that is, None, bool, int, float, and str.
+    if (value is None) or isinstance(value, (bool, int, float, str)):
+        return value
+
+    # Case 2: Path object.
+    if isinstance(value, Path):
+        return {"Path": str(value)}
+
+    # Case 3: List of values. Lists of strings and lists of paths, which can be huge, are encoded without
+    # per-item tags. Lazy sequences loaded from sidecar files are also encoded as lists.
+    if isinstance(value, (list, tuple, BlobSequence)):
+        if value and all(isinstance(v, str) for v in value):
+            return list(value)
+        if value and all(isinstance(v, Path) for v in value):
+            return {"Paths": [str(v) for v in value]}
+        return [encode_canonical(v) for v in value]
+
+    # Case 4: Dictionary. Items are sorted by the string expression of the keys.
+    if isinstance(value, dict):
+        return {"dict": sorted([str(k), encode_canonical(v)] for k, v in value.items())}
+
+    # Otherwise, use the type name and the string expression.
+    return {value.__class__.__name__: repr(value)}
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
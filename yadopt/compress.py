@@ -0,0 +1,81 @@
+"""
+yadopt.compress - open files with streaming compression selected by the file suffix.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import bz2
+import gzip
+import io
+import lzma
+
+# For type hinting.
+from collections.abc import Callable
+from typing          import IO
+
+# Import custom modules.
+from .dtypes import Path
+
+# Declare published functions and variables.
+__all__ = ["open_file", "with_compression", "COMPRESSION_SUFFIXES"]
+
+# Map from suffix to the open function of the compression codec and its keyword of the compression level.
+CODECS: dict[str, tuple[Callable[..., io.BufferedIOBase], str]] = {
+    ".gz" : (gzip.open, "compresslevel"),
+    ".bz2": (bz2.open,  "compresslevel"),
+    ".xz" : (lzma.open, "preset"),
+}
+
+# Supported suffixes of compression codecs. The empty string means no compression.
+COMPRESSION_SUFFIXES: list[str] = [""] + list(CODECS.keys())
+
+# Buffer size of file I/O in bytes.
+BUFFER_SIZE: int = 1 << 20
+
+
+def with_compression(suffixes: list[str]) -> list[str]:
+    """
+    Returns the given suffixes with all supported compression suffixes.
+
+    Args:
+        suffixes (list[str]): [IN] Suffixes of uncompressed files.
+
+    Returns:
+        (list[str]): Suffixes including compressed variants.
+
+    Examples:
+        >>> with_compression([".json"])
+        ['.json', '.json.gz', '.json.bz2', '.json.xz']
+    """
+    return [suffix + suffix_comp for suffix in suffixes for suffix_comp in COMPRESSION_SUFFIXES]
+
+
+def open_file(path: str | Path, mode: str, compresslevel: int | None = None) -> IO:
+    """
+    Open a file with a streaming compression codec selected by the suffix of the file.
+    Both compressed and uncompressed files are buffered with a large buffer.
+
+    Args:
+        path          (str | Path): [IN] Path to the file.
+        mode          (str)       : [IN] Mode, one of "rb", "wb", "rt", and "wt".
+        compresslevel (int | None): [IN] Compression level. The default of each codec is used if None.
+
+    Returns:
+        (IO): File object.
+    """
+    # Case 1: Uncompressed file.
+    if (codec := CODECS.get(Path(path).suffix)) is None:
+        return open(path, mode, buffering=BUFFER_SIZE)  # pylint: disable=consider-using-with,unspecified-encoding
+
+    # Case 2: Compressed file. The compression level is only used for writing.
+    (open_fn, keyword) = codec
+    kwargs: dict[str, int] = {keyword: compresslevel} if (compresslevel is not None and "w" in mode) else {}
+    raw: io.BufferedIOBase = open_fn(path, mode[0] + "b", **kwargs)
+
+    # Wrap the compressed stream with a buffer because the codecs are inefficient with many small writes.
+    buffered: IO = io.BufferedWriter(raw, BUFFER_SIZE) if "w" in mode else io.BufferedReader(raw, BUFFER_SIZE)
+
+    return io.TextIOWrapper(buffered) if "t" in mode else buffered
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
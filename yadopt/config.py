@@ -0,0 +1,188 @@
+"""
+yadopt.config - load config files that provide default values of options.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import hashlib
+import json
+import os
+import threading
+
+# For type hinting.
+from typing import Any
+
+# Import custom modules.
+from .codec    import decode_value
+from .compress import open_file, with_compression
+from .dtypes   import Path
+from .errors   import YadOptError
+from .toml     import load_toml
+
+# Declare published functions and variables.
+__all__ = ["load_config_file", "get_config_defaults", "clear_config_cache"]
+
+# Name of the environment variable that specifies the directory of the on-disk cache.
+CACHE_DIR_ENV_NAME: str = "YADOPT_CACHE_DIR"
+
+# In-process cache of decoded config files, a map from path to (mtime, size, decoded contents).
+CONFIG_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+CONFIG_CACHE_LOCK: threading.Lock = threading.Lock()
+
+
+def load_config_file(path: str | Path) -> dict[str, Any]:
+    """
+    Load a JSON/TOML config file as a dictionary. The decoded contents are cached in this process,
+    and also cached on disk if the environment variable "YADOPT_CACHE_DIR" is set. Both caches are
+    keyed by (path, mtime, size), so unchanged files are never decoded twice.
+
+    Args:
+        path (str | Path): [IN] Path to the config file.
+
+    Returns:
+        (dict[str, Any]): Decoded contents of the config file. Do not modify the returned dictionary.
+    """
+    # Convert the given path as an instance of Path.
+    path_cfg: Path = Path(path) if isinstance(path, str) else path
+
+    # Validate the file format (only checking the suffix).
+    if not any(path_cfg.name.endswith(sfx) for sfx in with_compression([".json", ".toml"])):
+        raise YadOptError.InvalidFileFormat(suffix=path_cfg.suffix)
+
+    # Get the cache key of the config file.
+    try:
+        stat: os.stat_result = os.stat(path_cfg)
+    except OSError as error:
+        raise YadOptError.CannotLoadConfig(path=str(path_cfg)) from error
+    key: str = os.path.abspath(path_cfg)
+
+    # Case 1: Found in the in-process cache.
+    with CONFIG_CACHE_LOCK:
+        if ((cached := CONFIG_CACHE.get(key)) is not None) and (cached[:2] == (stat.st_mtime_ns, stat.st_size)):
+            return cached[2]
+
+    # Case 2: Found in the on-disk cache.
+    path_cache: Path | None = get_disk_cache_path(key)
+    data_dict: dict[str, Any] | None = read_disk_cache(path_cache, stat) if path_cache else None
+
+    # Case 3: Otherwise, decode the config file.
+    if data_dict is None:
+        data_dict = decode_config_file(path_cfg)
+        if path_cache is not None:
+            write_disk_cache(path_cache, stat, data_dict)
+
+    with CONFIG_CACHE_LOCK:
+        CONFIG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, data_dict)
+
+    return data_dict
+
+
+def get_config_defaults(path: str | Path, names: list[str]) -> dict[str, str]:
+    """
+    Returns default values of options written in the given config file. The config file can be
+    a flat table of option values, or a file written by "yadopt.save" where values are grouped.
+
+    Args:
+        path  (str | Path): [IN] Path to the config file.
+        names (list[str]) : [IN] Option names to be extracted.
+
+    Returns:
+        (dict[str, str]): Map from option name to the string expression of the value.
+    """
+    # Map from normalized name to the original option name.
+    names_normalized: dict[str, str] = {name.replace("-", "_").replace(".", "_"): name for name in names}
+
+    # Flatten the groups of the config file.
+    values: dict[str, Any] = {}
+    for key, value in load_config_file(path).items():
+        if isinstance(value, dict) and not (key.startswith("_") and key.endswith("_")):
+            values.update(value)
+        elif not isinstance(value, dict):
+            values[key] = value
+
+    # Convert the values to strings that the type assigner can handle.
+    defaults: dict[str, str] = {}
+    for key, value in values.items():
+        if (name := names_normalized.get(key.replace("-", "_").replace(".", "_"))) is not None:
+            value = decode_value(value)
+            if isinstance(value, list):
+                value = [str(v) if isinstance(v, Path) else v for v in value]
+            defaults[name] = str(value)
+
+    return defaults
+
+
+def clear_config_cache() -> None:
+    """
+    Clear the in-process cache of config files.
+    """
+    with CONFIG_CACHE_LOCK:
+        CONFIG_CACHE.clear()
+
+
+def decode_config_file(path: Path) -> dict[str, Any]:
+    """
+    Decode a JSON/TOML config file.
+
+    Args:
+        path (Path): [IN] Path to the config file.
+
+    Returns:
+        (dict[str, Any]): Decoded contents of the config file.
+    """
+    if any(path.name.endswith(sfx) for sfx in with_compression([".json"])):
+        with open_file(path, "rt") as ifp:
+            data_dict = json.load(ifp)
+    else:
+        with open_file(path, "rb") as ifp:
+            data_dict = load_toml(ifp)
+
+    if not isinstance(data_dict, dict):
+        raise YadOptError.InvalidTomlFile(reason="Top-level config object must be a dictionary.")
+
+    return data_dict
+
+
+def get_disk_cache_path(key: str) -> Path | None:
+    """
+    Returns the path of the on-disk cache for the given key, or None if the on-disk cache is disabled.
+    """
+    if not (cache_dir := os.environ.get(CACHE_DIR_ENV_NAME)):
+        return None
+    return Path(cache_dir) / ("config-" + hashlib.sha1(key.encode()).hexdigest() + ".json")
+
+
+def read_disk_cache(path: Path, stat: os.stat_result) -> dict[str, Any] | None:
+    """
+    Read the on-disk cache. Returns None if the cache does not exist, is broken, or is outdated.
+    The cache is stored in JSON, so a cache file written by others never executes code.
+    """
+    try:
+        with open(path, "rt", encoding="utf-8") as ifp:
+            cached: Any = json.load(ifp)
+    except (OSError, ValueError):
+        return None
+
+    if not (isinstance(cached, dict) and isinstance(cached.get("data"), dict)):
+        return None
+
+    return cached["data"] if [cached.get("mtime"), cached.get("size")] == [stat.st_mtime_ns, stat.st_size] else None
+
+
+def write_disk_cache(path: Path, stat: os.stat_result, data_dict: dict[str, Any]) -> None:
+    """
+    Write the on-disk cache atomically. Failures are ignored because the cache is optional, for
+    example, TOML files with date and time values are not cached because JSON cannot express them.
+    """
+    path_tmp: Path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        text: str = json.dumps({"mtime": stat.st_mtime_ns, "size": stat.st_size, "data": data_dict})
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path_tmp, "wt", encoding="utf-8") as ofp:
+            ofp.write(text)
+        os.replace(path_tmp, path)
+    except (OSError, TypeError, ValueError):
+        path_tmp.unlink(missing_ok=True)
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,126 @@
+"""
+yadopt.coordinate - election of a single writer among processes saving to the same path.
+
+Processes of a distributed job often call "yadopt.save" with the same path and the same arguments.
+A writer is elected by the rank environment variables set by the launcher (e.g. torchrun, Slurm,
+and MPI), or by a lock file next to the destination if no rank is available. If the launcher sets
+the identifier of the job, the lock file records the token of the last publication, that is, the
+fingerprint of the arguments and the job identifier, so that processes of the same job arriving
+after the writer finished do not write the file again.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import contextlib
+import os
+
+# For type hinting.
+from collections.abc import Iterator
+from typing          import Any
+
+# Import custom modules.
+from .datamodel   import YadOptArgs
+from .dtypes      import Path
+from .errors      import YadOptError
+from .fingerprint import fingerprint
+
+# The fcntl module is not available on Windows, where every process writes the file atomically.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+# Declare published functions and variables.
+__all__ = ["elect_writer", "get_rank", "COORDINATE_MODES"]
+
+# Available coordination modes. True means "auto".
+COORDINATE_MODES: tuple[str, ...] = ("auto", "rank", "lock")
+
+# Environment variables of the global rank, in the order of priority.
+RANK_ENV_NAMES: tuple[str, ...] = ("RANK", "SLURM_PROCID", "OMPI_COMM_WORLD_RANK", "PMI_RANK", "PMIX_RANK")
+
+# Environment variables of the job identifier, in the order of priority. YADOPT_JOB_ID is for launchers
+# that export their own per-launch identifier.
+JOB_ENV_NAMES: tuple[str, ...] = ("YADOPT_JOB_ID", "TORCHELASTIC_RUN_ID", "SLURM_JOB_ID", "PBS_JOBID", "LSB_JOBID",
+                                  "JOB_ID")
+
+
+def get_rank() -> int | None:
+    """
+    Returns the global rank of this process set by the launcher, or None if not available.
+
+    Returns:
+        (int | None): Global rank.
+    """
+    for name in RANK_ENV_NAMES:
+        if (value := os.environ.get(name, "").strip()).isdigit():
+            return int(value)
+    return None
+
+
+@contextlib.contextmanager
+def elect_writer(path: Path, mode: bool | str, args: YadOptArgs) -> Iterator[bool]:
+    """
+    Elect the writer of the given path. The context value is True if this process should write
+    the file. In the lock mode, the lock is held until the end of the context, and the token of
+    the publication is recorded if the context exits without an error.
+
+    Args:
+        path (Path)      : [IN] Destination path.
+        mode (bool | str): [IN] Coordination mode, one of "auto" (or True), "rank", and "lock".
+        args (YadOptArgs): [IN] Parsed command line arguments to be saved.
+
+    Returns:
+        (Iterator[bool]): Context that yields True if this process is the writer.
+    """
+    mode = "auto" if mode is True else mode
+    if mode not in COORDINATE_MODES:
+        raise YadOptError.InvalidCoordinateMode(mode=repr(mode))
+
+    # Case 1: The process of rank 0 is the writer. A single process without rank is always the writer.
+    rank: int | None = get_rank()
+    if (mode == "rank") or ((mode == "auto") and (rank is not None)):
+        yield (rank is None) or (rank == 0)
+        return
+
+    # Case 2: Every process is the writer if the lock is not available.
+    if fcntl is None:
+        yield True
+        return
+
+    # Case 3: The process that holds the lock file is the writer, unless the same arguments
+    # were already published in the same job. Without the job identifier, the publication is
+    # never skipped, because separate runs cannot be distinguished from processes of one run.
+    fd: int = os.open(path.with_name(f".{path.name}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+
+        token: bytes = (get_token(args) or "").encode()
+        if token and (os.read(fd, len(token) + 1) == token) and os.path.exists(path):
+            yield False
+            return
+
+        yield True
+
+        # Record the token after the file is published.
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, token, 0)
+
+    finally:
+        os.close(fd)
+
+
+def get_token(args: Any) -> str | None:
+    """
+    Returns the token of a publication, that is, the fingerprint of the arguments and the
+    identifier of the job, or None if the launcher does not set the job identifier.
+    """
+    job: str | None = next((f"{name}={os.environ[name]}" for name in JOB_ENV_NAMES if os.environ.get(name)), None)
+    return None if job is None else f"{fingerprint(args)}:{job}"
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
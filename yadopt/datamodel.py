@@ -5,15 +5,27 @@ from __future__ import annotations
 
 # Import standard libraries.
 import dataclasses
+import functools
+import threading
 
 # For type hinting.
-from typing import Any
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing          import Any
 
 # Import custom modules.
-from .errors import YadOptError
+from .errors   import YadOptError, get_candidate_message
+from .typehint import TypeAssigner
 
 # Declare published functions and variables.
-__all__ = ["YadOptArgs", "make_yadoptargs_data"]
+__all__ = ["YadOptArgs", "make_yadoptargs_data", "replace"]
+
+# Cache of dynamically created classes, a map from schema to class.
+CLASS_CACHE: dict[tuple, type] = {}
+CLASS_CACHE_SIZE: int = 256
+CLASS_CACHE_LOCK: threading.Lock = threading.Lock()
+
+# Key of the instance dictionary that holds the names of the fields filled with the declared default values.
+DEFAULTED_KEY: str = "_yadopt_defaulted_"
 
 
 class YadOptArgs:
@@ -26,9 +38,42 @@ class YadOptArgs:
         Equality comparison for YadOptArgs instances.
         """
         if dataclasses.is_dataclass(self) and dataclasses.is_dataclass(other):
-            return dataclasses.asdict(self) == dataclasses.asdict(other)
+            return dataclasses.asdict(untracked(self)) == dataclasses.asdict(untracked(other))
         return NotImplemented
 
+    def __hash__(self) -> int:
+        """
+        Hash value consistent with the equality comparison. Only frozen instances are hashable,
+        and the hash value is computed only once for each instance.
+        """
+        if (cache := get_instance_cache(self)) is None:
+            raise TypeError(f"unhashable type: '{self.__class__.__name__}'")
+        if (value := cache.get("hash")) is None:
+            source: Any = untracked(self)
+            value = cache["hash"] = hash(frozenset((field.name, to_hashable(getattr(source, field.name)))
+                                                   for field in dataclasses.fields(self)))  # type: ignore[arg-type]
+        return value
+
+    def __replace__(self, **changes: Any) -> YadOptArgs:
+        """
+        Support of "copy.replace" (Python 3.13 or later). See "replace" for details.
+        """
+        return replace(self, **changes)
+
+    def __reduce__(self) -> tuple:
+        """
+        Dynamically created classes cannot be pickled by reference, therefore an instance is pickled
+        as the arguments to create it again, that is, the values, the groups, the base class, and
+        the type functions. The stub class of loaded arguments is pickled by its name.
+        """
+        source: Any = untracked(self)
+        values: dict[str, Any] = {field.name: vars(source)[field.name]
+                                  for field in dataclasses.fields(source)}  # type: ignore[arg-type]
+        base_cls: type = source.__class__.__bases__[0]
+        base: type | str = base_cls.__name__ if vars(base_cls).get("_yadopt_stub_") else base_cls
+        return (unpickle_yadoptargs, (values, getattr(source, "_groups_", {}), base,
+                                      getattr(source, "_converters_", {})))
+
     def __or__(self, other: Any) -> YadOptArgs:
         """
         Merge operation for YadOptArgs instances.
@@ -44,20 +89,55 @@ class YadOptArgs:
         raise NotImplementedError
 
 
-def make_yadoptargs_data(data_dict: dict[str, Any], groups: dict[str, list[str]], base_cls: type) -> Any:
+def make_yadoptargs_data(data_dict: dict[str, Any], groups: dict[str, list[str]], base_cls: type,
+                         converters: dict[str, Callable] | None = None) -> Any:
     """
     Dynamically create a YadOptArgs class with the given fields.
 
     Args:
-        data_dict (dict[str, Any])      : [IN] Dictionary of parsed arguments.
-        groups    (dict[str, list[str]]): [IN] Dictionary of group information.
-        base_cls  (type)                : [IN] Base class for the dynamically created class.
+        data_dict  (dict[str, Any])             : [IN] Dictionary of parsed arguments.
+        groups     (dict[str, list[str]])       : [IN] Dictionary of group information.
+        base_cls   (type)                       : [IN] Base class for the dynamically created class.
+        converters (dict[str, Callable] | None) : [IN] Map from name to the type function used by "replace".
 
     Returns:
         (Any): An instance of the dynamically created dataclass.
     """
-    # Normalize the key names to be valid Python identifiers.
+    # Normalize the key names to be valid Python identifiers. The names in the groups and the type
+    # functions are normalized in the same way, so that they can be used as attribute names.
     data_dict_normalized: dict = {name.replace("-", "_").replace(".", "_"): value for name, value in data_dict.items()}
+    groups = {group: type(names)(name.replace("-", "_").replace(".", "_") for name in names)  # type: ignore[call-arg]
+              for group, names in groups.items()}
+    converters = {name.replace("-", "_").replace(".", "_"): func for name, func in (converters or {}).items()}
+
+    # Key of the class cache. Instances of the same schema share the dynamically created class.
+    fields: tuple[tuple[str, type], ...] = tuple((name, type(value)) for name, value in data_dict_normalized.items())
+    groups_key: tuple = tuple((name, type(names), tuple(names)) for name, names in groups.items())
+
+    return get_yadoptargs_class(base_cls, fields, groups_key, groups, converters)(**data_dict_normalized)
+
+
+def get_yadoptargs_class(base_cls: type, fields: tuple[tuple[str, type], ...], groups_key: tuple,
+                         groups: dict[str, list[str]], converters: dict[str, Callable]) -> type:
+    """
+    Returns a dynamically created YadOptArgs class. The class is cached for each schema, that is,
+    the base class, the field names and types, the groups, and the type functions.
+
+    Args:
+        base_cls   (type)                         : [IN] Base class for the dynamically created class.
+        fields     (tuple[tuple[str, type], ...]) : [IN] Pairs of field name and type.
+        groups_key (tuple)                        : [IN] Hashable expression of the groups.
+        groups     (dict[str, list[str]])         : [IN] Dictionary of group information.
+        converters (dict[str, Callable])          : [IN] Map from name to the type function.
+
+    Returns:
+        (type): Dynamically created YadOptArgs class.
+    """
+    key: tuple = (base_cls, fields, groups_key, tuple(converters.items()))
+
+    with CLASS_CACHE_LOCK:
+        if (cls := CLASS_CACHE.get(key)) is not None:
+            return cls
 
     dynamic_yadopt_args: type = dataclasses.make_dataclass(
 
@@ -68,11 +148,12 @@ def make_yadoptargs_data(data_dict: dict[str, Any], groups: dict[str, list[str]]
         frozen = is_dataclass_frozen(base_cls) or (base_cls is YadOptArgs),
 
         # Create fields of the dataclass.
-        fields = [(name, type(value)) for name, value in data_dict_normalized.items()],
+        fields = list(fields),
 
         # Custom methods for the dynamically created class.
         namespace = {
             "_groups_": groups,
+            "_converters_": converters,
         },
 
         # Set the base class to YadOptArgs to inherit its methods and properties.
@@ -85,7 +166,190 @@ def make_yadoptargs_data(data_dict: dict[str, Any], groups: dict[str, list[str]]
     # Set the module name of the dynamically created class to "yadopt" for better introspection.
     dynamic_yadopt_args.__module__ = "yadopt"
 
-    return dynamic_yadopt_args(**data_dict_normalized)
+    # Register the class to the cache. The oldest class is evicted if the cache is full.
+    with CLASS_CACHE_LOCK:
+        if len(CLASS_CACHE) >= CLASS_CACHE_SIZE:
+            del CLASS_CACHE[next(iter(CLASS_CACHE))]
+        CLASS_CACHE[key] = dynamic_yadopt_args
+
+    return dynamic_yadopt_args
+
+
+@functools.cache
+def get_stub_class(class_name: str) -> type:
+    """
+    Returns the dataclass type to restore the stored class name. The type is cached for each name
+    so that loaded arguments of the same schema share the dynamically created class.
+
+    Args:
+        class_name (str): [IN] Name of the class of the saved YadOptArgs.
+
+    Returns:
+        (type): YadOptArgs or its empty subclass with the given name.
+    """
+    if class_name == YadOptArgs.__name__:
+        return YadOptArgs
+    return dataclasses.make_dataclass(cls_name=class_name, fields=[], eq=False, bases=(YadOptArgs,),
+                                      namespace={"_yadopt_stub_": True})
+
+
+def unpickle_yadoptargs(values: dict[str, Any], groups: dict[str, list[str]], base: type | str,
+                        converters: dict[str, Callable]) -> YadOptArgs:
+    """
+    Restore a pickled YadOptArgs instance (see "YadOptArgs.__reduce__").
+
+    Args:
+        values     (dict[str, Any])      : [IN] Map from name to value.
+        groups     (dict[str, list[str]]): [IN] Dictionary of group information.
+        base       (type | str)          : [IN] Base class, or the name of the stub class.
+        converters (dict[str, Callable]) : [IN] Map from name to the type function.
+
+    Returns:
+        (YadOptArgs): Restored instance.
+    """
+    base_cls: type = get_stub_class(base) if isinstance(base, str) else base
+    return make_yadoptargs_data(values, groups, base_cls, converters)
+
+
+def replace(args: YadOptArgs, **changes: Any) -> YadOptArgs:
+    """
+    Returns a copy of the parsed command line arguments with the given values replaced. Unchanged
+    values are shared with the original instance without copy, and the group information is kept.
+    String values are converted by the same type functions as "yadopt.parse" if available, for
+    example, `replace(args, lr="0.1")` sets the float 0.1 to a "--lr FLT" option.
+
+    Args:
+        args    (YadOptArgs): [IN] Parsed command line arguments.
+        changes (Any)       : [IN] Map from name to new value.
+
+    Returns:
+        (YadOptArgs): Updated parsed command line arguments.
+
+    Notes:
+        This function is not provided as a method because the name "replace" could collide with
+        an option named "--replace".
+    """
+    source: Any = untracked(args)
+    if not (isinstance(source, YadOptArgs) and dataclasses.is_dataclass(source)):
+        raise YadOptError.CannotReplace(cls_name=args.__class__.__name__)
+
+    cls: type = source.__class__
+    names: list[str] = [field.name for field in dataclasses.fields(source)]  # type: ignore[arg-type]
+    converters: dict[str, Callable] = getattr(cls, "_converters_", {})
+
+    # Convert the changed values only.
+    values_new: dict[str, Any] = {}
+    for name, value in changes.items():
+        name = name.replace("-", "_").replace(".", "_")
+        if name not in names:
+            raise YadOptError.UnknownField(name=name, candidate=get_candidate_message(name, names))
+        if (name in converters) and (isinstance(value, str) or is_list_of_str(value)):
+            value = TypeAssigner.convert(converters[name], value)
+        values_new[name] = value
+
+    # Share the unchanged values with the original instance.
+    values: dict[str, Any] = {name: values_new[name] if name in values_new else vars(source)[name] for name in names}
+
+    # Reuse the class if the types of the values are unchanged, otherwise get the class of the new schema.
+    if any(type(value) is not type(vars(source)[name]) for name, value in values_new.items()):
+        fields: tuple[tuple[str, type], ...] = tuple((name, type(value)) for name, value in values.items())
+        groups: dict[str, list[str]] = getattr(cls, "_groups_", {})
+        groups_key: tuple = tuple((group, type(keys), tuple(keys)) for group, keys in groups.items())
+        cls = get_yadoptargs_class(cls.__bases__[0], fields, groups_key, groups, converters)
+
+    # The replaced values are no longer the declared default values.
+    args_new: YadOptArgs = cls(**values)
+    if defaulted := get_defaulted(source):
+        set_defaulted(args_new, defaulted - values_new.keys())
+
+    return args_new
+
+
+def is_list_of_str(value: Any) -> bool:
+    """
+    Returns True if the given value is a non-empty list of strings.
+    """
+    return isinstance(value, list) and (len(value) > 0) and all(isinstance(v, str) for v in value)
+
+
+def get_defaulted(args: Any) -> frozenset[str]:
+    """
+    Returns the names of the fields filled with the declared default values by "yadopt.parse".
+    The set is empty if the instance was not created by "yadopt.parse".
+
+    Args:
+        args (Any): [IN] Instance of YadOptArgs.
+
+    Returns:
+        (frozenset[str]): Names of the defaulted fields.
+    """
+    return getattr(untracked(args), "__dict__", {}).get(DEFAULTED_KEY, frozenset())
+
+
+def set_defaulted(args: Any, names: Iterable[str]) -> None:
+    """
+    Record the names of the fields filled with the declared default values.
+
+    Args:
+        args  (Any)          : [IN] Instance of YadOptArgs.
+        names (Iterable[str]): [IN] Names of the defaulted fields or options.
+    """
+    vars(args)[DEFAULTED_KEY] = frozenset(name.replace("-", "_").replace(".", "_") for name in names)
+
+
+def get_instance_cache(args: Any) -> dict[Hashable, Any] | None:
+    """
+    Returns the cache dictionary of the given instance, for example, for the hash value and the
+    fingerprints. Values of frozen instances never change, so only frozen instances have the cache.
+
+    Args:
+        args (Any): [IN] Instance of YadOptArgs.
+
+    Returns:
+        (dict[Hashable, Any] | None): Cache dictionary, or None if the instance is not frozen.
+    """
+    if not (dataclasses.is_dataclass(args) and getattr(args, "__dataclass_params__").frozen):
+        return None
+    return vars(untracked(args)).setdefault("_yadopt_cache_", {})
+
+
+def untracked(args: Any) -> Any:
+    """
+    Returns the original instance of a tracked instance (see "yadopt.track"), or the given instance
+    as it is. Functions that read all values use the original instance to avoid recording accesses.
+
+    Args:
+        args (Any): [IN] Instance of YadOptArgs.
+
+    Returns:
+        (Any): Original instance.
+    """
+    return getattr(args, "__dict__", {}).get("_yadopt_source_", args)
+
+
+def to_hashable(value: Any) -> Any:
+    """
+    Convert the value to a hashable value. Equal values are converted to values of the same hash.
+
+    Args:
+        value (Any): [IN] Value to be converted.
+
+    Returns:
+        (Any): Hashable value.
+
+    Examples:
+        >>> to_hashable([1, [2, 3], {"a": 4}]) == to_hashable([1.0, (2, 3), {"a": 4}])
+        True
+    """
+    if isinstance(value, (str, bytes)):
+        return value
+    if isinstance(value, dict):
+        return frozenset((key, to_hashable(val)) for key, val in value.items())
+    if isinstance(value, (set, frozenset)):
+        return frozenset(to_hashable(val) for val in value)
+    if isinstance(value, Sequence):
+        return tuple(to_hashable(val) for val in value)
+    return value
 
 
 def merge(lhs: YadOptArgs, rhs: YadOptArgs) -> YadOptArgs:
@@ -114,10 +378,13 @@ def merge(lhs: YadOptArgs, rhs: YadOptArgs) -> YadOptArgs:
             groups_merged.setdefault(key, []).append(value)
 
     # Merge the two YadOptArgs instances by merging their dictionaries.
-    args_dict: dict[str, Any] = dataclasses.asdict(lhs) | dataclasses.asdict(rhs)
+    args_dict: dict[str, Any] = dataclasses.asdict(untracked(lhs)) | dataclasses.asdict(untracked(rhs))
+
+    # Merge the type functions used by "replace" in the same way.
+    converters: dict[str, Callable] = getattr(lhs, "_converters_", {}) | getattr(rhs, "_converters_", {})
 
     # Returns YadOptArgs instance.
-    return make_yadoptargs_data(args_dict, groups_merged, base_cls=YadOptArgs)
+    return make_yadoptargs_data(args_dict, groups_merged, base_cls=YadOptArgs, converters=converters)
 
 
 def is_dataclass_frozen(obj: object) -> bool:
@@ -49,6 +49,12 @@ class ParsedDecls:
     posargs: list[PosArgDecl]   # Positional argument entries.
     optargs: list[OptArgDecl]   # Optional argument entries.
 
+    # Map from environment variable name to option name (computed in __post_init__).
+    env_bindings: dict[str, str] = dataclasses.field(init=False, repr=False, compare=False)
+
+    # Name of the option that specifies a config file of default values (computed in __post_init__).
+    config_option: str | None = dataclasses.field(init=False, repr=False, compare=False)
+
     def __str__(self) -> str:
         text = self.__class__.__name__ + ":\n"
         for idx, item in enumerate(itertools.chain(self.posargs, self.optargs)):
@@ -93,6 +99,22 @@ class ParsedDecls:
             # Update the multiple argument flag.
             has_mult_pos_arg |= pos_arg_decl.spec.is_mult
 
+        # Precompute the map from environment variable name to option name, so that the default value
+        # resolver does not need to scan all option declarations on every parse.
+        env_bindings: dict[str, str] = {}
+        for opt_arg_decl in self.optargs:
+            if opt_arg_decl.desc.env is not None:
+                if opt_arg_decl.desc.env in env_bindings:
+                    raise YadOptError.DuplicatedName(name=opt_arg_decl.desc.env)
+                env_bindings[opt_arg_decl.desc.env] = opt_arg_decl.spec.name
+        object.__setattr__(self, "env_bindings", env_bindings)
+
+        # Find the config file option. At most one config file option is allowed.
+        config_options: list[str] = [decl.spec.name for decl in self.optargs if decl.desc.config]
+        if len(config_options) > 1:
+            raise YadOptError.DuplicatedName(name=config_options[1])
+        object.__setattr__(self, "config_option", config_options[0] if config_options else None)
+
     def validate(self) -> None:
         """
         Run extra validation checks. This function is called only when running tests.
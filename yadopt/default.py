@@ -5,9 +5,11 @@ from __future__ import annotations
 
 # Import standard libraries.
 import dataclasses
+import os
 
 # Import custom modules.
 from .argvec  import ParsedArgVec
+from .config  import get_config_defaults
 from .declaration  import PosArgDecl, OptArgDecl
 
 
@@ -19,6 +21,9 @@ class DefaultResolvedArgVec:
     pos_args: dict[str, str | list[str]]
     opt_args: dict[str, str | None]
 
+    # Names of the options filled with the declared default values.
+    defaulted: frozenset[str] = frozenset()
+
     def __str__(self) -> str:
         text  = self.__class__.__name__ + ":\n"
         text += " |- pos_args = " + str(self.pos_args) + "\n"
@@ -54,21 +59,28 @@ class DefaultValueResolver:
     """
     Resolve default values of options in the argument vector based on the option declarations.
     """
-    def __init__(self, argvec: ParsedArgVec, optargs: list[OptArgDecl], verbose: bool) -> None:
+    def __init__(self, argvec: ParsedArgVec, optargs: list[OptArgDecl], verbose: bool,
+                 env_bindings: dict[str, str] | None = None, config_option: str | None = None) -> None:
         """
         Constructor.
 
         Args:
-            argvec  (ParsedArgVec)     : [IN] Parsed argument vector.
-            optargs (list[OptArgDecl]) : [IN] List of option declarations.
+            argvec        (ParsedArgVec)          : [IN] Parsed argument vector.
+            optargs       (list[OptArgDecl])      : [IN] List of option declarations.
+            verbose       (bool)                  : [IN] Displays verbose messages that are useful for debugging.
+            env_bindings  (dict[str, str] | None) : [IN] Map from environment variable name to option name.
+            config_option (str | None)            : [IN] Name of the option that specifies a config file.
         """
-        self.argvec : ParsedArgVec     = argvec
-        self.optargs: list[OptArgDecl] = optargs
-        self.verbose: bool             = verbose
+        self.argvec       : ParsedArgVec     = argvec
+        self.optargs      : list[OptArgDecl] = optargs
+        self.verbose      : bool             = verbose
+        self.env_bindings : dict[str, str]   = {} if env_bindings is None else env_bindings
+        self.config_option: str | None       = config_option
 
     def resolve(self) -> DefaultResolvedArgVec:
         """
-        Fill default values of options if not specified in the argument vector.
+        Fill default values of options if not specified in the argument vector. The values are resolved
+        in the order of argument vector, environment variables, config file, and default values.
 
         Returns:
             (DefaultResolvedArgVec): Argument vector with default values filled in.
@@ -78,11 +90,71 @@ class DefaultValueResolver:
         for key, value in self.argvec.optargs.items():
             opt_args[key] = value
 
+        for key, value in self.resolve_env().items():
+            if opt_args.get(key, None) is None:
+                opt_args[key] = value
+
+        for key, value in self.resolve_config(opt_args).items():
+            if opt_args.get(key, None) is None:
+                opt_args[key] = value
+
+        defaulted: set[str] = set()
         for opt_arg_decl in self.optargs:
             if opt_args.get(opt_arg_decl.spec.name, None) is None:
                 opt_args[opt_arg_decl.spec.name] = opt_arg_decl.desc.default
+                defaulted.add(opt_arg_decl.spec.name)
+
+        return DefaultResolvedArgVec(pos_args=self.argvec.posargs, opt_args=opt_args, defaulted=frozenset(defaulted))
+
+    def resolve_env(self) -> dict[str, str]:
+        """
+        Returns option values given by the bound environment variables.
+
+        Returns:
+            (dict[str, str]): Map from option name to the value of the environment variable.
+        """
+        if not self.env_bindings:
+            return {}
+
+        # Look up only the variables that are bound to options.
+        environ: dict[str, str] = {env_name: value for env_name in self.env_bindings
+                                   if (value := os.environ.get(env_name)) is not None}
+
+        if self.verbose:
+            print("DefaultValueResolver.resolve_env():")
+            for env_name, value in environ.items():
+                print(f" |- {env_name} = {value}")
+
+        return {self.env_bindings[env_name]: value for env_name, value in environ.items()}
+
+    def resolve_config(self, opt_args: dict[str, str | None]) -> dict[str, str]:
+        """
+        Returns option values given by the config file.
+
+        Args:
+            opt_args (dict[str, str | None]): [IN] Option values given by argument vector and environment variables.
+
+        Returns:
+            (dict[str, str]): Map from option name to the string expression of the value in the config file.
+        """
+        if self.config_option is None:
+            return {}
+
+        # Get the path of the config file. The default value of the config option is also available.
+        path: str | None = opt_args.get(self.config_option)
+        if path is None:
+            path = next(decl.desc.default for decl in self.optargs if decl.spec.name == self.config_option)
+        if path is None or path == "None":
+            return {}
+
+        if self.verbose:
+            print("DefaultValueResolver.resolve_config():")
+            print(f" |- path = {path}")
+
+        # Names of the options that can be given by the config file.
+        names: list[str] = [decl.spec.name for decl in self.optargs if decl.spec.name != self.config_option]
 
-        return DefaultResolvedArgVec(pos_args=self.argvec.posargs, opt_args=opt_args)
+        return get_config_defaults(path, names)
 
 
 # vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
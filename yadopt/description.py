@@ -20,9 +20,11 @@ class ParsedDesc:
     """
     Parsed result of the description part in the declaration line of the docstring.
     """
-    desc   : str         # Description text with type and default value removed.
-    type_dh: str | None  # Data type written in the description head.
-    default: str | None  # Default value if it exists, otherwise None.
+    desc   : str                # Description text with type and default value removed.
+    type_dh: str | None         # Data type written in the description head.
+    default: str | None         # Default value if it exists, otherwise None.
+    env    : str | None = None  # Name of the bound environment variable if it exists, otherwise None.
+    config : bool       = False # True if the option value is a path to a config file of default values.
 
     def __post_init__(self) -> None:
         """
@@ -45,16 +47,24 @@ class DescriptionParser:
     """
     Parser for the description part of the declaration line in the docstring.
     """
-    # Regular expression pattern to extract type description, description text, and default value.
+    # Regular expression pattern to extract type description and description text.
     pattern_desc: re.Pattern = re.compile(r"""^
     \s*                              # Leading whitespace.
     (?:\((\w+)\))?                   # Optional type description in parentheses.
     \s*                              # Optional whitespace after type description.
     (.+?)                            # Description text (non-greedy).
-    (?:\s+\[default:\s*(.+?)\s*\])?  # Optional default value in the format "[default: ...]".
     \s*                              # Trailing whitespace.
     $""", flags=re.VERBOSE)
 
+    # Regular expression pattern to split the contents of a trailing tag like "[default: ...]".
+    pattern_tag: re.Pattern = re.compile(r"^\s*(\w+)\s*(?::\s*(.*?))?\s*$", flags=re.DOTALL)
+
+    # Names of the tags that can be written at the end of the description.
+    tag_names: tuple[str, ...] = ("default", "env", "config")
+
+    # Names of the tags that do not take a value.
+    tag_names_flag: tuple[str, ...] = ("config",)
+
     def __init__(self, docstr: str, span: Span, verbose: bool) -> None:
         """
         Constructor.
@@ -73,9 +83,7 @@ class DescriptionParser:
         Parse the description part of the declaration line.
 
         Returns:
-            description (str)     : Description text with type and default value removed.
-            type_dsc    (str|None): Type description if it exists, otherwise None.
-            default     (str|None): Default value if it exists, otherwise None.
+            (ParsedDesc): Description text, type name, default value, and other tag values.
         """
         # Get the target description text from the original docstring using the given span.
         target: str = self.docstr[self.span[0]:self.span[1]]
@@ -90,21 +98,79 @@ class DescriptionParser:
             print("  |- original description = '" + self.docstr[self.span[0]:self.span[1]] + "'")
             print("  |- joined description = '" + target + "'")
 
-        # Search for the default value in the description.
+        # Split the trailing tags like "[default: ...]", "[env: ...]", and "[config]" from the description.
+        (target, tags) = self.split_tags(target)
+
+        # Search for the type and the description text.
         match: re.Match | None = self.pattern_desc.match(target)
 
-        # If the match is successful, extract the description, type, and default value.
-        if match is not None:
+        # If the match is successful, extract the description, type, and tag values.
+        if match is not None or (tags and not target.strip()):
             return ParsedDesc(
-                desc    = match.group(2).strip() if match.group(2) is not None else "",
-                type_dh = match.group(1)         if match.group(1) is not None else None,
-                default = match.group(3)         if match.group(3) is not None else None,
+                desc    = match.group(2).strip() if match is not None else "",
+                type_dh = match.group(1)         if match is not None else None,
+                default = tags.get("default"),
+                env     = tags.get("env"),
+                config  = "config" in tags,
             )
 
         # If it failed to match, it means something is wrong with the description.
         self.analyze_and_raise()
         raise RuntimeError("Unreachable code reached in DescriptionParser.parse()")
 
+    @staticmethod
+    def split_tags(text: str) -> tuple[str, dict[str, str]]:
+        """
+        Split the trailing tags, for example "[default: 1.0E-3]", from the given description.
+        Brackets inside a tag value are allowed as long as they are balanced.
+
+        Args:
+            text (str): [IN] Description text.
+
+        Returns:
+            text (str)           : Description text with the trailing tags removed.
+            tags (dict[str, str]): Map from tag name to tag value.
+
+        Examples:
+            >>> DescriptionParser.split_tags("Learning rate.  [env: TRAIN_LR]  [default: 1.0E-3]")
+            ('Learning rate.', {'default': '1.0E-3', 'env': 'TRAIN_LR'})
+            >>> DescriptionParser.split_tags("Layer sizes.  [default: [[1, 2], [3]]]")
+            ('Layer sizes.', {'default': '[[1, 2], [3]]'})
+            >>> DescriptionParser.split_tags("Config file.  [config]  [default: None]")
+            ('Config file.', {'default': 'None', 'config': ''})
+            >>> DescriptionParser.split_tags("Input files [optional]")
+            ('Input files [optional]', {})
+        """
+        tags: dict[str, str] = {}
+
+        while (stripped := text.rstrip()).endswith("]"):
+
+            # Find the opening bracket that corresponds to the last closing bracket.
+            (depth, pos_open) = (0, -1)
+            for pos in range(len(stripped) - 1, -1, -1):
+                depth += {"]": 1, "[": -1}.get(stripped[pos], 0)
+                if depth == 0:
+                    pos_open = pos
+                    break
+
+            # Stop if the bracket is not balanced or not separated from the description.
+            if pos_open < 0 or (pos_open > 0 and not stripped[pos_open - 1].isspace()):
+                break
+
+            # Stop if the bracket is not a known tag.
+            match: re.Match | None = DescriptionParser.pattern_tag.match(stripped[pos_open+1:-1])
+            if match is None or match.group(1) not in DescriptionParser.tag_names:
+                break
+
+            # Stop if the existence of the tag value does not match the tag kind.
+            if (match.group(2) is None) != (match.group(1) in DescriptionParser.tag_names_flag):
+                break
+
+            tags.setdefault(match.group(1), "" if match.group(2) is None else match.group(2))
+            text = stripped[:pos_open]
+
+        return (text.rstrip(), tags)
+
     def analyze_and_raise(self) -> None:
         """
         Analyze the erroneous description and raise an error instance.
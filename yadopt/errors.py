@@ -89,6 +89,21 @@ class YadOptErrorBase(Exception):
 # Runtime errors
 #===================================================================================================
 
+class YadOptErrorCannotAttachMemory(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Cannot attach to the shared memory segment.
+
+    <Details>
+        The shared memory segment "{name}" does not exist. The segment was released by
+        "yadopt.release_memory", or the process that created it has exited.
+
+    <Solution>
+        Please keep the process that called "yadopt.share_memory" alive, and call
+        "yadopt.release_memory" after the workers received the arguments.
+    """
+
 class YadOptErrorCannotLoadTomllib(YadOptErrorBase):
     """
     <Error summary>
@@ -107,6 +122,72 @@ class YadOptErrorCannotLoadTomllib(YadOptErrorBase):
         and the "tomllib" otherwise.
     """
 
+class YadOptErrorCannotLoadConfig(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Failed to load the config file.
+
+    <Details>
+        The config file "{path}" given to the config option does not exist or is not readable.
+
+    <Solution>
+        Please check the path of the config file.
+    """
+
+class YadOptErrorCannotWriteJournal(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Failed to write the run journal.
+
+    <Details>
+        The run journal "{path}" cannot be opened or written.
+
+    <Solution>
+        Please check the path of the run journal and the permission of its directory.
+    """
+
+class YadOptErrorCannotSaveInBackground(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Failed to save the arguments in the background.
+
+    <Details>
+        The file "{path}" cannot be saved by the background saver.
+        {reason}
+
+    <Solution>
+        Please check the path of the file and the permission of its directory.
+    """
+
+class YadOptErrorCannotFingerprint(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Invalid fingerprint computation with unexpected data type.
+
+    <Details>
+        The "yadopt.fingerprint" is called on an unexpected type "{cls_name}".
+
+    <Solution>
+        Consider applying "yadopt.fingerprint" to YadOptArgs.
+    """
+
+class YadOptErrorCannotTrack(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Invalid access tracking with unexpected data type.
+
+    <Details>
+        The access tracking is applied to an unexpected type "{cls_name}".
+
+    <Solution>
+        Consider applying "yadopt.track" to YadOptArgs, and "yadopt.accessed" to its result.
+    """
+
 class YadOptErrorCannotGetGroup(YadOptErrorBase):
     """
     <Error summary>
@@ -135,6 +216,19 @@ class YadOptErrorCannotMerge(YadOptErrorBase):
         or converting both to dictionaries and then merging them.
     """
 
+class YadOptErrorCannotReplace(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Invalid replace operation with unexpected data type.
+
+    <Details>
+        The "yadopt.replace" is called on an unexpected type "{cls_name}".
+
+    <Solution>
+        Consider applying "yadopt.replace" to YadOptArgs.
+    """
+
 class YadOptErrorDuplicatedName(YadOptErrorBase):
     """
     <Error summary>
@@ -166,6 +260,20 @@ class YadOptErrorHelpOptionInArgv(YadOptErrorBase):
     """
 
 
+class YadOptErrorInvalidBinaryFile(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Invalid binary data.
+
+    <Details>
+        The given binary data is invalid: {reason}
+
+    <Solution>
+        Please check that the file or the environment variable was written by the same version
+        of YadOpt, and that it is not truncated.
+    """
+
 class YadOptErrorInvalidBoolValue(YadOptErrorBase):
     """
     <Error summary>
@@ -180,6 +288,35 @@ class YadOptErrorInvalidBoolValue(YadOptErrorBase):
         Please specify a valid boolean value.
     """
 
+class YadOptErrorInvalidCatalogQuery(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Invalid catalog query.
+
+    <Details>
+        The condition "{cond}" of the catalog query is invalid. A condition is either a value
+        for the equality check, or a pair of an operator and a value, where the operator is one of
+        "==", "!=", "<", "<=", ">", ">=", "in", and "like".
+
+    <Solution>
+        Please specify a valid condition, for example, `catalog.query(lr=("<", 1.0E-3))`.
+    """
+
+class YadOptErrorInvalidCoordinateMode(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Invalid coordination mode of the save function.
+
+    <Details>
+        The coordination mode {mode} is invalid. Acceptable values are
+        False, True, "auto", "rank", and "lock".
+
+    <Solution>
+        Please specify a valid coordination mode.
+    """
+
 class YadOptErrorInvalidFileFormat(YadOptErrorBase):
     """
     <Error summary>
@@ -208,6 +345,20 @@ class YadOptErrorInvalidHelpOption(YadOptErrorBase):
         a value, or simply do not explicitly declare the "--help" option.
     """
 
+class YadOptErrorInvalidMetadataTier(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}
+        Invalid metadata tier.
+
+    <Details>
+        The metadata tier or the cost class "{tier}" is invalid. Acceptable values are
+        True, False, "cheap", "expensive", or a list of metadata field names.
+
+    <Solution>
+        Please specify a valid metadata tier.
+    """
+
 class YadOptErrorInvalidSourceType(YadOptErrorBase):
     """
     <Error summary>
@@ -286,6 +437,19 @@ class YadOptErrorTooManyArgument(YadOptErrorBase):
         Please remove the above extra positional arguments from the user input.
     """
 
+class YadOptErrorUnknownField(YadOptErrorBase):
+    """
+    <Error summary>
+        {loc_info}: Unknown field name was given to "yadopt.replace".
+
+    <Details>
+        The parsed arguments do not have the field "{name}".
+
+    <Solution>
+        Please check the field name "{name}" for typos.
+        {candidate}
+    """
+
 class YadOptErrorUnknownOption(YadOptErrorBase):
     """
     <Error summary>
@@ -505,21 +669,33 @@ class YadOptError:
     General Error class for YadOpt.
     """
     # Runtime errors.
-    CannotLoadTomllib = YadOptErrorCannotLoadTomllib
-    CannotGetGroup    = YadOptErrorCannotGetGroup
-    CannotMerge       = YadOptErrorCannotMerge
-    DuplicatedName    = YadOptErrorDuplicatedName
-    HelpOptionInArgv  = YadOptErrorHelpOptionInArgv
-    InvalidBoolValue  = YadOptErrorInvalidBoolValue
-    InvalidFileFormat = YadOptErrorInvalidFileFormat
-    InvalidHelpOption = YadOptErrorInvalidHelpOption
-    InvalidSourceType = YadOptErrorInvalidSourceType
-    InvalidTomlFile   = YadOptErrorInvalidTomlFile
-    InvalidTypeName   = YadOptErrorInvalidTypeName
-    MissingArgument   = YadOptErrorMissingArgument
-    NoOptionValue     = YadOptErrorNoOptionValue
-    TooManyArgument   = YadOptErrorTooManyArgument
-    UnknownOption     = YadOptErrorUnknownOption
+    CannotAttachMemory     = YadOptErrorCannotAttachMemory
+    CannotLoadTomllib      = YadOptErrorCannotLoadTomllib
+    CannotLoadConfig       = YadOptErrorCannotLoadConfig
+    CannotWriteJournal     = YadOptErrorCannotWriteJournal
+    CannotSaveInBackground = YadOptErrorCannotSaveInBackground
+    CannotFingerprint      = YadOptErrorCannotFingerprint
+    CannotGetGroup         = YadOptErrorCannotGetGroup
+    CannotTrack            = YadOptErrorCannotTrack
+    CannotMerge            = YadOptErrorCannotMerge
+    CannotReplace          = YadOptErrorCannotReplace
+    DuplicatedName         = YadOptErrorDuplicatedName
+    HelpOptionInArgv       = YadOptErrorHelpOptionInArgv
+    InvalidBinaryFile      = YadOptErrorInvalidBinaryFile
+    InvalidBoolValue       = YadOptErrorInvalidBoolValue
+    InvalidCatalogQuery    = YadOptErrorInvalidCatalogQuery
+    InvalidCoordinateMode  = YadOptErrorInvalidCoordinateMode
+    InvalidFileFormat      = YadOptErrorInvalidFileFormat
+    InvalidHelpOption      = YadOptErrorInvalidHelpOption
+    InvalidMetadataTier    = YadOptErrorInvalidMetadataTier
+    InvalidSourceType      = YadOptErrorInvalidSourceType
+    InvalidTomlFile        = YadOptErrorInvalidTomlFile
+    InvalidTypeName        = YadOptErrorInvalidTypeName
+    MissingArgument        = YadOptErrorMissingArgument
+    NoOptionValue          = YadOptErrorNoOptionValue
+    TooManyArgument        = YadOptErrorTooManyArgument
+    UnknownField           = YadOptErrorUnknownField
+    UnknownOption          = YadOptErrorUnknownOption
 
     # Errors on analysis phase (positional argument declaration).
     ExtraArgsInPosArgDecl       = YadOptErrorExtraArgsInPosArgDecl
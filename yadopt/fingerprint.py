@@ -0,0 +1,193 @@
+"""
+yadopt.fingerprint - stable fingerprints of parsed command line arguments.
+
+A fingerprint is the SHA-256 digest of the canonical encoding of the values (see
+"yadopt.codec.encode_canonical"), where the values are sorted by name. Therefore, the fingerprint
+does not depend on the process, the order of the declarations, or the file format the arguments
+were restored from, and distinguishes the types of the values, for example, a Path and a string.
+
+Fingerprints of groups and values are cached on frozen instances. Therefore, "diff" compares the
+group fingerprints first, and looks into the values only in the changed groups.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import dataclasses
+import hashlib
+import json
+
+# For type hinting.
+from collections.abc import Collection, Hashable
+from typing          import Any
+
+# Import custom modules.
+from .codec     import encode_canonical
+from .datamodel import YadOptArgs, get_instance_cache, untracked
+from .errors    import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["fingerprint", "group_fingerprints", "diff", "ArgsDiff"]
+
+
+def fingerprint(args: YadOptArgs, groups: Collection[str] | None = None, exclude: Collection[str] = (),
+                keys: Collection[str] | None = None) -> str:
+    """
+    Returns a stable fingerprint of the parsed command line arguments, for example, as a cache key.
+    The fingerprint of a frozen instance is computed only once for each combination of the groups
+    and the names, so the values must not be modified in place.
+
+    Args:
+        args    (YadOptArgs)             : [IN] Parsed command line arguments.
+        groups  (Collection[str] | None) : [IN] Groups to be included. All values are included if None.
+        exclude (Collection[str])        : [IN] Names to be excluded, for example, output directories.
+        keys    (Collection[str] | None) : [IN] Names to be included, for example, the names returned by
+                                                "yadopt.accessed". All names are included if None.
+
+    Returns:
+        (str): Hexadecimal SHA-256 digest.
+    """
+    validate_args(args)
+
+    # Reading values for the fingerprint is not an access to be tracked.
+    args = untracked(args)
+
+    # Normalize the names in the same way as the field names.
+    excluded: frozenset[str] = frozenset(name.replace("-", "_").replace(".", "_") for name in exclude)
+    included: frozenset[str] | None = None
+    if keys is not None:
+        included = frozenset(name.replace("-", "_").replace(".", "_") for name in keys)
+
+    # Returns the cached fingerprint if available.
+    cache: dict[Hashable, Any] | None = get_instance_cache(args)
+    key: tuple = ("fingerprint", None if groups is None else tuple(groups), excluded, included)
+    if (cache is not None) and (key in cache):
+        return cache[key]
+
+    # Select the names to be included.
+    names: list[str] = [name for name in get_names(args, groups) if (included is None) or (name in included)]
+
+    # Encode the values sorted by the names, and compute the digest.
+    payload: list[Any] = [[name, encode_canonical(getattr(args, name))] for name in sorted(set(names) - excluded)]
+    digest: str = get_digest(payload)
+
+    if cache is not None:
+        cache[key] = digest
+
+    return digest
+
+
+def group_fingerprints(args: YadOptArgs) -> dict[str, str]:
+    """
+    Returns the fingerprints of all groups of the parsed command line arguments.
+
+    Args:
+        args (YadOptArgs): [IN] Parsed command line arguments.
+
+    Returns:
+        (dict[str, str]): Map from group name to the fingerprint of the group.
+    """
+    validate_args(args)
+    return {group: fingerprint(args, groups=[group]) for group in getattr(args, "_groups_", {})}
+
+
+@dataclasses.dataclass
+class ArgsDiff:
+    """
+    Differences between two parsed command line arguments.
+    """
+    groups : list[str]  # Names of the changed groups.
+    added  : list[str]  # Names that exist only in the new arguments.
+    removed: list[str]  # Names that exist only in the old arguments.
+    changed: list[str]  # Names whose values are changed.
+
+    def __bool__(self) -> bool:
+        """
+        Returns True if there is any difference.
+        """
+        return bool(self.groups or self.added or self.removed or self.changed)
+
+
+def diff(old: YadOptArgs, new: YadOptArgs) -> ArgsDiff:
+    """
+    Returns the groups and the names that differ between two parsed command line arguments.
+    Group fingerprints are compared first, and values are compared only in the changed groups.
+    Since fingerprints are cached on the instances, comparing an instance repeatedly costs time
+    proportional to the number of groups and changed values.
+
+    Args:
+        old (YadOptArgs): [IN] Old parsed command line arguments, for example, restored by "yadopt.load".
+        new (YadOptArgs): [IN] New parsed command line arguments.
+
+    Returns:
+        (ArgsDiff): Changed groups, and added, removed, and changed names.
+    """
+    # Reading values for the comparison is not an access to be tracked.
+    (old, new) = (untracked(old), untracked(new))
+
+    (fps_old, fps_new) = (group_fingerprints(old), group_fingerprints(new))
+
+    # Find the changed groups, including the groups that exist on only one side.
+    groups: list[str] = [group for group in dict.fromkeys([*fps_old, *fps_new])
+                         if fps_old.get(group) != fps_new.get(group)]
+
+    # Compare the values in the changed groups only.
+    added  : list[str] = []
+    removed: list[str] = []
+    changed: list[str] = []
+    for name in dict.fromkeys(name for group in groups for args in (old, new)
+                              for name in getattr(args, "_groups_", {}).get(group, [])):
+        (exist_old, exist_new) = (hasattr(old, name), hasattr(new, name))
+        if exist_new and not exist_old:
+            added.append(name)
+        elif exist_old and not exist_new:
+            removed.append(name)
+        elif exist_old and exist_new and (get_value_digest(old, name) != get_value_digest(new, name)):
+            changed.append(name)
+
+    return ArgsDiff(groups, added, removed, changed)
+
+
+def get_value_digest(args: YadOptArgs, name: str) -> str:
+    """
+    Returns the digest of the canonical encoding of the value. The digest is cached on frozen instances.
+    """
+    args = untracked(args)
+    cache: dict[Hashable, Any] | None = get_instance_cache(args)
+    key: tuple = ("value", name)
+    if (cache is not None) and (key in cache):
+        return cache[key]
+
+    digest: str = get_digest(encode_canonical(getattr(args, name)))
+
+    if cache is not None:
+        cache[key] = digest
+
+    return digest
+
+
+def get_digest(payload: Any) -> str:
+    """
+    Returns the hexadecimal SHA-256 digest of the JSON expression of the given canonical encoding.
+    """
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()).hexdigest()
+
+
+def validate_args(args: Any) -> None:
+    """
+    Raise an error if the given object is not an instance of YadOptArgs.
+    """
+    if not (isinstance(args, YadOptArgs) and dataclasses.is_dataclass(args)):
+        raise YadOptError.CannotFingerprint(cls_name=args.__class__.__name__)
+
+
+def get_names(args: YadOptArgs, groups: Collection[str] | None) -> list[str]:
+    """
+    Returns the names of the fields in the given groups, or all fields if groups is None.
+    """
+    if groups is None:
+        return [field.name for field in dataclasses.fields(args)]  # type: ignore[arg-type]
+    groups_dict: dict[str, list[str]] = getattr(args, "_groups_", {})
+    return [name for group in groups for name in groups_dict.get(group, []) if hasattr(args, name)]
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,227 @@
+"""
+yadopt.handoff - hand over parsed command line arguments to child processes via the environment.
+
+A launcher parses the command line once and exports the result to the environment variable
+"YADOPT_HANDOFF". Child processes, for example ranks started by a distributed launcher or workers
+started by the "spawn" method of multiprocessing, restore the result without parsing the docstring
+and the argument vector. The value of the variable consists of a format tag, a key, and a payload:
+
+    v1:<key>:b64:<base64 of zlib-compressed binary format>
+    v1:<key>:file:<path to a temporary file in the binary format>
+
+The key is a hash of the docstring and the argument vector given to "yadopt.parse". Therefore,
+"yadopt.parse" in a child process returns the handed over result only if it is called with the
+same docstring and the same argument vector as the launcher.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import atexit
+import base64
+import binascii
+import functools
+import hashlib
+import io
+import os
+import tempfile
+import zlib
+
+# For type hinting.
+from collections.abc import Mapping, MutableMapping
+from typing          import Any
+
+# Import custom modules.
+from .binfmt    import BinaryContents, dump_binary, load_binary
+from .datamodel import YadOptArgs, get_defaulted, get_stub_class, make_yadoptargs_data, set_defaulted, untracked
+from .errors    import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["export_env", "from_env", "parse_from_env", "set_handoff_source", "HANDOFF_ENV_NAME"]
+
+# Name of the environment variable that holds the handed over arguments.
+HANDOFF_ENV_NAME: str = "YADOPT_HANDOFF"
+
+# Tag of the current format of the environment variable.
+HANDOFF_VERSION: str = "v1"
+
+# Maximum size of the inline payload in bytes. Larger payloads are written to a temporary file
+# because the size of one environment variable is limited (128 KiB on Linux).
+HANDOFF_INLINE_MAX: int = 32 * 1024
+
+# Key of the metadata that holds the names of the fields filled with the declared default values.
+DEFAULTED_META_KEY: str = "defaulted"
+
+# Key of the instance dictionary that holds the docstring and the argument vector given to "yadopt.parse".
+SOURCE_KEY: str = "_yadopt_handoff_"
+
+
+def export_env(args: YadOptArgs, env: MutableMapping[str, str] | None = None,
+               inline_max: int | None = None) -> str:
+    """
+    Export the parsed command line arguments to the environment variable "YADOPT_HANDOFF", so that
+    child processes started after this call can restore them by "yadopt.from_env", and "yadopt.parse"
+    in the child processes returns them without parsing. Temporary files are removed at exit.
+
+    Args:
+        args       (YadOptArgs)                    : [IN] Parsed command line arguments.
+        env        (MutableMapping[str, str] | None): [IN] Environment to be updated. os.environ is used if None.
+        inline_max (int | None)                    : [IN] Maximum size of the inline payload in bytes.
+                                                          HANDOFF_INLINE_MAX is used if None.
+
+    Returns:
+        (str): Value of the environment variable.
+    """
+    source: Any = untracked(args)
+    if not isinstance(source, YadOptArgs):
+        raise YadOptError.InvalidSourceType(source_type=args.__class__.__name__)
+
+    # Encode the values in the binary format. The metadata holds the names of the defaulted fields only.
+    groups: dict[str, list[str]] = getattr(source, "_groups_", {})
+    values: dict[str, Any] = {name: getattr(source, name) for names in groups.values()
+                                                            for name in names if hasattr(source, name)}
+    metadata: dict[str, Any] = {DEFAULTED_META_KEY: sorted(get_defaulted(source))}
+    buffer: io.BytesIO = io.BytesIO()
+    dump_binary(BinaryContents(source.__class__.__name__, metadata, groups, values), buffer)
+    data: bytes = buffer.getvalue()
+
+    # The key is empty if the arguments were not created by "yadopt.parse".
+    key: str = get_handoff_key(*vars(source)[SOURCE_KEY]) if SOURCE_KEY in vars(source) else ""
+
+    # Case 1: Small payload is stored in the environment variable itself.
+    payload: str = base64.b64encode(zlib.compress(data)).decode()
+    if len(payload) <= (HANDOFF_INLINE_MAX if inline_max is None else inline_max):
+        value: str = f"{HANDOFF_VERSION}:{key}:b64:{payload}"
+
+    # Case 2: Large payload is written to a temporary file that is removed when this process exits.
+    else:
+        (fd, path) = tempfile.mkstemp(prefix="yadopt_handoff_", suffix=".yadopt")
+        with os.fdopen(fd, "wb") as ofp:
+            ofp.write(data)
+        atexit.register(remove_handoff_file, path, os.getpid())
+        value = f"{HANDOFF_VERSION}:{key}:file:{path}"
+
+    (os.environ if env is None else env)[HANDOFF_ENV_NAME] = value
+
+    return value
+
+
+def from_env(env: Mapping[str, str] | None = None) -> YadOptArgs | None:
+    """
+    Restore the parsed command line arguments exported by "yadopt.export_env".
+
+    Args:
+        env (Mapping[str, str] | None): [IN] Environment to be read. os.environ is used if None.
+
+    Returns:
+        (YadOptArgs | None): Restored parsed command line arguments, or None if nothing is handed over.
+    """
+    if not (value := (os.environ if env is None else env).get(HANDOFF_ENV_NAME)):
+        return None
+
+    contents: BinaryContents = load_binary(io.BytesIO(read_handoff(value)))
+    args: YadOptArgs = make_yadoptargs_data(contents.values, contents.groups, get_stub_class(contents.class_name))
+    set_defaulted(args, contents.metadata.get(DEFAULTED_META_KEY, []))
+
+    return args
+
+
+def parse_from_env(docstr: str, argv: list[str], base_cls: type) -> YadOptArgs | None:
+    """
+    Returns the handed over arguments if they were parsed from the same docstring and argument
+    vector in the launcher. This function is called by "yadopt.parse".
+
+    Args:
+        docstr   (str)      : [IN] Dedented docstring.
+        argv     (list[str]): [IN] Argument vector.
+        base_cls (type)     : [IN] Base class for the dynamically created class.
+
+    Returns:
+        (YadOptArgs | None): Handed over arguments, or None if "yadopt.parse" should parse the arguments.
+    """
+    if not (value := os.environ.get(HANDOFF_ENV_NAME)):
+        return None
+
+    # Compare the key before decoding the payload.
+    fields: list[str] = value.split(":", 3)
+    if (len(fields) != 4) or (fields[0] != HANDOFF_VERSION) or (fields[1] != get_handoff_key(docstr, argv)):
+        return None
+
+    # Parse the arguments as usual if the temporary file is already removed, or the payload is broken.
+    # A stale or broken environment variable must never make a valid command line fail.
+    try:
+        contents: BinaryContents = load_binary(io.BytesIO(read_handoff(value)))
+    except (OSError, YadOptError.InvalidBinaryFile):
+        return None
+
+    args: YadOptArgs = make_yadoptargs_data(contents.values, contents.groups, base_cls)
+    set_handoff_source(args, docstr, argv)
+    set_defaulted(args, contents.metadata.get(DEFAULTED_META_KEY, []))
+
+    return args
+
+
+def set_handoff_source(args: YadOptArgs, docstr: str, argv: list[str]) -> None:
+    """
+    Record the docstring and the argument vector of the parsed arguments for "yadopt.export_env".
+    The key is computed only when the arguments are exported.
+
+    Args:
+        args   (YadOptArgs): [IN] Parsed command line arguments.
+        docstr (str)       : [IN] Dedented docstring.
+        argv   (list[str]) : [IN] Argument vector.
+    """
+    vars(args)[SOURCE_KEY] = (docstr, tuple(argv))
+
+
+def get_handoff_key(docstr: str, argv: tuple[str, ...] | list[str]) -> str:
+    """
+    Returns the key of the given docstring and argument vector.
+    """
+    digest: Any = hashlib.sha256(docstr.encode("utf-8", "surrogateescape"))
+    for arg in argv:
+        digest.update(b"\x00" + arg.encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def read_handoff(value: str) -> bytes:
+    """
+    Returns the binary format data of the handed over arguments. The data is cached because every
+    call of "yadopt.parse" and "yadopt.from_env" in a process reads the same value, while the values
+    are decoded for each call so that the returned instances never share mutable lists.
+
+    Args:
+        value (str): [IN] Value of the environment variable.
+
+    Returns:
+        (bytes): Data in the binary format.
+    """
+    fields: list[str] = value.split(":", 3)
+    if (len(fields) != 4) or (fields[0] != HANDOFF_VERSION) or (fields[2] not in ("b64", "file")):
+        raise YadOptError.InvalidBinaryFile(reason=f"Invalid value of the environment variable {HANDOFF_ENV_NAME}.")
+
+    # Case 1: Inline payload.
+    if fields[2] == "b64":
+        try:
+            return zlib.decompress(base64.b64decode(fields[3], validate=True))
+        except (binascii.Error, zlib.error) as error:
+            raise YadOptError.InvalidBinaryFile(reason="The handed over arguments are broken.") from error
+
+    # Case 2: Temporary file.
+    with open(fields[3], "rb") as ifp:
+        return ifp.read()
+
+
+def remove_handoff_file(path: str, pid: int) -> None:
+    """
+    Remove the temporary file of the handed over arguments. Forked child processes inherit the
+    exit handler, so the file is removed only by the process that created it.
+    """
+    if os.getpid() == pid:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,219 @@
+"""
+yadopt.journal - append-only run journal of parsed command line arguments.
+
+The run journal is a JSON Lines file where each line records one parsed invocation. A record has
+the same structure as a JSON file written by "yadopt.save", that is, groups of encoded values,
+the dataclass information, and the cheap metadata. Each record is appended by a single "write"
+system call on a file descriptor opened with O_APPEND, therefore records written by concurrent
+processes are never interleaved on local file systems.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import contextlib
+import glob
+import json
+import os
+import warnings
+
+# For type hinting.
+from collections.abc import Iterator
+from typing          import Any
+
+# Import custom modules.
+from .codec     import encode_value
+from .datamodel import YadOptArgs, untracked
+from .dtypes    import Path
+from .errors    import YadOptError, YadOptErrorBase
+from .metadata  import get_metadata
+
+# The fcntl module is not available on Windows, where the rotation is not serialized.
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # type: ignore[assignment]
+
+# Declare published functions and variables.
+__all__ = ["append_journal", "read_journal", "journal_from_env", "JOURNAL_MAX_BYTES", "JOURNAL_BACKUPS"]
+
+# Name of the environment variable that enables the run journal. The value is the path of the journal.
+JOURNAL_ENV_NAME: str = "YADOPT_JOURNAL"
+
+# Default maximum size of a journal file in bytes. The journal is rotated when it exceeds this size.
+JOURNAL_MAX_BYTES: int = 64 * 1024 * 1024
+
+# Default number of rotated journal files to be kept.
+JOURNAL_BACKUPS: int = 5
+
+
+def append_journal(path: str | Path, args: YadOptArgs, metadata: bool | str | list[str] = "cheap",
+                   max_bytes: int | None = None, backups: int | None = None) -> None:
+    """
+    Append the parsed command line arguments to the run journal as one JSON line.
+
+    Args:
+        path      (str | Path)            : [IN] Path to the journal file.
+        args      (YadOptArgs)            : [IN] Parsed command line arguments to be recorded.
+        metadata  (bool | str | list[str]): [IN] Metadata tier or field names (see "yadopt.save" for details).
+        max_bytes (int | None)            : [IN] Maximum size of the journal file. JOURNAL_MAX_BYTES is used if None,
+                                                 and 0 disables the rotation.
+        backups   (int | None)            : [IN] Number of rotated files to be kept. JOURNAL_BACKUPS is used if None.
+    """
+    # Convert the given path as an instance of Path.
+    path_jnl: Path = Path(path) if isinstance(path, str) else path
+
+    # Generate one line of the journal. The line is written by one system call, so it is encoded beforehand.
+    line: bytes = (json.dumps(generate_record(untracked(args), metadata), separators=(",", ":")) + "\n").encode()
+
+    try:
+        fd: int = open_journal(path_jnl, len(line), JOURNAL_MAX_BYTES if max_bytes is None else max_bytes,
+                               JOURNAL_BACKUPS if backups is None else backups)
+        try:
+            view: memoryview = memoryview(line)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    except OSError as error:
+        raise YadOptError.CannotWriteJournal(path=str(path_jnl)) from error
+
+
+def read_journal(path: str | Path, rotated: bool = True) -> Iterator[dict[str, Any]]:
+    """
+    Read records of the run journal lazily from the oldest one.
+
+    Args:
+        path    (str | Path): [IN] Path to the journal file.
+        rotated (bool)      : [IN] If True, records in the rotated files are also read.
+
+    Returns:
+        (Iterator[dict[str, Any]]): Iterator of records. Broken lines, for example, a line being
+                                    written by another process, are skipped.
+    """
+    # Convert the given path as an instance of Path.
+    path_jnl: Path = Path(path) if isinstance(path, str) else path
+
+    # List the journal files from the oldest one.
+    paths: list[Path] = [path_jnl]
+    if rotated:
+        backups: list[tuple[int, Path]] = [(int(p.name[len(path_jnl.name)+1:]), p)
+                                           for p in path_jnl.parent.glob(f"{glob.escape(path_jnl.name)}.*")
+                                           if p.name[len(path_jnl.name)+1:].isdigit()]
+        paths = [p for _, p in sorted(backups, reverse=True)] + paths
+
+    for path_file in paths:
+        try:
+            ifp = open(path_file, "rb")
+        except FileNotFoundError:
+            continue
+        with ifp:
+            for line in ifp:
+                try:
+                    record: Any = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+
+def journal_from_env(args: YadOptArgs) -> None:
+    """
+    Append the parsed command line arguments to the run journal if the environment variable
+    "YADOPT_JOURNAL" is set. This function is called by "yadopt.parse". The journal is best-effort,
+    that is, a failure of writing the journal is reported as a warning and never fails the parsing.
+
+    Args:
+        args (YadOptArgs): [IN] Parsed command line arguments.
+    """
+    if path := os.environ.get(JOURNAL_ENV_NAME):
+        try:
+            append_journal(path, args)
+        except (YadOptErrorBase, OSError) as error:
+            warnings.warn(f"yadopt: failed to append the run journal: {error}", RuntimeWarning, stacklevel=3)
+
+
+def generate_record(args: YadOptArgs, metadata: bool | str | list[str]) -> dict[str, Any]:
+    """
+    Generate a record of the run journal.
+    """
+    # Get the groups dictionary from the YadOptArgs instance.
+    groups: dict[str, list[str]] = getattr(args, "_groups_", {})
+
+    # Encode values in the same way as "yadopt.save".
+    record: dict[str, Any] = {group_name: {name: encode_value(getattr(args, name))
+                                           for name in names if hasattr(args, name)}
+                              for group_name, names in groups.items()}
+
+    # Add dataclass information and metadata.
+    record["_YADOPT_DATACLASS_INFO_"] = {"class_name": args.__class__.__name__}
+    record["_YADOPT_METADATA_"] = get_metadata(metadata)
+
+    return record
+
+
+def open_journal(path: Path, size: int, max_bytes: int, backups: int) -> int:
+    """
+    Open the journal file in the append mode, and rotate it if the next record exceeds the maximum size.
+
+    Args:
+        path      (Path): [IN] Path to the journal file.
+        size      (int) : [IN] Size of the next record.
+        max_bytes (int) : [IN] Maximum size of the journal file, or 0 to disable the rotation.
+        backups   (int) : [IN] Number of rotated files to be kept.
+
+    Returns:
+        (int): File descriptor of the journal file.
+    """
+    fd: int = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    # Do nothing if the rotation is not necessary.
+    stat: os.stat_result = os.fstat(fd)
+    if (max_bytes <= 0) or (stat.st_size == 0) or (stat.st_size + size <= max_bytes):
+        return fd
+
+    # Rotate the journal only if another process has not rotated it yet, that is, the path still
+    # points to the opened file. The check and the renaming are serialized by the lock file, so that
+    # concurrent writers never shift the rotated files twice, and records written to the opened file
+    # by other processes during the rotation are kept in the rotated file.
+    with lock_rotation(path):
+        try:
+            if os.path.samestat(os.stat(path), stat):
+                for index in range(backups - 1, 0, -1):
+                    if os.path.exists(f"{path}.{index}"):
+                        os.replace(f"{path}.{index}", f"{path}.{index + 1}")
+                if backups > 0:
+                    os.replace(path, f"{path}.1")
+                else:
+                    os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    os.close(fd)
+    return os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+@contextlib.contextmanager
+def lock_rotation(path: Path) -> Iterator[None]:
+    """
+    Hold the lock file of the rotation of the given journal file until the end of the context.
+    The lock file is used instead of the journal file, because the journal file is renamed.
+
+    Args:
+        path (Path): [IN] Path to the journal file.
+
+    Returns:
+        (Iterator[None]): Context that holds the lock.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    fd: int = os.open(path.with_name(f".{path.name}.lock"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,212 @@
+"""
+yadopt.jsonscan - incremental scanner of JSON files written by "yadopt.save".
+
+The scanner decodes only the requested groups and keys of a JSON file, and skips the other
+values without building Python objects. Skipping a large array, such as a list of input files,
+costs only a few searches over the raw bytes because brackets inside strings are detected by
+the parity of the quotes before them.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import json
+import re
+
+# For type hinting.
+from collections.abc import Collection, Iterator
+from typing          import Any
+
+# Import custom modules.
+from .errors import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["load_json_subset"]
+
+# Regular expressions for scanning JSON bytes.
+PATTERN_WS       : re.Pattern = re.compile(rb"[ \t\n\r]*")
+PATTERN_STRING   : re.Pattern = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+PATTERN_SCALAR   : re.Pattern = re.compile(rb"[^,:\[\]{}\s]+")
+PATTERN_NOBRACKET: re.Pattern = re.compile(rb'(?:[^\[\]{}"]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+
+def load_json_subset(data: bytes, groups: Collection[str] | None = None,
+                     keys: Collection[str] | None = None) -> dict[str, Any]:
+    """
+    Decode the given JSON bytes written by "yadopt.save" partially. Internal sections such as
+    "_YADOPT_METADATA_" are always decoded.
+
+    Args:
+        data   (bytes)                  : [IN] Contents of the JSON file.
+        groups (Collection[str] | None) : [IN] Groups to be decoded. All groups are decoded if None.
+        keys   (Collection[str] | None) : [IN] Keys to be decoded. All keys are decoded if None.
+
+    Returns:
+        (dict[str, Any]): Decoded dictionary that has the same structure as the JSON file.
+
+    Examples:
+        >>> data = b'{"Arguments": {"files": ["a", "b"]}, "Options": {"lr": 0.1, "model": "cnn"}}'
+        >>> load_json_subset(data, groups=["Options"], keys=["lr"])
+        {'Options': {'lr': 0.1}}
+    """
+    scanner: JsonScanner = JsonScanner(data)
+    data_dict: dict[str, Any] = {}
+
+    try:
+        for group_name in scanner.iter_object():
+
+            # Internal sections are small, and always decoded.
+            if group_name.startswith("_") and group_name.endswith("_"):
+                data_dict[group_name] = scanner.read_value()
+
+            # Skip unnecessary groups without decoding.
+            elif (groups is not None) and (group_name not in groups):
+                scanner.skip_value()
+
+            # Decode the necessary keys in the group.
+            elif scanner.peek() == b"{":
+                group: dict[str, Any] = data_dict.setdefault(group_name, {})
+                for key in scanner.iter_object():
+                    if (keys is None) or (key in keys):
+                        group[key] = scanner.read_value()
+                    else:
+                        scanner.skip_value()
+
+            else:
+                data_dict[group_name] = scanner.read_value()
+
+    except (ValueError, IndexError) as error:
+        raise YadOptError.InvalidTomlFile(reason="The JSON file is broken.") from error
+
+    return data_dict
+
+
+class JsonScanner:
+    """
+    Incremental scanner of JSON bytes.
+    """
+    def __init__(self, data: bytes) -> None:
+        """
+        Constructor.
+
+        Args:
+            data (bytes): [IN] Contents of the JSON file.
+        """
+        self.data: bytes = data
+        self.pos : int   = PATTERN_WS.match(data, 0).end()  # type: ignore[union-attr]
+
+    def peek(self) -> bytes:
+        """
+        Returns the next character.
+        """
+        return self.data[self.pos:self.pos+1]
+
+    def expect(self, char: bytes) -> None:
+        """
+        Consume the given character and the following whitespaces.
+        """
+        if self.data[self.pos:self.pos+1] != char:
+            raise ValueError(f"Expected {char!r} at position {self.pos}")
+        self.pos = PATTERN_WS.match(self.data, self.pos + 1).end()  # type: ignore[union-attr]
+
+    def iter_object(self) -> Iterator[str]:
+        """
+        Iterate over the keys of an object. The caller must consume the value after each key.
+        """
+        self.expect(b"{")
+        if self.peek() == b"}":
+            self.expect(b"}")
+            return
+
+        while True:
+
+            # Read the key and the colon.
+            if (match := PATTERN_STRING.match(self.data, self.pos)) is None:
+                raise ValueError(f"Expected a key at position {self.pos}")
+            self.pos = PATTERN_WS.match(self.data, match.end()).end()  # type: ignore[union-attr]
+            self.expect(b":")
+
+            yield json.loads(match.group())
+
+            # Read the comma or the end of the object.
+            self.pos = PATTERN_WS.match(self.data, self.pos).end()  # type: ignore[union-attr]
+            if self.peek() == b",":
+                self.expect(b",")
+            else:
+                self.expect(b"}")
+                return
+
+    def read_value(self) -> Any:
+        """
+        Decode the next value.
+        """
+        start: int = self.pos
+        self.skip_value()
+        return json.loads(self.data[start:self.pos])
+
+    def skip_value(self) -> None:
+        """
+        Skip the next value without decoding it.
+        """
+        char: bytes = self.peek()
+
+        # Case 1: String.
+        if char == b'"':
+            match = PATTERN_STRING.match(self.data, self.pos)
+
+        # Case 2: Number, true, false, and null.
+        elif char not in (b"[", b"{"):
+            match = PATTERN_SCALAR.match(self.data, self.pos)
+
+        # Case 3: Array and object.
+        else:
+            self.pos = self.skip_container(self.pos)
+            return
+
+        if match is None:
+            raise ValueError(f"Invalid value at position {self.pos}")
+        self.pos = match.end()
+
+    def skip_container(self, pos: int) -> int:
+        """
+        Returns the position after the array or object starting at the given position.
+        """
+        data: bytes = self.data
+        depth: int = 0
+
+        # Next positions of the brackets and the backslash. These are searched by "bytes.find", which is much
+        # faster than regular expressions, and searched again only after the scanning position passes them.
+        size: int = len(data)
+        nexts: dict[int, int] = {char: find_or_size(data, bytes([char]), pos, size) for char in b"[]{}\\"}
+
+        while True:
+
+            # Find the next bracket. The bracket is structural if the number of quotes before it is even,
+            # provided that there is no escaped character. Otherwise, scan the strings precisely.
+            index: int = min(nexts[char] for char in b"[]{}")
+            if index >= size:
+                raise ValueError("Unterminated array or object")
+            if (nexts[ord("\\")] < index) or (data.count(b'"', pos, index) % 2 == 1):
+                index = PATTERN_NOBRACKET.match(data, pos).end()  # type: ignore[union-attr]
+                if index >= size:
+                    raise ValueError("Unterminated array or object")
+
+            depth += 1 if data[index] in b"[{" else -1
+            pos = index + 1
+
+            if depth == 0:
+                return pos
+
+            # Update the next positions that are already passed.
+            for char, index_next in nexts.items():
+                if index_next < pos:
+                    nexts[char] = find_or_size(data, bytes([char]), pos, size)
+
+
+def find_or_size(data: bytes, sub: bytes, pos: int, size: int) -> int:
+    """
+    Returns the position of the given substring, or the size of the data if not found.
+    """
+    return index if (index := data.find(sub, pos)) >= 0 else size
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
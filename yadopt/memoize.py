@@ -0,0 +1,250 @@
+"""
+yadopt.memoize - run-level memoization keyed on the parsed command line arguments.
+
+Each cache entry is a directory named after the fingerprint of the arguments. The entry contains
+the arguments saved by "yadopt.save" for inspection, the pickled result, and the completion marker.
+An entry is built in a temporary directory and renamed at once after the marker is written, so an
+entry left by a crashed run is never mistaken for a completed one.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import functools
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+
+# For type hinting.
+from collections.abc import Callable, Collection
+from typing          import Any
+
+# Import custom modules.
+from .codec       import encode_canonical
+from .datamodel   import YadOptArgs
+from .dtypes      import Path
+from .fingerprint import fingerprint
+from .serialize   import save
+from .yadopt      import parse
+
+# Declare published functions and variables.
+__all__ = ["memoize_run"]
+
+# File names in a cache entry.
+NAME_ARGS  : str = "args.json"
+NAME_RESULT: str = "result.pickle"
+NAME_MARKER: str = "COMPLETE"
+
+# Temporary directories older than this (in seconds) are regarded as left by crashed runs.
+TMP_MAX_AGE: float = 24 * 60 * 60
+
+
+def memoize_run(*pargs: Any, cache_dir: str | Path, max_entries: int | None = None, max_age: float | None = None,
+                exclude: Collection[str] = (), **kwargs: Any) -> Callable:
+    """
+    Wrapper function for the command line parsing with run-level memoization. Same as "yadopt.wrap",
+    but if the decorated function has already completed with the same arguments, the stored result
+    is returned without calling the function. Results that cannot be pickled are not stored, and
+    None is returned instead while the completion is still recorded.
+
+    Args:
+        pargs       (Any)            : [IN] Positional arguments for 'yadopt.parse' function.
+        cache_dir   (str | Path)     : [IN] Directory of the cache entries.
+        max_entries (int | None)     : [IN] Maximum number of entries. The least recently used entries are
+                                            evicted. Unlimited if None.
+        max_age     (float | None)   : [IN] Maximum age of entries in seconds. Unlimited if None.
+        exclude     (Collection[str]): [IN] Names that do not affect the result, for example, verbosity flags.
+        kwargs      (Any)            : [IN] Keyword arguments for 'yadopt.parse' function.
+
+    Returns:
+        (Callable): Decorator function.
+    """
+    def decorate(func: Callable) -> Callable:
+        """
+        Decorate the given function.
+        """
+        @functools.wraps(func)
+        def wrapper_func(*pargs_func: Any, **kwargs_func: Any) -> Any:
+            args: YadOptArgs = parse(*pargs, **kwargs)
+
+            # Returns the stored result if the same run has completed.
+            path_entry: Path = Path(cache_dir) / get_entry_name(func, args, exclude, pargs_func, kwargs_func)
+            (hit, result) = read_entry(path_entry, max_age)
+            if hit:
+                return result
+
+            result = func(args, *pargs_func, **kwargs_func)
+
+            # The cache is best effort, so the result is returned even if it cannot be stored.
+            try:
+                write_entry(path_entry, args, result, max_age)
+                evict_entries(Path(cache_dir), max_entries, max_age)
+            except OSError:
+                pass
+
+            return result
+
+        return wrapper_func
+
+    return decorate
+
+
+def get_entry_name(func: Callable, args: YadOptArgs, exclude: Collection[str],
+                   pargs_func: tuple, kwargs_func: dict[str, Any]) -> str:
+    """
+    Returns the name of the cache entry, that is, the digest of the function name, the fingerprint
+    of the arguments, and the other arguments of the function.
+    """
+    payload: list[Any] = [f"{func.__module__}.{func.__qualname__}", fingerprint(args, exclude=exclude),
+                          encode_canonical(list(pargs_func)), encode_canonical(kwargs_func)]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()).hexdigest()
+
+
+def read_entry(path_entry: Path, max_age: float | None) -> tuple[bool, Any]:
+    """
+    Read the result of the cache entry.
+
+    Args:
+        path_entry (Path)        : [IN] Path to the cache entry.
+        max_age    (float | None): [IN] Maximum age of entries in seconds.
+
+    Returns:
+        (tuple[bool, Any]): True and the stored result if the entry is available, otherwise False and None.
+    """
+    path_marker: Path = path_entry / NAME_MARKER
+    try:
+        with open(path_marker, "rt", encoding="utf-8") as ifp:
+            marker: dict[str, Any] = json.load(ifp)
+        if (max_age is not None) and (time.time() - get_created_time(marker) > max_age):
+            return (False, None)
+        result: Any = None
+        if marker.get("result") == "pickle":
+            with open(path_entry / NAME_RESULT, "rb") as ifp:
+                result = pickle.load(ifp)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return (False, None)
+
+    # Update the modification time of the marker for the LRU eviction. The age of the entry is
+    # measured from the creation time in the marker, so that frequently used entries still expire.
+    try:
+        os.utime(path_marker)
+    except OSError:
+        pass
+
+    return (True, result)
+
+
+def write_entry(path_entry: Path, args: YadOptArgs, result: Any, max_age: float | None = None) -> None:
+    """
+    Write a cache entry. The entry is built in a temporary directory, and renamed after the
+    completion marker is written.
+
+    Args:
+        path_entry (Path)        : [IN] Path to the cache entry.
+        args       (YadOptArgs)  : [IN] Parsed command line arguments.
+        result     (Any)         : [IN] Result of the decorated function.
+        max_age    (float | None): [IN] Maximum age of entries in seconds.
+    """
+    path_tmp: Path = path_entry.with_name(f".tmp.{os.getpid()}.{threading.get_ident()}.{path_entry.name}")
+    path_tmp.mkdir(parents=True)
+
+    try:
+        # Save the arguments for inspection.
+        save(path_tmp / NAME_ARGS, args, metadata="cheap")
+
+        # Store the result if possible.
+        kind: str = "none"
+        if result is not None:
+            try:
+                with open(path_tmp / NAME_RESULT, "wb") as ofp:
+                    pickle.dump(result, ofp, protocol=pickle.HIGHEST_PROTOCOL)
+                kind = "pickle"
+            except (pickle.PicklingError, TypeError, AttributeError):
+                kind = "unpicklable"
+                os.remove(path_tmp / NAME_RESULT)
+
+        # Write the completion marker.
+        with open(path_tmp / NAME_MARKER, "wt", encoding="utf-8") as ofp:
+            json.dump({"status": "completed", "result": kind, "time": time.time()}, ofp)
+
+        # Replace an incomplete or expired entry, but keep a valid entry written by another process.
+        if path_entry.exists() and is_stale(path_entry, max_age):
+            shutil.rmtree(path_entry, ignore_errors=True)
+        if not path_entry.exists():
+            try:
+                os.rename(path_tmp, path_entry)
+            except OSError:
+                pass
+
+    finally:
+        shutil.rmtree(path_tmp, ignore_errors=True)
+
+
+def evict_entries(cache_dir: Path, max_entries: int | None, max_age: float | None) -> None:
+    """
+    Remove expired entries, the least recently used entries exceeding the maximum number, and the
+    temporary directories left by crashed runs. The age of an entry is measured from its creation,
+    and the last use is the modification time of the completion marker. Broken entries without the
+    completion marker are regarded as created and last used when they were modified.
+
+    Args:
+        cache_dir   (Path)        : [IN] Directory of the cache entries.
+        max_entries (int | None)  : [IN] Maximum number of entries.
+        max_age     (float | None): [IN] Maximum age of entries in seconds.
+    """
+    now: float = time.time()
+    entries: list[tuple[float, float, Path]] = []
+
+    for path in cache_dir.iterdir():
+        try:
+            if path.name.startswith(".tmp."):
+                if now - path.stat().st_mtime > TMP_MAX_AGE:
+                    shutil.rmtree(path, ignore_errors=True)
+            elif (path / NAME_MARKER).exists():
+                mtime: float = (path / NAME_MARKER).stat().st_mtime
+                with open(path / NAME_MARKER, "rt", encoding="utf-8") as ifp:
+                    entries.append((mtime, get_created_time(json.load(ifp), mtime), path))
+            elif path.is_dir():
+                entries.append((path.stat().st_mtime, path.stat().st_mtime, path))
+        except (OSError, ValueError):
+            continue
+
+    # Remove the expired entries first, and then the least recently used entries.
+    entries.sort()
+    alive: list[Path] = []
+    for (_, created, path) in entries:
+        if (max_age is not None) and (now - created > max_age):
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            alive.append(path)
+
+    overflow: int = 0 if max_entries is None else len(alive) - max_entries
+    for path in alive[:max(0, overflow)]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def is_stale(path_entry: Path, max_age: float | None) -> bool:
+    """
+    Returns True if the entry does not have a valid completion marker, or it has expired.
+    """
+    try:
+        with open(path_entry / NAME_MARKER, "rt", encoding="utf-8") as ifp:
+            created: float = get_created_time(json.load(ifp))
+    except (OSError, ValueError):
+        return True
+    return (max_age is not None) and (time.time() - created > max_age)
+
+
+def get_created_time(marker: Any, default: float = 0.0) -> float:
+    """
+    Returns the creation time of the entry recorded in the completion marker, or the default value
+    if the marker does not have a valid creation time.
+    """
+    created: Any = marker.get("time") if isinstance(marker, dict) else None
+    return float(created) if isinstance(created, (int, float)) and not isinstance(created, bool) else default
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
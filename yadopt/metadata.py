@@ -0,0 +1,424 @@
+"""
+yadopt.metadata - collect metadata information saved with parsed command line arguments.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import dataclasses
+import datetime
+import functools
+import getpass
+import importlib.metadata
+import os
+import platform
+import socket
+import subprocess
+import threading
+import time
+
+# For type hinting.
+from collections.abc import Callable
+
+# Import custom modules.
+from .dtypes import Path
+from .errors import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["MetadataProvider", "get_metadata", "prefetch_metadata", "register_metadata_provider",
+           "unregister_metadata_provider", "METADATA_TIMEOUT", "METADATA_ENV_NAMES", "METADATA_PACKAGES"]
+
+# Default time budget in seconds to wait for expensive metadata providers such as "git status".
+METADATA_TIMEOUT: float = 2.0
+
+# Names of environment variables recorded by the "env" provider.
+METADATA_ENV_NAMES: list[str] = []
+
+# Names of packages whose versions are recorded by the "packages" provider.
+METADATA_PACKAGES: list[str] = ["yadopt"]
+
+# Placeholder of unknown values.
+UNKNOWN: str = "???"
+
+# Cost classes of metadata providers.
+COSTS: tuple[str, ...] = ("cheap", "expensive")
+
+
+class BackgroundProbe:
+    """
+    Run the given function once in a daemon thread and keep the result.
+    The daemon thread never blocks the interpreter exit even if the function hangs.
+    """
+    def __init__(self, func: Callable[[], str | None], name: str) -> None:
+        """
+        Constructor.
+
+        Args:
+            func (Callable[[], str | None]): [IN] Function to be run in background.
+            name (str)                     : [IN] Name of the thread.
+        """
+        self.result: str | None      = UNKNOWN
+        self.done  : threading.Event = threading.Event()
+        threading.Thread(target=self.run, args=(func,), name=name, daemon=True).start()
+
+    def run(self, func: Callable[[], str | None]) -> None:
+        """
+        Thread function.
+        """
+        try:
+            self.result = func()
+        except Exception:  # pylint: disable=broad-exception-caught
+            self.result = UNKNOWN
+        finally:
+            self.done.set()
+
+    def get(self, deadline: float) -> str | None:
+        """
+        Returns the result if available until the deadline, otherwise returns the placeholder.
+
+        Args:
+            deadline (float): [IN] Deadline in the time of "time.monotonic()".
+        """
+        return self.result if self.done.wait(max(0.0, deadline - time.monotonic())) else UNKNOWN
+
+
+@dataclasses.dataclass
+class MetadataProvider:
+    """
+    Lazily evaluated metadata field.
+    """
+    name  : str                        # Field name in the metadata dictionary.
+    func  : Callable[..., str | None]  # Function that returns the value, or None to omit the field.
+    cost  : str                        # Cost class, "cheap" or "expensive".
+    cache : bool                       # If True, a cheap provider is computed only once per process.
+    cwd   : bool = False               # If True, the value is computed once per working directory.
+
+    # Background computations of an expensive provider, and cached values of a cheap provider.
+    # Both are keyed by the working directory if "cwd" is True, otherwise by the empty string.
+    probes: dict[str, BackgroundProbe]   = dataclasses.field(default_factory=dict)
+    values: dict[str, tuple[str | None]] = dataclasses.field(default_factory=dict)
+
+    def key(self) -> str:
+        """
+        Returns the key of the cached value, that is, the working directory if the value depends on it.
+        """
+        return os.getcwd() if self.cwd else ""
+
+    def call(self, key: str) -> str | None:
+        """
+        Call the function. The working directory is given if the value depends on it.
+        """
+        return self.func(key) if self.cwd else self.func()
+
+    def start(self, key: str | None = None) -> BackgroundProbe | None:
+        """
+        Start the computation in background if this provider is expensive.
+
+        Args:
+            key (str | None): [IN] Key of the cached value. The current key is used if None.
+
+        Returns:
+            (BackgroundProbe | None): Probe of the computation, or None if this provider is cheap.
+        """
+        if self.cost != "expensive":
+            return None
+        key = self.key() if key is None else key
+        if key not in self.probes:
+            self.probes[key] = BackgroundProbe(functools.partial(self.call, key), f"yadopt-metadata-{self.name}")
+        return self.probes[key]
+
+    def get(self, deadline: float) -> str | None:
+        """
+        Returns the value of this field.
+
+        Args:
+            deadline (float): [IN] Deadline to wait for the expensive computation.
+        """
+        key: str = self.key()
+
+        # Case 1: Expensive providers are computed once per process (and per working directory) in background.
+        if self.cost == "expensive":
+            probe: BackgroundProbe | None = self.start(key)
+            return probe.get(deadline) if probe is not None else UNKNOWN
+
+        # Case 2: Cached cheap providers.
+        if key in self.values:
+            return self.values[key][0]
+
+        # Case 3: Otherwise, compute the value in the caller thread.
+        try:
+            value: str | None = self.call(key)
+        except Exception:  # pylint: disable=broad-exception-caught
+            value = UNKNOWN
+
+        if self.cache:
+            self.values[key] = (value,)
+
+        return value
+
+
+# Registry of metadata providers in the order of output.
+PROVIDERS: dict[str, MetadataProvider] = {}
+PROVIDERS_LOCK: threading.Lock = threading.Lock()
+
+
+def register_metadata_provider(name: str, func: Callable[..., str | None], cost: str = "cheap",
+                               cache: bool = False, cwd: bool = False) -> None:
+    """
+    Register a metadata provider. The provider is evaluated only when the metadata is requested.
+    Expensive providers are always computed once per process in background and reused.
+
+    Args:
+        name  (str)                      : [IN] Field name in the metadata dictionary.
+        func  (Callable[..., str | None]): [IN] Function that returns the value, or None to omit the field.
+        cost  (str)                      : [IN] Cost class, "cheap" or "expensive".
+        cache (bool)                     : [IN] If True, a cheap provider is also computed only once per process.
+        cwd   (bool)                     : [IN] If True, the function takes the working directory as the argument,
+                                                and the value is computed once per working directory.
+    """
+    if cost not in COSTS:
+        raise YadOptError.InvalidMetadataTier(tier=cost)
+
+    with PROVIDERS_LOCK:
+        PROVIDERS[name] = MetadataProvider(name, func, cost, cache, cwd)
+
+
+def unregister_metadata_provider(name: str) -> None:
+    """
+    Unregister the metadata provider of the given name.
+
+    Args:
+        name (str): [IN] Field name in the metadata dictionary.
+    """
+    with PROVIDERS_LOCK:
+        PROVIDERS.pop(name, None)
+
+
+def get_metadata(contains_extra: bool | str | list[str] = True, timeout: float | None = None) -> dict[str, str]:
+    """
+    Returns metadata information. Each field is computed by a registered provider only when requested.
+    Expensive providers run concurrently in background threads, and this function never waits for them
+    longer than the given timeout.
+
+    Args:
+        contains_extra (bool | str | list[str]): [IN] Requested fields. False means the timestamp only, True or
+                                                      "expensive" means all fields, "cheap" means the cheap fields,
+                                                      and a list means the fields of the given names.
+        timeout        (float | None)          : [IN] Time budget in seconds. METADATA_TIMEOUT is used if None.
+
+    Returns:
+        (dict[str, str]): Metadata dictionary.
+    """
+    # Start the expensive providers first to run them concurrently with the other providers.
+    providers: list[MetadataProvider] = prefetch_metadata(contains_extra)
+    deadline : float = time.monotonic() + (METADATA_TIMEOUT if timeout is None else timeout)
+
+    # Collect values, and omit the fields whose value is None.
+    return {provider.name: value for provider in providers if (value := provider.get(deadline)) is not None}
+
+
+def prefetch_metadata(contains_extra: bool | str | list[str] = True) -> list[MetadataProvider]:
+    """
+    Start computing the requested expensive metadata in background, and returns the requested providers.
+    Call this function early, for example right after parsing, to hide the latency of "git status".
+
+    Args:
+        contains_extra (bool | str | list[str]): [IN] Requested fields. See "get_metadata" for details.
+
+    Returns:
+        (list[MetadataProvider]): Requested providers.
+    """
+    # Select providers.
+    with PROVIDERS_LOCK:
+        if contains_extra is False:
+            providers = [PROVIDERS[name] for name in ["timestamp"] if name in PROVIDERS]
+        elif contains_extra is True or contains_extra == "expensive":
+            providers = list(PROVIDERS.values())
+        elif contains_extra == "cheap":
+            providers = [provider for provider in PROVIDERS.values() if provider.cost == "cheap"]
+        elif isinstance(contains_extra, list):
+            providers = [provider for provider in PROVIDERS.values() if provider.name in contains_extra]
+        else:
+            raise YadOptError.InvalidMetadataTier(tier=contains_extra)
+
+        # Start the expensive computation in background.
+        for provider in providers:
+            if provider.cost == "expensive":
+                provider.start()
+
+    return providers
+
+
+def get_datetime_str() -> str:
+    """
+    Returns datetime string with timezone.
+    """
+    # Get the current time in UTC timezone, convert it to the system timezone, and stringify.
+    return datetime.datetime.now(datetime.timezone.utc).astimezone().strftime("%Y/%m/%d %H:%M:%S %Z")
+
+
+def get_username() -> str:
+    """
+    Get username.
+    """
+    try:
+        return getpass.getuser()
+    except (ImportError, KeyError, OSError):
+        return UNKNOWN
+
+
+def get_git_hash(cwd: str) -> str:
+    """
+    Get the commit hash of HEAD. The hash is read from the ".git" directory directly if possible,
+    and "git rev-parse HEAD" is used only as a fallback.
+
+    Args:
+        cwd (str): [IN] Working directory.
+    """
+    if (git_hash := read_git_hash(Path(cwd))) is not None:
+        return git_hash
+
+    output: bytes | None = run_command(["git", "rev-parse", "HEAD"], cwd)
+    return UNKNOWN if not output else output.decode().strip()
+
+
+def get_git_changed(cwd: str) -> str:
+    """
+    Returns 'true' if Git status is 'changed' otherwise 'false'. Returns the placeholder of unknown
+    values if the status is not available, for example, outside of a git repository.
+
+    Args:
+        cwd (str): [IN] Working directory.
+    """
+    output: bytes | None = run_command(["git", "status", "--porcelain"], cwd)
+    if output is None:
+        return UNKNOWN
+    return "false" if len(output) == 0 else "true"
+
+
+def read_git_hash(path: Path) -> str | None:
+    """
+    Read the commit hash of HEAD from the ".git" directory without running a subprocess.
+
+    Args:
+        path (Path): [IN] Directory inside a git repository.
+
+    Returns:
+        (str | None): Commit hash if found, otherwise None.
+    """
+    # Find the ".git" directory (or the ".git" file of a worktree) in the parent directories.
+    git_dir: Path | None = next((p / ".git" for p in [path, *path.parents] if (p / ".git").exists()), None)
+    if git_dir is None:
+        return None
+
+    try:
+        # Case 1: The ".git" is a file that points to the real git directory (worktree or submodule).
+        if git_dir.is_file():
+            text: str = git_dir.read_text().strip()
+            if not text.startswith("gitdir:"):
+                return None
+            git_dir = (git_dir.parent / text[len("gitdir:"):].strip()).resolve()
+
+        # Refs are stored in the common directory in the case of worktrees.
+        common_dir: Path = git_dir
+        if (git_dir / "commondir").is_file():
+            common_dir = (git_dir / (git_dir / "commondir").read_text().strip()).resolve()
+
+        # Case 2: Detached HEAD.
+        head: str = (git_dir / "HEAD").read_text().strip()
+        if not head.startswith("ref:"):
+            return head
+
+        # Case 3: Loose reference.
+        ref: str = head[len("ref:"):].strip()
+        for directory in (git_dir, common_dir):
+            if (directory / ref).is_file():
+                return (directory / ref).read_text().strip()
+
+        # Case 4: Packed reference.
+        if (common_dir / "packed-refs").is_file():
+            for line in (common_dir / "packed-refs").read_text().splitlines():
+                if line.endswith(" " + ref) and not line.startswith(("#", "^")):
+                    return line.split(" ", maxsplit=1)[0]
+
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    return None
+
+
+def run_command(tokens: list[str], cwd: str) -> bytes | None:
+    """
+    Run the given command as a shell command. Returns None if the command failed.
+    """
+    try:
+        proc = subprocess.run(tokens, check=False, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except (subprocess.SubprocessError, OSError):
+        return None
+    return proc.stdout if proc.returncode == 0 else None
+
+
+def get_cpu_count() -> str:
+    """
+    Returns the number of CPUs.
+    """
+    return str(os.cpu_count() or UNKNOWN)
+
+
+def get_slurm_job_id() -> str | None:
+    """
+    Returns the SLURM job ID (and the array task ID if exists), or None if not running on SLURM.
+    """
+    if (job_id := os.environ.get("SLURM_JOB_ID")) is None:
+        return None
+    if (task_id := os.environ.get("SLURM_ARRAY_TASK_ID")) is not None:
+        return f"{job_id}_{task_id}"
+    return job_id
+
+
+def get_slurm_procid() -> str | None:
+    """
+    Returns the SLURM process ID, or None if not running on SLURM.
+    """
+    return os.environ.get("SLURM_PROCID")
+
+
+def get_env_values() -> str | None:
+    """
+    Returns the values of environment variables listed in METADATA_ENV_NAMES, or None if no names are listed.
+    """
+    if not METADATA_ENV_NAMES:
+        return None
+    return ", ".join(f"{name}={os.environ.get(name, '')}" for name in METADATA_ENV_NAMES)
+
+
+def get_package_versions() -> str | None:
+    """
+    Returns the versions of packages listed in METADATA_PACKAGES, or None if no packages are listed.
+    """
+    def get_version(name: str) -> str:
+        try:
+            return importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            return UNKNOWN
+
+    if not METADATA_PACKAGES:
+        return None
+    return ", ".join(f"{name}={get_version(name)}" for name in METADATA_PACKAGES)
+
+
+# Register the built-in providers.
+register_metadata_provider("hostname",     socket.gethostname,      cost="cheap", cache=True)
+register_metadata_provider("username",     get_username,            cost="cheap", cache=True)
+register_metadata_provider("platform",     platform.platform,       cost="cheap", cache=True)
+register_metadata_provider("timestamp",    get_datetime_str,        cost="cheap", cache=False)
+register_metadata_provider("python_ver",   platform.python_version, cost="cheap", cache=True)
+register_metadata_provider("git_hash",     get_git_hash,            cost="expensive", cwd=True)
+register_metadata_provider("git_changed",  get_git_changed,         cost="expensive", cwd=True)
+register_metadata_provider("cpu_count",    get_cpu_count,           cost="cheap", cache=True)
+register_metadata_provider("slurm_job_id", get_slurm_job_id,        cost="cheap", cache=True)
+register_metadata_provider("slurm_procid", get_slurm_procid,        cost="cheap", cache=True)
+register_metadata_provider("env",          get_env_values,          cost="cheap", cache=False)
+register_metadata_provider("packages",     get_package_versions,    cost="expensive")
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
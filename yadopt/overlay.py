@@ -0,0 +1,270 @@
+"""
+yadopt.overlay - layered view of multiple YadOptArgs instances.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import dataclasses
+
+# For type hinting.
+from collections.abc import Iterator, Mapping
+from typing          import Any
+
+# Import custom modules.
+from .datamodel import YadOptArgs, get_defaulted, make_yadoptargs_data
+from .errors    import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["YadOptOverlay", "overlay"]
+
+
+class YadOptOverlay:
+    """
+    Layered view of YadOptArgs instances (or mappings) like `collections.ChainMap`.
+
+    Layers are stored in the order of precedence from lowest to highest, that is, the last layer
+    wins on key conflicts like the merge operator `|`. Attribute lookups fall through the layers
+    without copying any values, and the layer that provides each key is resolved only once.
+
+    Values that "yadopt.parse" filled with the declared default values are not explicitly given,
+    therefore they are used only if no layer gives the key explicitly. For example, an "argv" layer
+    of parsed arguments overrides the lower layers only with the options given on the command line.
+    """
+    # Attributes set by object.__setattr__ because __setattr__ of this class is disabled.
+    _layers_: list[tuple[str, YadOptArgs | Mapping[str, Any]]]
+    _owners_: dict[str, int] | None
+    _flat_  : YadOptArgs | None
+
+    def __init__(self, layers: list[tuple[str, YadOptArgs | Mapping[str, Any]]]) -> None:
+        """
+        Constructor.
+
+        Args:
+            layers (list[tuple[str, YadOptArgs | Mapping]]): [IN] Pairs of layer name and layer contents.
+        """
+        # Validate the type of the given layers.
+        for _, layer in layers:
+            if not (isinstance(layer, Mapping) or (isinstance(layer, YadOptArgs) and dataclasses.is_dataclass(layer))):
+                raise YadOptError.CannotMerge(cls_name=layer.__class__.__name__)
+
+        # Use object.__setattr__ because __setattr__ of this class is disabled.
+        # Keys of mappings are normalized only once here.
+        object.__setattr__(self, "_layers_", [(name, normalize_layer(layer)) for name, layer in layers])
+        object.__setattr__(self, "_owners_", None)
+        object.__setattr__(self, "_flat_", None)
+
+    def __getattr__(self, name: str) -> Any:
+        """
+        Returns the value of the given key from the highest layer that has the key.
+        """
+        # Names like "_layers_" are never forwarded to the layers.
+        if name.startswith("__") or (name.startswith("_") and name.endswith("_")):
+            raise AttributeError(name)
+
+        # Find the layer that provides the given key.
+        owners: dict[str, int] = self.resolve()
+        if name not in owners:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+        return get_layer_value(self._layers_[owners[name]][1], name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        The overlay is immutable as well as YadOptArgs.
+        """
+        raise dataclasses.FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __contains__(self, name: object) -> bool:
+        """
+        Returns True if at least one layer has the given key.
+        """
+        return name in self.resolve()
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate over the keys in the order of first appearance in the layers.
+        """
+        return iter(self.resolve())
+
+    def __len__(self) -> int:
+        """
+        Returns the number of unique keys.
+        """
+        return len(self.resolve())
+
+    def __or__(self, other: Any) -> YadOptOverlay:
+        """
+        Returns a new overlay with the given operand as the highest layer.
+        """
+        if isinstance(other, YadOptOverlay):
+            return YadOptOverlay(self._layers_ + other._layers_)
+        return self.new_layer(other)
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Equality comparison based on the flattened contents.
+        """
+        if isinstance(other, (YadOptOverlay, YadOptArgs)):
+            return self.flatten() == (other.flatten() if isinstance(other, YadOptOverlay) else other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        """
+        Returns string expression of this overlay.
+        """
+        items: str = ", ".join(f"{key}={getattr(self, key)!r}" for key in self)
+        return f"{self.__class__.__name__}({items})"
+
+    @property
+    def layer_names(self) -> list[str]:
+        """
+        Returns the names of the layers from lowest to highest precedence.
+        """
+        return [name for name, _ in self._layers_]
+
+    def new_layer(self, layer: YadOptArgs | Mapping[str, Any], name: str | None = None) -> YadOptOverlay:
+        """
+        Returns a new overlay with the given layer on top. The layers are shared, not copied.
+
+        Args:
+            layer (YadOptArgs | Mapping): [IN] Layer to be added as the highest layer.
+            name  (str | None)          : [IN] Name of the layer. The index of the layer is used if None.
+
+        Returns:
+            (YadOptOverlay): New overlay instance.
+        """
+        return YadOptOverlay(self._layers_ + [(str(len(self._layers_)) if name is None else name, layer)])
+
+    def resolve(self) -> dict[str, int]:
+        """
+        Resolve the precedence of all keys once and returns a map from key to layer index.
+
+        Returns:
+            (dict[str, int]): Map from key to the index of the layer that provides the key.
+        """
+        if self._owners_ is not None:
+            return self._owners_
+
+        # Explicitly given values take precedence over the defaulted values of any layer.
+        explicit : dict[str, int] = {}
+        defaulted: dict[str, int] = {}
+        for index, (_, layer) in enumerate(self._layers_):
+            names_defaulted: frozenset[str] = get_defaulted(layer)
+            for key in get_layer_keys(layer):
+                (defaulted if key in names_defaulted else explicit)[key] = index
+
+        # Keep the order of first appearance in the layers.
+        owners: dict[str, int] = {}
+        for _, layer in self._layers_:
+            for key in get_layer_keys(layer):
+                if key not in owners:
+                    owners[key] = explicit[key] if key in explicit else defaulted[key]
+
+        object.__setattr__(self, "_owners_", owners)
+        return owners
+
+    def source_of(self, name: str) -> str:
+        """
+        Returns the name of the layer that provides the value of the given key.
+
+        Args:
+            name (str): [IN] Key name.
+
+        Returns:
+            (str): Name of the layer.
+        """
+        owners: dict[str, int] = self.resolve()
+        if name not in owners:
+            raise KeyError(name)
+        return self._layers_[owners[name]][0]
+
+    def sources(self) -> dict[str, str]:
+        """
+        Returns a map from key name to the name of the layer that provides the value.
+        """
+        return {key: self._layers_[index][0] for key, index in self.resolve().items()}
+
+    def flatten(self) -> YadOptArgs:
+        """
+        Materialize the overlay as a concrete YadOptArgs instance. The result is cached.
+
+        Returns:
+            (YadOptArgs): Flattened YadOptArgs instance.
+        """
+        if self._flat_ is not None:
+            return self._flat_
+
+        # Merge the group information of all layers without duplication.
+        groups: dict[str, list[str]] = {}
+        for _, layer in self._layers_:
+            for group_name, names in getattr(layer, "_groups_", {}).items():
+                group: list[str] = groups.setdefault(group_name, [])
+                group.extend(name for name in names if name not in group)
+
+        # Keys that are given by mappings only are not in any group yet.
+        keys_grouped: set[str] = {name for names in groups.values() for name in names}
+        keys_orphan : list[str] = [key for key in self.resolve() if key not in keys_grouped]
+        if keys_orphan:
+            groups.setdefault("Options", []).extend(keys_orphan)
+
+        # Build the concrete instance only once.
+        data_dict: dict[str, Any] = {key: getattr(self, key) for key in self.resolve()}
+        flat: YadOptArgs = make_yadoptargs_data(data_dict, groups, base_cls=YadOptArgs)
+        object.__setattr__(self, "_flat_", flat)
+
+        return flat
+
+
+def overlay(*pargs: YadOptArgs | Mapping[str, Any], **kwargs: YadOptArgs | Mapping[str, Any]) -> YadOptOverlay:
+    """
+    Create a layered view of the given YadOptArgs instances or mappings.
+    Later layers take precedence, for example, `overlay(defaults=a, config=b, env=c, argv=d)`.
+
+    Args:
+        pargs  (YadOptArgs | Mapping): [IN] Unnamed layers. The index is used as the layer name.
+        kwargs (YadOptArgs | Mapping): [IN] Named layers that are placed after the unnamed layers.
+
+    Returns:
+        (YadOptOverlay): Layered view of the given layers.
+
+    Examples:
+        >>> layered = overlay(defaults={"lr": 0.1, "model": "mlp"}, argv={"model": "cnn"})
+        >>> (layered.lr, layered.model)
+        (0.1, 'cnn')
+        >>> layered.source_of("model")
+        'argv'
+    """
+    layers: list[tuple[str, YadOptArgs | Mapping[str, Any]]] = [(str(idx), layer) for idx, layer in enumerate(pargs)]
+    layers.extend(kwargs.items())
+    return YadOptOverlay(layers)
+
+
+def normalize_layer(layer: YadOptArgs | Mapping[str, Any]) -> YadOptArgs | Mapping[str, Any]:
+    """
+    Returns the given layer with the keys normalized to valid Python identifiers. Mappings are
+    copied only if they have keys to be normalized, and YadOptArgs instances are returned as they are.
+    """
+    if isinstance(layer, Mapping) and any(("-" in key) or ("." in key) for key in layer.keys()):
+        return {key.replace("-", "_").replace(".", "_"): value for key, value in layer.items()}
+    return layer
+
+
+def get_layer_keys(layer: YadOptArgs | Mapping[str, Any]) -> Iterator[str]:
+    """
+    Returns the keys of the given normalized layer.
+    """
+    if isinstance(layer, Mapping):
+        return iter(layer.keys())
+    return (field.name for field in dataclasses.fields(layer))  # type: ignore[arg-type]
+
+
+def get_layer_value(layer: YadOptArgs | Mapping[str, Any], name: str) -> Any:
+    """
+    Returns the value of the given key in the normalized layer.
+    """
+    if isinstance(layer, Mapping):
+        return layer[name]
+    return getattr(layer, name)
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
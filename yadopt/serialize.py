@@ -4,114 +4,330 @@ yadopt.serialize - serialize and deserialize parsed command line arguments.
 from __future__ import annotations
 
 # Import standard libraries.
+import collections
+import concurrent.futures
 import dataclasses
-import datetime
-import getpass
-import gzip
+import functools
+import itertools
 import json
-import platform
-import socket
-import subprocess
+import os
+import threading
 
 # For type hinting.
-from collections.abc import Callable
+from collections.abc import Callable, Collection, Iterable, Iterator
 from typing          import Any
 
 # Import custom modules.
-from .datamodel import make_yadoptargs_data
-from .dtypes    import Path
-from .errors    import YadOptError
-from .toml      import dump_toml, load_toml
-from .yadopt    import YadOptArgs, parse
+from .binfmt     import BinaryContents, dump_binary, load_binary, select_contents
+from .blob       import BlobSequence, is_blob_candidate, is_blob_file, write_blob
+from .codec      import decode_value, encode_value
+from .compress   import open_file, with_compression
+from .coordinate import elect_writer
+from .datamodel  import get_stub_class, make_yadoptargs_data, untracked
+from .dtypes     import Path
+from .errors     import YadOptError
+from .jsonscan   import load_json_subset
+from .metadata   import get_metadata
+from .store      import OBJECT_KEY, put_object, register_ref, resolve_object
+from .toml       import dump_toml, load_toml
+from .yadopt     import YadOptArgs, parse_internal
 
 # Declare published functions and variables.
-__all__ = ["save", "load"]
+__all__ = ["save", "load", "load_many", "LoadResult"]
 
+# Supported file suffixes.
+SUFFIXES_JSON: list[str] = with_compression([".json"])
+SUFFIXES_TOML: list[str] = with_compression([".toml"])
+SUFFIXES_BIN : list[str] = with_compression([".yadopt"])
+SUFFIXES_ALL : list[str] = SUFFIXES_JSON + SUFFIXES_TOML + SUFFIXES_BIN
 
-def save(path: str | Path, args: YadOptArgs, metadata: bool = True, indent: int = 4) -> None:
+# Metadata key of the names of the values stored in the sidecar files.
+SIDECAR_KEY: str = "_yadopt_sidecars_"
+
+# Number of files in flight per thread in "load_many".
+LOAD_WINDOW_FACTOR: int = 2
+
+
+def save(path: str | Path, args: YadOptArgs, metadata: bool | str | list[str] = True, indent: int = 4,
+         sidecar_threshold: int | None = None, compresslevel: int | None = None, atomic: bool = False,
+         store: str | Path | None = None, coordinate: bool | str = False,
+         metadata_timeout: float | None = None) -> None:
     """
     Save the parsed command line arguments as a file.
 
     Args:
-        path     (str | Path): [IN] Destination path.
-        args     (YadOptArgs): [IN] Parsed command line arguments to be saved.
-        metadata (bool)      : [IN] If True, include metadata information in the output file.
-        indent   (int)       : [IN] Indent size of the output JSON file.
+        path              (str | Path)            : [IN] Destination path.
+        args              (YadOptArgs)            : [IN] Parsed command line arguments to be saved.
+        metadata          (bool | str | list[str]): [IN] Metadata tier ("cheap" or "expensive") or field names to be
+                                                         included. True means all fields and False means the
+                                                         timestamp only.
+        indent            (int)                   : [IN] Indent size of the output JSON file.
+        sidecar_threshold (int | None)            : [IN] Lists of strings or paths with this length or longer are
+                                                         stored in sidecar files. Sidecar files are not used if None.
+        compresslevel     (int | None)            : [IN] Compression level of ".gz", ".bz2", and ".xz" files.
+                                                         The default level of each codec is used if None.
+        atomic            (bool)                  : [IN] If True, the file is written to a temporary file in the same
+                                                         directory, and renamed to the destination path atomically.
+        store             (str | Path | None)     : [IN] Root directory of the content-addressed store. If given, the
+                                                         values are stored in the store, and the file keeps only the
+                                                         metadata and the reference. Sidecar files are not used.
+        coordinate        (bool | str)            : [IN] Coordination mode of processes saving to the same path.
+                                                         If "rank", only the process of rank 0 writes the file.
+                                                         If "lock", the process that holds the lock file writes the
+                                                         file unless the same arguments were already written in the
+                                                         same job. If "auto" or True, "rank" is used if the rank is
+                                                         available, and "lock" otherwise. The other processes return
+                                                         immediately, and the file is always written atomically.
+        metadata_timeout  (float | None)          : [IN] Time budget in seconds to wait for expensive metadata such as
+                                                         "git status". METADATA_TIMEOUT is used if None.
     """
     # Convert the given path as an instance of Path.
     path_out: Path = Path(path) if isinstance(path, str) else path
 
     # Validate the file format.
-    if not any(path_out.name.endswith(sfx) for sfx in [".json", ".json.gz", ".toml", ".toml.gz"]):
+    if not any(path_out.name.endswith(sfx) for sfx in SUFFIXES_ALL):
         raise YadOptError.InvalidFileFormat(suffix=path_out.suffix)
 
-    # Determine the open function.
-    open_fn: Callable = gzip.open if path_out.suffix.endswith(".gz") else open
+    # Reading values for saving is not an access to be tracked.
+    args = untracked(args)
+
+    # Elect a single writer among the processes saving to the same path.
+    if coordinate is not False:
+        with elect_writer(path_out, coordinate, args) as is_writer:
+            if is_writer:
+                save(path_out, args, metadata, indent, sidecar_threshold, compresslevel, True, store,
+                     metadata_timeout=metadata_timeout)
+        return
+
+    # Determine the open function. The codec is selected by the suffix.
+    open_fn: Callable = functools.partial(open_file, compresslevel=compresslevel)
+
+    # Move large lists to the sidecar files, and get the references to them.
+    sidecars: dict[str, str] = {}
+    if (sidecar_threshold is not None) and (store is None):
+        sidecars = save_sidecars(path_out, args, sidecar_threshold)
+
+    # Write the values to the content-addressed store, and get the reference to the object.
+    reference: str | None = None
+    if store is not None:
+        groups: dict[str, list[str]] = getattr(args, "_groups_", {})
+        values: dict[str, Any] = {name: getattr(args, name) for names in groups.values()
+                                                              for name in names if hasattr(args, name)}
+        reference = put_object(store, path_out, BinaryContents(args.__class__.__name__, {}, groups, values))
+
+    # Path of the file to be written. The temporary file keeps the name of the destination path
+    # at the end, so that the codec is selected by the same suffix.
+    path_tmp: Path = path_out.with_name(f".{os.getpid()}.{threading.get_ident()}.tmp.{path_out.name}")
+    path_write: Path = path_tmp if atomic else path_out
+
+    try:
+
+        # Save as a binary file without converting values to JSON/TOML friendly expressions.
+        if any(path_out.name.endswith(sfx) for sfx in SUFFIXES_BIN):
+            with open_fn(path_write, "wb") as ofp:
+                dump_binary(generate_binary_contents_from_parsed_args(args, metadata, sidecars, reference,
+                                                                      metadata_timeout), ofp)
+
+        # Save as a JSON file.
+        elif any(path_out.name.endswith(sfx) for sfx in SUFFIXES_JSON):
+            with open_fn(path_write, "wt") as ofp:
+                json.dump(generate_dict_from_parsed_args(args, metadata, sidecars, reference, metadata_timeout), ofp,
+                          indent=indent)
+
+        # Save as a TOML file.
+        else:
+            with open_fn(path_write, "wt") as ofp:
+                dump_toml(generate_dict_from_parsed_args(args, metadata, sidecars, reference, metadata_timeout), ofp)
+
+        if atomic:
+            os.replace(path_tmp, path_out)
+
+    finally:
+        if atomic and os.path.exists(path_tmp):
+            os.remove(path_tmp)
+
+    # Remove the sidecar files of the previous save that are not referred to anymore.
+    remove_stale_sidecars(path_out, args, sidecars)
+
+    # Register the file to the store after it is written.
+    if (store is not None) and (reference is not None):
+        register_ref(store, path_out, reference)
+
+
+def load(path: str | Path, groups: Collection[str] | None = None, keys: Collection[str] | None = None) -> YadOptArgs:
+    """
+    Load a parsed command line arguments from a file. If groups or keys are given, only the requested
+    values are decoded. Unrequested values in JSON files are skipped without being decoded, and those in
+    binary files are not even read. Note that JSON files are still read into memory entirely, so the
+    memory usage of partial loads of JSON files is proportional to the file size.
 
-    # Generate a dictionary from the parsed arguments.
-    data_dict: dict[str, Any] = generate_dict_from_parsed_args(args, metadata)
+    Args:
+        path   (str | Path)             : [IN] Source path.
+        groups (Collection[str] | None) : [IN] Groups to be loaded. All groups are loaded if None.
+        keys   (Collection[str] | None) : [IN] Keys to be loaded. All keys are loaded if None.
 
-    # Save as a JSON/TOML file.
-    if any(path_out.name.endswith(sfx) for sfx in [".json", ".json.gz"]):
-        with open_fn(path_out, "wt") as ofp:
-            json.dump(data_dict, ofp, indent=indent)
-    elif any(path_out.name.endswith(sfx) for sfx in [".toml", ".toml.gz"]):
-        with open_fn(path_out, "wt") as ofp:
-            ofp.write(dump_toml(data_dict))
+    Returns:
+        (YadOptArgs): Restored parsed command line arguments.
+    """
+    contents: BinaryContents = load_contents(path, groups, keys)
+    return make_parsed_args(contents.values, contents.groups, contents.class_name)
 
 
-def load(path: str | Path) -> YadOptArgs:
+@dataclasses.dataclass
+class LoadResult:
+    """
+    Result of loading a file by "load_many".
     """
-    Load a parsed command line arguments from a file.
+    path : Path                  # Path to the loaded file.
+    args : YadOptArgs | None     # Restored arguments, or None if failed.
+    error: Exception | None      # Error raised while loading the file, or None if succeeded.
+
+
+def load_many(paths: Iterable[str | Path], ordered: bool = True, max_workers: int | None = None,
+              groups: Collection[str] | None = None, keys: Collection[str] | None = None) -> Iterator[LoadResult]:
+    """
+    Load many files concurrently with a thread pool. File I/O and decompression release the GIL,
+    and restored arguments of the same schema share the dynamically created class. An error raised
+    while loading a file is captured in the result instead of stopping the other files.
 
     Args:
-        path (str | Path): [IN] Source path.
+        paths       (Iterable[str | Path]): [IN] Source paths.
+        ordered     (bool)                : [IN] If True, results are yielded in the order of the given paths,
+                                                 otherwise in the order of completion.
+        max_workers (int | None)          : [IN] Number of threads. The default of ThreadPoolExecutor is used if None.
+        groups      (Collection[str] | None): [IN] Groups to be loaded (see "load" for details).
+        keys        (Collection[str] | None): [IN] Keys to be loaded (see "load" for details).
 
     Returns:
-        (YadOptArgs): Restored parsed command line arguments.
+        (Iterator[LoadResult]): Iterator of results.
+    """
+    # Number of threads, which is the same as the default of ThreadPoolExecutor if not given.
+    workers: int = max_workers if max_workers is not None else min(32, (os.cpu_count() or 1) + 4)
+
+    # Files are submitted lazily, and at most LOAD_WINDOW_FACTOR times the number of threads are in flight,
+    # so that results are streamed without holding the futures of all the given paths.
+    iterator: Iterator[str | Path] = iter(paths)
+    pending: collections.deque[concurrent.futures.Future] = collections.deque()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for path in itertools.islice(iterator, LOAD_WINDOW_FACTOR * workers):
+                pending.append(executor.submit(load_one, path, groups, keys))
+
+            while pending:
+
+                # Case 1: Yield the results in the order of the given paths.
+                if ordered:
+                    done: list[concurrent.futures.Future] = [pending.popleft()]
+
+                # Case 2: Yield the results in the order of completion.
+                else:
+                    done_set = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED).done
+                    done = [future for future in pending if future in done_set]
+                    for future in done:
+                        pending.remove(future)
+
+                # Submit the next files to keep the number of files in flight.
+                for path in itertools.islice(iterator, len(done)):
+                    pending.append(executor.submit(load_one, path, groups, keys))
+
+                yield from (future.result() for future in done)
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def load_one(path: str | Path, groups: Collection[str] | None, keys: Collection[str] | None) -> LoadResult:
+    """
+    Load a file and capture the error if raised.
+    """
+    path_in: Path = Path(path) if isinstance(path, str) else path
+    try:
+        return LoadResult(path_in, load(path_in, groups, keys), None)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return LoadResult(path_in, None, error)
+
+
+def load_contents(path: str | Path, groups: Collection[str] | None = None,
+                  keys: Collection[str] | None = None) -> BinaryContents:
+    """
+    Load the contents of a file written by "save" without creating a YadOptArgs instance.
+    All supported file formats, including the legacy format (2026.01.05), are accepted.
+
+    Args:
+        path   (str | Path)             : [IN] Source path.
+        groups (Collection[str] | None) : [IN] Groups to be loaded. All groups are loaded if None.
+        keys   (Collection[str] | None) : [IN] Keys to be loaded. All keys are loaded if None.
+
+    Returns:
+        (BinaryContents): Class name, metadata, groups, and decoded values.
     """
     # Convert the given path as an instance of Path.
     path_out: Path = Path(path) if isinstance(path, str) else path
 
+    # Normalize the requested groups and keys.
+    groups_set: set[str] | None = None if groups is None else set(groups)
+    keys_set  : set[str] | None = None if keys   is None else {key.replace("-", "_").replace(".", "_") for key in keys}
+
     # Validate the file format (only checking the suffix).
-    if not any(path_out.name.endswith(sfx) for sfx in [".json", ".json.gz", ".toml", ".toml.gz"]):
+    if not any(path_out.name.endswith(sfx) for sfx in SUFFIXES_ALL):
         raise YadOptError.InvalidFileFormat(suffix=path_out.suffix)
 
-    # Determine the open function.
-    open_fn: Callable = gzip.open if path_out.suffix.endswith(".gz") else open
-
-    # Load the given file as a dictionary.
-    if any(path_out.name.endswith(sfx) for sfx in [".json", ".json.gz"]):
-        with open_fn(path_out, "rt") as ifp:
-            data_dict = json.load(ifp)
-    if any(path_out.name.endswith(sfx) for sfx in [".toml", ".toml.gz"]):
-        with open_fn(path_out, "rb") as ifp:
+    # Load the binary file directly without decoding JSON/TOML friendly expressions.
+    if any(path_out.name.endswith(sfx) for sfx in SUFFIXES_BIN):
+        with open_file(path_out, "rb") as ifp:
+            contents: BinaryContents = load_binary(ifp, groups_set, keys_set)
+        return load_sidecars(path_out, resolve_object(path_out, contents, groups_set, keys_set))
+
+    # Load the given file as a dictionary. JSON files are scanned incrementally if a subset is requested.
+    if any(path_out.name.endswith(sfx) for sfx in SUFFIXES_JSON):
+        if (groups_set is None) and (keys_set is None):
+            with open_file(path_out, "rt") as ifp:
+                data_dict = json.load(ifp)
+        else:
+            # The whole file is read, because the scanner works on the raw bytes. Only decoding is skipped.
+            with open_file(path_out, "rb") as ifp:
+                data_dict = load_json_subset(ifp.read(), groups_set, keys_set)
+    if any(path_out.name.endswith(sfx) for sfx in SUFFIXES_TOML):
+        with open_file(path_out, "rb") as ifp:
             data_dict = load_toml(ifp)
 
     # If the loaded data is in the legacy format (2026.01.05), restore it accordingly.
-    if any(path_out.name.endswith(sfx) for sfx in [".toml", ".toml.gz"]):
+    if any(path_out.name.endswith(sfx) for sfx in SUFFIXES_TOML):
         if (args_regacy := from_20260105_format(data_dict)) is not None:
-            return args_regacy
+            groups_regacy: dict[str, list[str]] = getattr(args_regacy, "_groups_", {})
+            values_regacy: dict[str, Any] = {name: getattr(args_regacy, name)
+                                             for names in groups_regacy.values() for name in names
+                                             if hasattr(args_regacy, name)}
+            return select_contents(BinaryContents(args_regacy.__class__.__name__, data_dict["Metadata"],
+                                                  groups_regacy, values_regacy), groups_set, keys_set)
 
     # Validate the loaded structure.
     validate_persisted_data(data_dict)
 
-    return generate_parsed_args_from_dict(data_dict)
+    contents = select_contents(generate_contents_from_dict(data_dict), groups_set, keys_set)
+    return load_sidecars(path_out, resolve_object(path_out, contents, groups_set, keys_set))
 
 
-def generate_dict_from_parsed_args(args: YadOptArgs, metadata: bool) -> dict[str, Any]:
+def generate_dict_from_parsed_args(args: YadOptArgs, metadata: bool | str | list[str],
+                                   sidecars: dict[str, str] | None = None, reference: str | None = None,
+                                   timeout: float | None = None) -> dict[str, Any]:
     """
     Generate a dictionary from the parsed command line arguments.
 
     Args:
-        args     (YadOptArgs): [IN] Parsed command line arguments.
-        metadata (bool)      : [IN] If True, include metadata information in the output dictionary.
+        args      (YadOptArgs)            : [IN] Parsed command line arguments.
+        metadata  (bool | str | list[str]): [IN] Metadata tier or field names (see "save" for details).
+        sidecars  (dict[str, str] | None) : [IN] Map from name to the file name of the sidecar file.
+        reference (str | None)            : [IN] Reference to the object in the store. Values are omitted if given.
+        timeout   (float | None)          : [IN] Time budget in seconds to wait for expensive metadata.
 
     Returns:
         (dict[str, Any]): Dictionary containing the parsed arguments and metadata.
     """
-    # Get the groups dictionary from the YadOptArgs instance.
-    groups: dict[str, list[str]] = getattr(args, "_groups_", {})
+    # Get the groups dictionary from the YadOptArgs instance. The values are in the store if the reference is given.
+    groups: dict[str, list[str]] = getattr(args, "_groups_", {}) if reference is None else {}
 
     # Create an output dictionary with group names as keys and empty lists as values.
     data_dict: dict[str, Any] = {group_name: {} for group_name in groups.keys()}
@@ -121,8 +337,8 @@ def generate_dict_from_parsed_args(args: YadOptArgs, metadata: bool) -> dict[str
         # Iterate over the names in the group.
         for name in filter(lambda name: hasattr(args, name), names):
 
-            # Get the value of the attribute from the YadOptArgs instance.
-            value: Any = encode_value(getattr(args, name))
+            # Get the value of the attribute from the YadOptArgs instance, or the file name of the sidecar file.
+            value: Any = sidecars[name] if (sidecars and name in sidecars) else encode_value(getattr(args, name))
 
             # Append the (name, value) tuple to the corresponding group in the output dictionary.
             data_dict[group_name][name] = value
@@ -133,7 +349,11 @@ def generate_dict_from_parsed_args(args: YadOptArgs, metadata: bool) -> dict[str
     }
 
     # Add metadata information to the output dictionary.
-    data_dict["_YADOPT_METADATA_"] = get_metadata(metadata)
+    data_dict["_YADOPT_METADATA_"] = get_metadata(metadata, timeout)
+    if reference is not None:
+        data_dict["_YADOPT_METADATA_"][OBJECT_KEY] = reference
+    if sidecars:
+        data_dict["_YADOPT_METADATA_"][SIDECAR_KEY] = list(sidecars.keys())
 
     return data_dict
 
@@ -148,6 +368,21 @@ def generate_parsed_args_from_dict(data_dict: dict[str, Any]) -> YadOptArgs:
     Returns:
         (YadOptArgs): Restored parsed command line arguments.
     """
+    contents: BinaryContents = generate_contents_from_dict(data_dict)
+    return make_parsed_args(contents.values, contents.groups, contents.class_name)
+
+
+def generate_contents_from_dict(data_dict: dict[str, Any]) -> BinaryContents:
+    """
+    Generate the contents, that is, the class name, metadata, groups, and decoded values,
+    from the given dictionary.
+
+    Args:
+        data_dict (dict[str, Any]): [IN] Dictionary containing the parsed arguments and metadata
+
+    Returns:
+        (BinaryContents): Contents of the given dictionary.
+    """
     # Extract the body of the data dictionary.
     data_dict_body: dict[str, Any] = {}
     for group_name, values in data_dict.items():
@@ -158,69 +393,130 @@ def generate_parsed_args_from_dict(data_dict: dict[str, Any]) -> YadOptArgs:
     for key in data_dict_body.keys():
         data_dict_body[key] = decode_value(data_dict_body[key])
 
-    # Determine the dataclass type based on the stored class name.
-    dataclass_name: str = data_dict["_YADOPT_DATACLASS_INFO_"]["class_name"]
-    if dataclass_name != YadOptArgs.__name__:
-        dataclass_type = dataclasses.make_dataclass(cls_name=dataclass_name, fields=[], eq=False, bases=(YadOptArgs,))
-    else:
-        dataclass_type = YadOptArgs
-
     # Create a groups dictionary from the data dictionary.
-    groups: dict[str, list[str]] = {group_name: list(values.keys()) for group_name, values in data_dict.items()}
+    groups: dict[str, list[str]] = {group_name: list(values.keys()) for group_name, values in data_dict.items()
+                                    if not (group_name.startswith("_") and group_name.endswith("_"))}
 
-    return make_yadoptargs_data(data_dict_body, groups, dataclass_type)
+    return BinaryContents(class_name = data_dict["_YADOPT_DATACLASS_INFO_"]["class_name"],
+                          metadata   = data_dict["_YADOPT_METADATA_"],
+                          groups     = groups,
+                          values     = data_dict_body)
 
 
-def encode_value(value: Any) -> Any:
+def generate_binary_contents_from_parsed_args(args: YadOptArgs, metadata: bool | str | list[str],
+                                              sidecars: dict[str, str] | None = None, reference: str | None = None,
+                                              timeout: float | None = None) -> BinaryContents:
     """
-    Convert the value to a safer representation for JSON/TOML serialization.
+    Generate the contents of a binary file from the parsed command line arguments.
 
     Args:
-        value (Any): [IN] Value to be encoded.
+        args      (YadOptArgs)            : [IN] Parsed command line arguments.
+        metadata  (bool | str | list[str]): [IN] Metadata tier or field names (see "save" for details).
+        sidecars  (dict[str, str] | None) : [IN] Map from name to the file name of the sidecar file.
+        reference (str | None)            : [IN] Reference to the object in the store. Values are omitted if given.
+        timeout   (float | None)          : [IN] Time budget in seconds to wait for expensive metadata.
 
     Returns:
-        (Any): Encoded value suitable for JSON/TOML serialization.
+        (BinaryContents): Contents of a binary file.
     """
-    # Case 1: None value.
-    if value is None:
-        return '"None"'
+    # Get the groups dictionary from the YadOptArgs instance. The values are in the store if the reference is given.
+    groups: dict[str, list[str]] = getattr(args, "_groups_", {}) if reference is None else {}
 
-    # Case 2: Path object.
-    if isinstance(value, Path):
-        return f"Path({value})"
+    # Values are stored as they are, since the binary format supports None and Path natively.
+    values: dict[str, Any] = {name: getattr(args, name) for names in groups.values()
+                                                          for name in names if hasattr(args, name)}
+    values.update(sidecars or {})
 
-    # Case 3: List of values.
-    if isinstance(value, list) and len(value) > 0:
-        return [encode_value(v) for v in value]
+    # Add the reference to the object in the store to the metadata.
+    metadata_dict: dict[str, Any] = get_metadata(metadata, timeout)
+    if reference is not None:
+        metadata_dict[OBJECT_KEY] = reference
+    if sidecars:
+        metadata_dict[SIDECAR_KEY] = list(sidecars.keys())
 
-    # Otherwise, return the value as is.
-    return value
+    return BinaryContents(args.__class__.__name__, metadata_dict, groups, values)
 
 
-def decode_value(value: Any) -> Any:
+def save_sidecars(path: Path, args: YadOptArgs, threshold: int) -> dict[str, str]:
     """
-    Convert the encoded value back to its original representation.
+    Write large lists of strings or paths to the sidecar files next to the given path.
 
     Args:
-        value (Any): [IN] Encoded value.
+        path      (Path)      : [IN] Path to the main file.
+        args      (YadOptArgs): [IN] Parsed command line arguments to be saved.
+        threshold (int)       : [IN] Minimum length of lists to be stored in the sidecar files.
 
     Returns:
-        (Any): Decoded value in its original representation.
+        (dict[str, str]): Map from name to the file name of the sidecar file, for example, "args.json.files".
     """
-    # Case 1: None value.
-    if value == '"None"':
-        return None
+    sidecars: dict[str, str] = {}
+    for name in (name for names in getattr(args, "_groups_", {}).values() for name in names):
+        if hasattr(args, name) and is_blob_candidate(getattr(args, name), threshold):
+            name_sidecar: str = f"{path.name}.{name}"
+            write_blob(path.parent / name_sidecar, getattr(args, name))
+            sidecars[name] = name_sidecar
+    return sidecars
 
-    # Case 2: Path object.
-    if isinstance(value, str) and value.startswith("Path(") and value.endswith(")"):
-        return Path(value[5:-1])
 
-    # Case 3: List of values.
-    if isinstance(value, list) and len(value) > 0:
-        return [decode_value(v) for v in value]
+def remove_stale_sidecars(path: Path, args: YadOptArgs, sidecars: dict[str, str]) -> None:
+    """
+    Remove the sidecar files next to the given path that were written by a previous save
+    and are not referred to by the current one. Only the sidecar files of list values are
+    checked, so that the cost does not depend on the number of files in the directory.
 
-    # Otherwise, return the value as is.
-    return value
+    Args:
+        path     (Path)          : [IN] Path to the main file.
+        args     (YadOptArgs)    : [IN] Parsed command line arguments that were saved.
+        sidecars (dict[str, str]): [IN] Map from name to the file name of the sidecar file in use.
+    """
+    for name in (name for names in getattr(args, "_groups_", {}).values() for name in names):
+        if (name not in sidecars) and isinstance(getattr(args, name, None), (list, BlobSequence)):
+            path_sidecar: Path = path.parent / f"{path.name}.{name}"
+            if is_blob_file(path_sidecar):
+                path_sidecar.unlink(missing_ok=True)
+
+
+def load_sidecars(path: Path, contents: BinaryContents) -> BinaryContents:
+    """
+    Replace the values stored in the sidecar files with lazy sequences on the memory-mapped sidecar files.
+    The names of these values are listed in the metadata, and their values are the file names of the sidecar files.
+
+    Args:
+        path     (Path)          : [IN] Path to the main file.
+        contents (BinaryContents): [IN] Contents of the main file.
+
+    Returns:
+        (BinaryContents): Updated contents.
+    """
+    names: object = contents.metadata.get(SIDECAR_KEY, [])
+    if not isinstance(names, list):
+        raise YadOptError.InvalidBinaryFile(reason=f"Invalid list of the sidecar files: {names!r}.")
+
+    for name in filter(lambda name: isinstance(name, str) and name in contents.values, names):
+        name_sidecar: object = contents.values[name]
+        if not isinstance(name_sidecar, str):
+            raise YadOptError.InvalidBinaryFile(reason=f"Invalid reference to the sidecar file: {name_sidecar!r}.")
+        try:
+            contents.values[name] = BlobSequence.open(path.parent / name_sidecar)
+        except (OSError, ValueError) as error:
+            raise YadOptError.InvalidBinaryFile(reason=f"Cannot open the sidecar file {name_sidecar}.") from error
+
+    return contents
+
+
+def make_parsed_args(values: dict[str, Any], groups: dict[str, list[str]], class_name: str) -> YadOptArgs:
+    """
+    Make a YadOptArgs instance from the restored values.
+
+    Args:
+        values     (dict[str, Any])      : [IN] Map from name to restored value.
+        groups     (dict[str, list[str]]): [IN] Map from group name to the names in the group.
+        class_name (str)                 : [IN] Name of the class of the saved YadOptArgs.
+
+    Returns:
+        (YadOptArgs): Restored parsed command line arguments.
+    """
+    return make_yadoptargs_data(values, groups, get_stub_class(class_name))
 
 
 def validate_persisted_data(data_dict: dict[str, Any]) -> None:
@@ -237,75 +533,18 @@ def validate_persisted_data(data_dict: dict[str, Any]) -> None:
     if not isinstance(data_dict["_YADOPT_METADATA_"], dict):
         raise YadOptError.InvalidTomlFile(reason="The '_YADOPT_METADATA_' key must be a list.")
 
-    # Case 3: Each group in the top-level dictionary must be a dictionary.
+    # Case 3: The "_YADOPT_DATACLASS_INFO_" key must be a dictionary containing the class name.
+    if not isinstance(data_dict.get("_YADOPT_DATACLASS_INFO_"), dict):
+        raise YadOptError.InvalidTomlFile(reason="Missing '_YADOPT_DATACLASS_INFO_' key.")
+    if not isinstance(data_dict["_YADOPT_DATACLASS_INFO_"].get("class_name"), str):
+        raise YadOptError.InvalidTomlFile(reason="The '_YADOPT_DATACLASS_INFO_' key must contain the class name.")
+
+    # Case 4: Each group in the top-level dictionary must be a dictionary.
     for group_name in filter(lambda name: name != "_YADOPT_METADATA_", data_dict.keys()):
         if not isinstance(data_dict[group_name], dict):
             raise YadOptError.InvalidTomlFile(reason="Each parsed entry must be a dictionary.")
 
 
-def get_metadata(contains_extra: bool = True) -> dict[str, str]:
-    """
-    Returns metadata information.
-
-    Args:
-        contains_extra (bool): [IN] If True, include extra metadata information.
-
-    Returns:
-        (dict[str, str]): Metadata dictionary.
-    """
-    def get_datetime_str() -> str:
-        """
-        Returns datetime string with timezone.
-        """
-        # Get the current time in UTC timezone, convert it to the system timezone, and stringify.
-        return datetime.datetime.now(datetime.timezone.utc).astimezone().strftime("%Y/%m/%d %H:%M:%S %Z")
-
-    def get_git_hash() -> str:
-        """
-        Get git information.
-        """
-        output: bytes = run_command(["git", "rev-parse", "HEAD"])
-        return "???" if len(output)== 0 else output.decode().strip()
-
-    def get_git_changed() -> str:
-        """
-        Returns 'true' if Git status is 'changed' otherwise 'false'.
-        """
-        output: bytes = run_command(["git", "status", "--porcelain"])
-        return "false" if len(output) == 0 else "true"
-
-    def get_username() -> str:
-        """
-        Get username.
-        """
-        try:
-            return getpass.getuser()
-        except (ImportError, KeyError, OSError):
-            return "???"
-
-    def run_command(tokens: list[str]) -> bytes:
-        """
-        Run the given command as a shell command.
-        """
-        try:
-            return subprocess.run(tokens, check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE).stdout
-        except (subprocess.SubprocessError, FileNotFoundError):
-            return b"???"
-
-    # If contains_extra is False, return only the timestamp.
-    if not contains_extra:
-        return {"timestamp": get_datetime_str()}
-
-    # Otherwise, return detailed metadata.
-    return {"hostname"   : socket.gethostname(),
-            "username"   : get_username(),
-            "platform"   : platform.platform(),
-            "timestamp"  : get_datetime_str(),
-            "python_ver" : platform.python_version(),
-            "git_hash"   : get_git_hash(),
-            "git_changed": get_git_changed()}
-
-
 def from_20260105_format(data_dict: dict) -> YadOptArgs | None:
     """
     Restore a parsed command line arguments from a legacy TOML file (2026.01.05 format).
@@ -321,17 +560,19 @@ def from_20260105_format(data_dict: dict) -> YadOptArgs | None:
         return None
 
     # Extract the argv from the dictionary and check its type.
-    argv = data_dict["YadOptArgs"]["argv"]
+    if not isinstance(data_dict["YadOptArgs"], dict):
+        return None
+    argv = data_dict["YadOptArgs"].get("argv")
     if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
         return None
 
     # Extract the docstr from the dictionary and check its type.
-    docstr = data_dict["YadOptArgs"]["docstr"]
+    docstr = data_dict["YadOptArgs"].get("docstr")
     if not isinstance(docstr, str):
         return None
 
     # Parse the argument vector using the docstr.
-    return parse(docstr, argv[1:])
+    return parse_internal(docstr, argv[1:])
 
 
 # vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,200 @@
+"""
+yadopt.sharedmem - zero-copy transfer of large lists to worker processes via shared memory.
+
+Large lists of strings or paths in parsed command line arguments are encoded as blobs (see
+"yadopt.blob") in shared memory segments. The returned sequences are pickled as the names of
+the segments, so sending the arguments to a process pool costs a few bytes for each list, and
+each worker maps a segment only once and decodes items lazily without copying the blob.
+
+The process that created the segments owns them: the segments are unlinked by "release_memory"
+or when the process exits. Workers never unlink the segments.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import atexit
+import multiprocessing
+import os
+import sys
+import threading
+
+from multiprocessing import resource_tracker, shared_memory
+
+# For type hinting.
+from typing import Any
+
+# Import custom modules.
+from .blob      import BlobSequence, encode_blob, is_blob_candidate
+from .datamodel import YadOptArgs, replace, untracked
+from .errors    import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["share_memory", "release_memory", "SharedBlobSequence", "SHARE_THRESHOLD"]
+
+# Default minimum length of lists to be placed in shared memory.
+SHARE_THRESHOLD: int = 1024
+
+# Map from segment name to the sequence on it, for both created and attached segments of this process.
+SEGMENTS: dict[str, SharedBlobSequence] = {}
+SEGMENTS_LOCK: threading.Lock = threading.Lock()
+
+
+class SharedBlobSequence(BlobSequence):
+    """
+    Read-only sequence of strings or paths backed by a blob in a shared memory segment.
+    This sequence is pickled as the name of the segment.
+    """
+    def __init__(self, shm: shared_memory.SharedMemory, owner_pid: int | None = None) -> None:
+        """
+        Constructor.
+
+        Args:
+            shm       (SharedMemory): [IN] Shared memory segment that contains the blob.
+            owner_pid (int | None)  : [IN] Identifier of the process that owns the segment, or None if attached.
+        """
+        super().__init__(shm.buf, owner=shm)
+        self.name     : str        = shm.name
+        self.owner_pid: int | None = owner_pid
+
+    def __reduce__(self) -> tuple:
+        """
+        This sequence is pickled as the name of the segment.
+        """
+        return (attach_memory, (self.name,))
+
+    def close(self) -> None:
+        """
+        Release the views on the segment and close it. The sequence cannot be used after closing,
+        and the segment is unlinked if this process owns it.
+        """
+        for view in (self._data_, self._offsets_):
+            if isinstance(view, memoryview):
+                view.release()
+        try:
+            self._owner_.close()
+        except BufferError:
+            pass
+        if self.owner_pid == os.getpid():
+            unlink_memory(self._owner_)
+
+
+def share_memory(args: YadOptArgs, threshold: int = SHARE_THRESHOLD) -> YadOptArgs:
+    """
+    Returns a copy of the parsed command line arguments where lists of strings or paths with
+    the given length or longer are placed in shared memory. The copy can be sent to worker
+    processes, for example, by "multiprocessing.Pool", without pickling the lists.
+
+    Args:
+        args      (YadOptArgs): [IN] Parsed command line arguments.
+        threshold (int)       : [IN] Minimum length of lists to be placed in shared memory.
+
+    Returns:
+        (YadOptArgs): Parsed command line arguments with the shared lists.
+    """
+    source: Any = untracked(args)
+    names: list[str] = [name for names in getattr(source, "_groups_", {}).values() for name in names]
+
+    changes: dict[str, SharedBlobSequence] = {}
+    for name in names:
+        value: Any = getattr(source, name, None)
+        if (not isinstance(value, SharedBlobSequence)) and is_blob_candidate(value, threshold):
+            changes[name] = create_memory(value)
+
+    return replace(source, **changes) if changes else source
+
+
+def release_memory(args: YadOptArgs) -> None:
+    """
+    Unlink the shared memory segments of the given arguments created by this process. Processes
+    that already mapped the segments can still read them, but no more processes can attach to
+    them. Call this function after the workers received the arguments, or rely on the automatic
+    release at exit.
+
+    Args:
+        args (YadOptArgs): [IN] Parsed command line arguments returned by "share_memory".
+    """
+    source: Any = untracked(args)
+    for name in (name for names in getattr(source, "_groups_", {}).values() for name in names):
+        value: Any = getattr(source, name, None)
+        if isinstance(value, SharedBlobSequence) and (value.owner_pid == os.getpid()):
+            unlink_memory(value._owner_)  # pylint: disable=protected-access
+
+
+def create_memory(items: Any) -> SharedBlobSequence:
+    """
+    Create a shared memory segment that contains the given items as a blob.
+    """
+    chunks: list[bytes] = encode_blob(items)
+    shm: shared_memory.SharedMemory = shared_memory.SharedMemory(create=True, size=max(1, sum(map(len, chunks))))
+
+    # Write the chunks to the segment. The buffer is None only after the segment is closed.
+    buffer: memoryview | None = shm.buf
+    assert buffer is not None, "The shared memory segment is closed."
+    position: int = 0
+    for chunk in chunks:
+        buffer[position:position + len(chunk)] = chunk
+        position += len(chunk)
+
+    sequence: SharedBlobSequence = SharedBlobSequence(shm, owner_pid=os.getpid())
+    with SEGMENTS_LOCK:
+        SEGMENTS[shm.name] = sequence
+
+    return sequence
+
+
+def attach_memory(name: str) -> SharedBlobSequence:
+    """
+    Returns the sequence on the shared memory segment of the given name. A segment is attached
+    only once in each process, and processes forked after the creation use the inherited mapping.
+
+    Args:
+        name (str): [IN] Name of the shared memory segment.
+
+    Returns:
+        (SharedBlobSequence): Sequence on the segment.
+    """
+    with SEGMENTS_LOCK:
+        if (sequence := SEGMENTS.get(name)) is not None:
+            return sequence
+
+        # Attached segments must not be tracked by the resource tracker of the worker, because the
+        # tracker unlinks the tracked segments when the worker exits (Python 3.12 or earlier). Child
+        # processes of multiprocessing share the tracker of the parent, where registration is idempotent.
+        try:
+            if sys.version_info >= (3, 13):
+                # pylint: disable-next=unexpected-keyword-arg
+                shm = shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+            else:
+                shm = shared_memory.SharedMemory(name=name)
+                if multiprocessing.parent_process() is None:
+                    resource_tracker.unregister(getattr(shm, "_name"), "shared_memory")
+        except FileNotFoundError as error:
+            raise YadOptError.CannotAttachMemory(name=name) from error
+
+        sequence = SEGMENTS[name] = SharedBlobSequence(shm)
+
+    return sequence
+
+
+def unlink_memory(shm: shared_memory.SharedMemory) -> None:
+    """
+    Unlink the given shared memory segment if it still exists.
+    """
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+@atexit.register
+def close_all_memory() -> None:
+    """
+    Close all segments of this process, and unlink the segments owned by this process.
+    """
+    with SEGMENTS_LOCK:
+        for sequence in SEGMENTS.values():
+            sequence.close()
+        SEGMENTS.clear()
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -0,0 +1,177 @@
+"""
+yadopt.store - content-addressed store of saved command line arguments.
+
+In the store mode of "yadopt.save", the groups and values of the arguments are encoded in the
+binary format without metadata, and written only once under "<store>/objects/<hash>", where the
+hash is the SHA-256 digest of the encoded payload. Therefore, runs with identical arguments share
+one object. The saved file keeps only the per-run metadata and the reference to the object, for
+example, "Object(store/objects/<hash>)", which is resolved by "yadopt.load" transparently.
+The saved files referring to each object are registered in "<store>/refs/<hash>", so that
+"gc_store" can find the objects that are no longer referenced.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import hashlib
+import io
+import os
+import threading
+
+# For type hinting.
+from collections.abc import Collection
+
+# Import custom modules.
+from .binfmt   import BinaryContents, dump_binary, load_binary
+from .compress import open_file
+from .dtypes   import Path
+from .errors   import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["put_object", "register_ref", "resolve_object", "gc_store", "OBJECT_KEY"]
+
+# Metadata key of the reference to the object. The key is reserved so that metadata providers do not overwrite it.
+OBJECT_KEY: str = "_yadopt_object_"
+
+
+def put_object(store: str | Path, path_ref: Path, contents: BinaryContents) -> str:
+    """
+    Write the groups and values of the given contents to the store unless the same object exists.
+
+    Args:
+        store    (str | Path)    : [IN] Root directory of the store.
+        path_ref (Path)          : [IN] Path to the saved file that refers to the object.
+        contents (BinaryContents): [IN] Contents to be stored. The metadata is not stored.
+
+    Returns:
+        (str): Reference to the object relative to the directory of the saved file.
+    """
+    # Encode the payload. The binary format is deterministic, so identical arguments have the same digest.
+    buffer: io.BytesIO = io.BytesIO()
+    dump_binary(BinaryContents(contents.class_name, {}, contents.groups, contents.values), buffer)
+    payload: bytes = buffer.getvalue()
+
+    path_obj: Path = Path(store) / "objects" / hashlib.sha256(payload).hexdigest()
+
+    # Write the object atomically. Concurrent writers of the same object write the same bytes.
+    if not path_obj.exists():
+        path_obj.parent.mkdir(parents=True, exist_ok=True)
+        path_tmp: Path = path_obj.with_name(f".{os.getpid()}.{threading.get_ident()}.tmp.{path_obj.name}")
+        try:
+            with open(path_tmp, "wb") as ofp:
+                ofp.write(payload)
+            os.replace(path_tmp, path_obj)
+        finally:
+            if path_tmp.exists():
+                path_tmp.unlink()
+
+    return f"Object({os.path.relpath(path_obj, path_ref.absolute().parent)})"
+
+
+def register_ref(store: str | Path, path_ref: Path, reference: str) -> None:
+    """
+    Register the saved file to the list of the files referring to the object.
+
+    Args:
+        store     (str | Path): [IN] Root directory of the store.
+        path_ref  (Path)      : [IN] Path to the saved file that refers to the object.
+        reference (str)       : [IN] Reference to the object returned by "put_object".
+    """
+    path_refs: Path = Path(store) / "refs" / Path(reference[7:-1]).name
+    path_refs.parent.mkdir(parents=True, exist_ok=True)
+
+    # Do nothing if the saved file is already registered.
+    line: str = str(path_ref.absolute()) + "\n"
+    if path_refs.exists() and line in path_refs.read_text().splitlines(keepends=True):
+        return
+
+    # Append the line by one system call, so that concurrent registrations are not interleaved.
+    fd: int = os.open(path_refs, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
+
+
+def resolve_object(path_ref: Path, contents: BinaryContents, groups: Collection[str] | None = None,
+                   keys: Collection[str] | None = None) -> BinaryContents:
+    """
+    Replace the contents of the saved file with the referred object if the saved file is in the store mode.
+
+    Args:
+        path_ref (Path)                   : [IN] Path to the saved file.
+        contents (BinaryContents)         : [IN] Contents of the saved file.
+        groups   (Collection[str] | None) : [IN] Groups to be loaded. All groups are loaded if None.
+        keys     (Collection[str] | None) : [IN] Keys to be loaded. All keys are loaded if None.
+
+    Returns:
+        (BinaryContents): Contents of the object with the metadata of the saved file.
+    """
+    reference: object = contents.metadata.get(OBJECT_KEY)
+    if not (isinstance(reference, str) and reference.startswith("Object(") and reference.endswith(")")):
+        return contents
+
+    try:
+        with open(path_ref.parent / reference[7:-1], "rb") as ifp:
+            contents_obj: BinaryContents = load_binary(ifp, groups, keys)
+    except OSError as error:
+        raise YadOptError.InvalidBinaryFile(reason=f"Cannot open the object file {reference[7:-1]}.") from error
+
+    return BinaryContents(contents_obj.class_name, contents.metadata, contents_obj.groups, contents_obj.values)
+
+
+def gc_store(store: str | Path) -> int:
+    """
+    Remove the objects that are no longer referenced by any saved file. A saved file that was deleted
+    or overwritten does not refer to the object anymore. This function should not run concurrently
+    with "yadopt.save" writing to the same store.
+
+    Args:
+        store (str | Path): [IN] Root directory of the store.
+
+    Returns:
+        (int): Number of removed objects.
+    """
+    dir_objects: Path = Path(store) / "objects"
+    dir_refs   : Path = Path(store) / "refs"
+
+    if not dir_objects.is_dir():
+        return 0
+
+    count: int = 0
+    for path_obj in sorted(dir_objects.iterdir()):
+
+        # Skip temporary files being written.
+        if path_obj.name.startswith("."):
+            continue
+
+        # List the saved files that still refer to the object.
+        path_refs: Path = dir_refs / path_obj.name
+        lines: list[str] = path_refs.read_text().splitlines() if path_refs.exists() else []
+        alive: list[str] = [line for line in lines if is_referring(Path(line), path_obj.name)]
+
+        # Remove the object if no file refers to it, otherwise drop the stale registrations.
+        if not alive:
+            path_obj.unlink()
+            path_refs.unlink(missing_ok=True)
+            count += 1
+        elif len(alive) < len(lines):
+            path_tmp: Path = path_refs.with_name(f".{os.getpid()}.tmp.{path_refs.name}")
+            path_tmp.write_text("".join(line + "\n" for line in alive))
+            os.replace(path_tmp, path_refs)
+
+    return count
+
+
+def is_referring(path_ref: Path, digest: str) -> bool:
+    """
+    Returns True if the saved file exists and refers to the object of the given digest. The digest
+    appears in the saved file as it is for all formats, so the file is checked without decoding.
+    """
+    try:
+        with open_file(path_ref, "rb") as ifp:
+            return f"{digest})".encode() in ifp.read()
+    except (OSError, EOFError):
+        return False
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
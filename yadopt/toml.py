@@ -4,12 +4,15 @@ yadopt.toml - TOML parser and writer for YadOpt
 from __future__ import annotations
 
 # Import standard libraries.
+import functools
 import importlib
 import json
+import re
 import sys
 
 # For type hinting.
-from typing import Any, TextIO
+from collections.abc import Iterator
+from typing          import IO, Any, TextIO
 
 # Import custom modules.
 from .errors import YadOptError
@@ -17,61 +20,106 @@ from .errors import YadOptError
 # Declare published functions and variables.
 __all__ = ["dump_toml", "load_toml"]
 
+# Pattern of bare keys in TOML. Other keys must be quoted.
+PATTERN_BARE_KEY: re.Pattern = re.compile(r"[A-Za-z0-9_-]+")
 
-def dump_toml(data_dict: dict[str, Any]) -> str:
+# Approximate size of a chunk written to the output file at once.
+CHUNK_SIZE: int = 1 << 16
+
+# Number of list items converted at once.
+LIST_BATCH_SIZE: int = 4096
+
+
+def dump_toml(data_dict: dict[str, Any], ofp: TextIO | None = None) -> str | None:
     """
-    Convert the given YadOptArgs instance to a TOML string.
+    Convert the given dictionary to a TOML string. If a file object is given, the TOML string is
+    written to the file object in chunks instead of being built in memory.
 
     Args:
         data_dict (dict[str, Any]): [IN] Input dictionary.
+        ofp       (TextIO | None) : [IN] Output file object opened in text mode.
 
     Returns:
-        (str): TOML string.
+        (str | None): TOML string, or None if the file object is given.
+
+    Examples:
+        >>> print(dump_toml({"Options": {"lr": 0.1, "cpu_only": False}, "My group": {"files": ["a", "b"]}}))
+        [Options]
+        lr = 0.1
+        cpu_only = false
+        <BLANKLINE>
+        ["My group"]
+        files = ["a", "b"]
+        <BLANKLINE>
     """
     # Raise an error if TOML is not supported by Python.
     check_toml_supported()
 
-    # Initialize the output string.
-    output: str = ""
+    # Case 1: Build the TOML string in memory.
+    if ofp is None:
+        return "".join(iter_toml_chunks(data_dict))
 
-    for group_name, dict_key_value in data_dict.items():
+    # Case 2: Write small chunks to the file object after concatenating them to a moderate size.
+    buffer: list[str] = []
+    buffer_size: int = 0
+    for chunk in iter_toml_chunks(data_dict):
+        buffer.append(chunk)
+        buffer_size += len(chunk)
+        if buffer_size >= CHUNK_SIZE:
+            ofp.write("".join(buffer))
+            (buffer, buffer_size) = ([], 0)
+    ofp.write("".join(buffer))
 
-        # Add group name to the output string.
-        output += f"[{group_name}]\n"
+    return None
 
-        # Add key-value pairs to the output string.
-        for key, val in dict_key_value.items():
-            output += f"{key} = {to_toml_value(val)}\n"
 
-        # Add a newline after each group for readability.
-        output += "\n"
+def iter_toml_chunks(data_dict: dict[str, Any]) -> Iterator[str]:
+    """
+    Generate the TOML expression of the given dictionary chunk by chunk.
 
-    return output.strip()
+    Args:
+        data_dict (dict[str, Any]): [IN] Input dictionary.
 
+    Returns:
+        (Iterator[str]): Chunks of the TOML string.
+    """
+    for index, (group_name, dict_key_value) in enumerate(data_dict.items()):
 
-def load_toml(ifp: TextIO) -> dict[str, Any]:
+        # Add a newline between groups for readability, and the group name.
+        yield ("\n" if index > 0 else "") + f"[{to_toml_key(group_name)}]\n"
+
+        # Add key-value pairs. Lists are converted in batches to avoid building huge strings.
+        for key, val in dict_key_value.items():
+            if isinstance(val, list) and len(val) > LIST_BATCH_SIZE:
+                yield f"{to_toml_key(key)} = ["
+                for pos in range(0, len(val), LIST_BATCH_SIZE):
+                    yield (", " if pos > 0 else "") + to_toml_value(val[pos:pos+LIST_BATCH_SIZE])[1:-1]
+                yield "]\n"
+            else:
+                yield f"{to_toml_key(key)} = {to_toml_value(val)}\n"
+
+
+def load_toml(ifp: IO[bytes]) -> dict[str, Any]:
     """
     Load a TOML file and return its contents as a dictionary.
 
     Args:
-        ifp (str | Path | IO): [IN] Input file path or file-like object.
+        ifp (IO[bytes]): [IN] Input file object opened in binary mode.
 
     Returns:
         (dict[str, Any]): Dictionary representation of the TOML file.
     """
-    # Raise an error if TOML is not supported by Python.
-    check_toml_supported()
-
-    # Load the TOML module.
-    tomllib = load_tomllib()
+    # Load the TOML module, or raise an error if TOML is not supported by Python.
+    tomllib = get_tomllib()
 
     # Load the TOML file.
     return tomllib.load(ifp)
 
 
+@functools.cache
 def load_tomllib() -> Any:
     """
-    Load module for loading TOML file.
+    Load module for loading TOML file. The result is cached.
     """
     # Determine the module name to load.
     module_name: str = "tomllib" if (sys.version_info >= (3, 11)) else "tomli"
@@ -80,6 +128,16 @@ def load_tomllib() -> Any:
     return importlib.import_module(module_name)
 
 
+def get_tomllib() -> Any:
+    """
+    Returns the module for loading TOML file, or raise an error if TOML is not supported.
+    """
+    try:
+        return load_tomllib()
+    except ImportError as e:
+        raise YadOptError.CannotLoadTomllib() from e
+
+
 def check_toml_supported() -> bool:
     """
     Returns True if the current Python supports TOML.
@@ -87,14 +145,21 @@ def check_toml_supported() -> bool:
     Returns:
         (bool): True if the runtime Python supports TOML.
     """
-    try:
-        load_tomllib()
-    except ImportError as e:
-        raise YadOptError.CannotLoadTomllib() from e
-
+    get_tomllib()
     return True
 
 
+def to_toml_key(key: str) -> str:
+    """
+    Convert the given key to a string expression in a TOML file. Keys that are not bare keys,
+    for example, keys containing whitespaces, are quoted.
+
+    Args:
+        key (str): [IN] Input key.
+    """
+    return key if PATTERN_BARE_KEY.fullmatch(key) else json.dumps(key, ensure_ascii=False)
+
+
 def to_toml_value(value: Any) -> str:
     """
     Convert the given value to a string expression in a TOML file.
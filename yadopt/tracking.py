@@ -0,0 +1,129 @@
+"""
+yadopt.tracking - record which values of parsed command line arguments a program actually reads.
+
+A tracked instance belongs to a subclass of the original class, where each field is replaced with
+a data descriptor that records the access before returning the value. Functions that read all values
+by design, such as "yadopt.to_dict", "yadopt.save", "yadopt.fingerprint", and the comparison, read
+the original instance instead, so they are not recorded as accesses.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import atexit
+import dataclasses
+import functools
+import sys
+
+# For type hinting.
+from typing import Any
+
+# Import custom modules.
+from .datamodel import YadOptArgs, untracked
+from .errors    import YadOptError
+
+# Declare published functions and variables.
+__all__ = ["track", "accessed"]
+
+# Keys of the attributes of tracked instances.
+KEY_SOURCE  : str = "_yadopt_source_"
+KEY_ACCESSED: str = "_yadopt_accessed_"
+
+
+class TrackedField:
+    """
+    Data descriptor that records the access to a field.
+    """
+    def __init__(self, name: str) -> None:
+        """
+        Constructor.
+
+        Args:
+            name (str): [IN] Name of the field.
+        """
+        self.name: str = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        """
+        Record the access and returns the value.
+        """
+        if instance is None:
+            return self
+        attrs: dict[str, Any] = instance.__dict__
+        attrs[KEY_ACCESSED][self.name] = None
+        return attrs[self.name]
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        """
+        Set the value. This is called only for non-frozen instances.
+        """
+        instance.__dict__[self.name] = value
+
+
+def track(args: YadOptArgs, report: bool = False) -> YadOptArgs:
+    """
+    Returns a tracked copy of the parsed command line arguments that records the accessed names.
+
+    Args:
+        args   (YadOptArgs): [IN] Parsed command line arguments.
+        report (bool)      : [IN] If True, the accessed and unused names are reported to stderr at exit.
+
+    Returns:
+        (YadOptArgs): Tracked instance that has the same values as the given arguments.
+    """
+    if not (isinstance(args, YadOptArgs) and dataclasses.is_dataclass(args)):
+        raise YadOptError.CannotTrack(cls_name=args.__class__.__name__)
+
+    source: Any = untracked(args)
+
+    # Create an instance of the tracked class without calling the constructor.
+    tracked: Any = object.__new__(get_tracked_class(source.__class__))
+    tracked.__dict__.update(source.__dict__)
+    tracked.__dict__[KEY_SOURCE] = source
+    tracked.__dict__[KEY_ACCESSED] = {}
+
+    if report:
+        atexit.register(report_accessed, tracked)
+
+    return tracked
+
+
+def accessed(args: YadOptArgs) -> list[str]:
+    """
+    Returns the names read from the tracked instance in the order of the first access.
+
+    Args:
+        args (YadOptArgs): [IN] Tracked instance returned by "track".
+
+    Returns:
+        (list[str]): Accessed names.
+    """
+    if KEY_ACCESSED not in getattr(args, "__dict__", {}):
+        raise YadOptError.CannotTrack(cls_name=args.__class__.__name__)
+    return list(args.__dict__[KEY_ACCESSED])
+
+
+@functools.cache
+def get_tracked_class(cls: type) -> type:
+    """
+    Returns the subclass of the given class whose fields are replaced with the tracked fields.
+    The subclass is created only once for each class.
+    """
+    namespace: dict[str, Any] = {field.name: TrackedField(field.name) for field in dataclasses.fields(cls)}
+    namespace["__repr__"] = lambda self: repr(untracked(self))
+    namespace["__module__"] = cls.__module__
+    return type(cls.__name__, (cls,), namespace)
+
+
+def report_accessed(args: YadOptArgs) -> None:
+    """
+    Print the accessed and unused names of the tracked instance to stderr.
+    """
+    names_all: list[str] = [field.name for field in dataclasses.fields(args)]  # type: ignore[arg-type]
+    names_accessed: list[str] = accessed(args)
+    names_unused: list[str] = [name for name in names_all if name not in args.__dict__[KEY_ACCESSED]]
+    print(f"yadopt: {len(names_accessed)} of {len(names_all)} options are accessed.", file=sys.stderr)
+    print(f"  - accessed: {', '.join(names_accessed) or '(none)'}", file=sys.stderr)
+    print(f"  - unused  : {', '.join(names_unused) or '(none)'}", file=sys.stderr)
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -5,7 +5,9 @@ from __future__ import annotations
 
 # Import standard libraries.
 import ast
+import copy
 import dataclasses
+import functools
 
 # For type hinting.
 from typing          import Any
@@ -21,7 +23,7 @@ from .posarg import PosSpec
 from .optarg import OptSpec
 
 # Declare published functions and variables.
-__all__ = ["TypedArgVec", "TypeAssigner", "DTYPE_HINTS"]
+__all__ = ["TypedArgVec", "TypeAssigner", "ConverterPlan", "DTYPE_HINTS"]
 
 
 @dataclasses.dataclass
@@ -49,21 +51,69 @@ class TypedArgVec:
             assert n1 in self.opt_args or n2 in self.opt_args, f"Optional argument '{n1}' is missing in opt_args."
 
 
+class ConverterPlan:
+    """
+    Type functions and typed default values of a set of declarations. The plan is computed once
+    for each compiled docstring, so that parsing converts only the values given by the user.
+    """
+    def __init__(self, parsed_decls: ParsedDecls) -> None:
+        """
+        Constructor.
+
+        Args:
+            parsed_decls (ParsedDecls): [IN] Parsed declaration information.
+        """
+        self.parsed_decls: ParsedDecls    = parsed_decls
+        self.defaults    : dict[str, Any] = {}
+
+    @functools.cached_property
+    def converters(self) -> dict[str, Callable]:
+        """
+        Returns the type functions of all arguments and options. The table is computed when it is
+        used for the first time, so that an invalid type name raises an error at the same timing as before.
+        """
+        return TypeAssigner.get_converters(self.parsed_decls)
+
+    def default(self, name: str, value: str | None) -> Any:
+        """
+        Returns the typed default value of the given option. The default value is converted when
+        it is used for the first time, so that an invalid default value raises an error only when
+        it is used, as before. Mutable values are copied, so that parsed results never share them.
+
+        Args:
+            name  (str)       : [IN] Option name.
+            value (str | None): [IN] String expression of the default value.
+
+        Returns:
+            (Any): Typed default value.
+        """
+        # Concurrent parses may convert the same default value twice, but the results are the same.
+        if name not in self.defaults:
+            self.defaults[name] = TypeAssigner.convert(self.converters[name], value)
+
+        typed: Any = self.defaults[name]
+        return typed if isinstance(typed, IMMUTABLE_TYPES) else copy.deepcopy(typed)
+
+
 class TypeAssigner:
     """
     Class for assigning types to the parsed argument vector.
     """
-    def __init__(self, argvec: DefaultResolvedArgVec, parsed_decls: ParsedDecls, verbose: bool) -> None:
+    def __init__(self, argvec: DefaultResolvedArgVec, parsed_decls: ParsedDecls, verbose: bool,
+                 plan: ConverterPlan | None = None) -> None:
         """
         Constructor.
 
         Args:
-            argvec      (DefaultResolvedArgVec): [IN] Argument vector with default values filled in.
-            parsed_decls (ParsedDecls)         : [IN] Parsed declaration information.
+            argvec       (DefaultResolvedArgVec): [IN] Argument vector with default values filled in.
+            parsed_decls (ParsedDecls)          : [IN] Parsed declaration information.
+            verbose      (bool)                 : [IN] Displays verbose messages that are useful for debugging.
+            plan         (ConverterPlan | None) : [IN] Precomputed type functions and typed default values.
         """
-        self.argvec     : DefaultResolvedArgVec = argvec
+        self.argvec      : DefaultResolvedArgVec = argvec
         self.parsed_decls: ParsedDecls           = parsed_decls
-        self.verbose     : bool                   = verbose
+        self.verbose     : bool                  = verbose
+        self.plan        : ConverterPlan         = ConverterPlan(parsed_decls) if plan is None else plan
 
     def assign_types(self) -> TypedArgVec:
         """
@@ -73,15 +123,15 @@ class TypeAssigner:
             (TypedArgVec): Argument vector with typed values.
         """
         return TypedArgVec(
-            pos_args = self.set_typed_value(self.argvec.pos_args, self.parsed_decls.posargs, self.verbose),
-            opt_args = self.set_typed_value(self.argvec.opt_args, self.parsed_decls.optargs, self.verbose),
+            pos_args = self.set_typed_value(self.argvec.pos_args, self.parsed_decls.posargs),
+            opt_args = self.set_typed_value(self.argvec.opt_args, self.parsed_decls.optargs),
         )
 
-    @staticmethod
-    def set_typed_value(src_dict: dict, arg_decls: list[PosArgDecl] | list[OptArgDecl], verbose: bool) -> dict:
+    def set_typed_value(self, src_dict: dict, arg_decls: list[PosArgDecl] | list[OptArgDecl]) -> dict:
         """
-        Get typed value.
+        Get typed value. Values filled from the declared default values are taken from the plan.
         """
+        verbose: bool = self.verbose
         if verbose:
             print("TypeAssigner.set_typed_value():")
 
@@ -93,42 +143,92 @@ class TypeAssigner:
             if verbose:
                 print(" |- arg_decl =", arg_decl)
 
-            #
-            spec: PosSpec | OptSpec = arg_decl.spec
-            desc: ParsedDesc        = arg_decl.desc
-
             # Do nothing if the entry is not in the value dictionary.
-            if spec.name not in dst_dict:
+            if arg_decl.spec.name not in dst_dict:
                 continue
 
-            # Case 1: Option without value.
-            if isinstance(spec, OptSpec) and (spec.val_name is None):
-                dst_dict[spec.name] = strtobool(dst_dict[spec.name])
+            # Use the typed default value if the value is the declared default value.
+            name: str = arg_decl.spec.name
+            if name in self.argvec.defaulted:
+                dst_dict[name] = self.plan.default(name, dst_dict[name])
                 continue
 
-            # Case 2: None value (occurs by default value resolver).
-            if dst_dict[spec.name] is None:
-                continue
+            # Convert the value with the type function of the declaration.
+            dst_dict[name] = TypeAssigner.convert(self.plan.converters[name], dst_dict[name])
 
-            # Case 3: If the value looks like None, set real None.
-            if dst_dict[spec.name] == "None":
-                dst_dict[spec.name] = None
-                continue
+        return dst_dict
 
-            # Get type function.
-            func_dtype: Callable = TypeAssigner.type_func(spec.name,
-                                                          spec.val_name if isinstance(spec, OptSpec) else None,
-                                                          desc.type_dh)
+    @staticmethod
+    def get_converters(parsed_decls: ParsedDecls) -> dict[str, Callable]:
+        """
+        Returns the type functions of all arguments and options, including the alternative names.
+        The returned table is stored in YadOptArgs to convert values updated by "yadopt.replace".
 
-            # If the target value is list of string, then apply the type function to the list contents.
-            if isinstance(dst_dict[spec.name], list):
-                dst_dict[spec.name] = [func_dtype(v) for v in dst_dict[spec.name]]
+        Args:
+            parsed_decls (ParsedDecls): [IN] Parsed declaration information.
 
-            # Else, normally apply type function to the value.
-            else:
-                dst_dict[spec.name] = func_dtype(dst_dict[spec.name])
+        Returns:
+            (dict[str, Callable]): Map from name to type function.
+        """
+        converters: dict[str, Callable] = {}
+        arg_decls: list[PosArgDecl | OptArgDecl] = [*parsed_decls.posargs, *parsed_decls.optargs]
+        for arg_decl in arg_decls:
+            converters[arg_decl.spec.name] = TypeAssigner.converter(arg_decl)
+            if isinstance(arg_decl.spec, OptSpec) and (arg_decl.spec.name_alt is not None):
+                converters[arg_decl.spec.name_alt] = converters[arg_decl.spec.name]
+        return converters
 
-        return dst_dict
+    @staticmethod
+    def converter(arg_decl: PosArgDecl | OptArgDecl) -> Callable:
+        """
+        Returns the type function of the given declaration.
+
+        Args:
+            arg_decl (PosArgDecl | OptArgDecl): [IN] Declaration of an argument or an option.
+
+        Returns:
+            (Callable): Type function.
+        """
+        spec: PosSpec | OptSpec = arg_decl.spec
+        desc: ParsedDesc        = arg_decl.desc
+
+        # Case 1: Option without value.
+        if isinstance(spec, OptSpec) and (spec.val_name is None):
+            return flagtobool
+
+        # Case 2: Get the type function from the type hints.
+        return TypeAssigner.type_func(spec.name, spec.val_name if isinstance(spec, OptSpec) else None, desc.type_dh)
+
+    @staticmethod
+    def convert(func_dtype: Callable, value: Any) -> Any:
+        """
+        Convert the string expression of a value with the type function.
+
+        Args:
+            func_dtype (Callable): [IN] Type function.
+            value      (Any)     : [IN] String expression of a value, or a list of them.
+
+        Returns:
+            (Any): Typed value.
+        """
+        # Case 1: Option without value.
+        if func_dtype is flagtobool:
+            return flagtobool(value)
+
+        # Case 2: None value (occurs by default value resolver).
+        if value is None:
+            return None
+
+        # Case 3: If the value looks like None, set real None.
+        if value == "None":
+            return None
+
+        # Case 4: If the target value is list of string, then apply the type function to the list contents.
+        if isinstance(value, list):
+            return [func_dtype(v) for v in value]
+
+        # Otherwise, normally apply type function to the value.
+        return func_dtype(value)
 
     @staticmethod
     def type_func(name: str, val_name: str | None, type_dsc: str | None) -> Callable:
@@ -224,6 +324,21 @@ def strtobool(s: str | None) -> bool:
     raise YadOptError.InvalidBoolValue(value=s)
 
 
+def flagtobool(s: str | None) -> bool:
+    """
+    Type function of options without value. This function converts values in the same way as
+    "strtobool", but it is a distinct function so that "TypeAssigner.convert" can identify flags:
+    a None value of a flag is converted to False, while None values of the other options are kept.
+
+    Args:
+        s (str | None): [IN] Input string.
+
+    Returns:
+        (bool): Corresponding boolean value.
+    """
+    return strtobool(s)
+
+
 def strtostr(s: str) -> str:
     """
     Convert string expression to string.
@@ -252,6 +367,9 @@ def strtostr(s: str) -> str:
         return str(s)
 
 
+# Types of values that can be shared by parsed results without copying.
+IMMUTABLE_TYPES: tuple[type, ...] = (type(None), bool, int, float, complex, str, bytes, Path)
+
 # Define a map from data type string to data type.
 DTYPE_HINTS: dict[str, Callable] = {
     # Booleans.
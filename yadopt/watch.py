@@ -0,0 +1,177 @@
+"""
+yadopt.watch - live-reloading parsed command line arguments backed by a watched file.
+
+The watcher keeps the (mtime, size, inode) of the watched file, and calls "os.stat" at most once
+per interval when the arguments are requested. The file is loaded by "yadopt.load" only if the
+status changed, and the new arguments are swapped in by a single assignment. Therefore, readers
+never see partially updated arguments, and each reader keeps a consistent instance as long as it
+holds a reference to it.
+"""
+from __future__ import annotations
+
+# Import standard libraries.
+import dataclasses
+import os
+import threading
+import time
+
+# For type hinting.
+from collections.abc import Callable
+from typing          import Any
+
+# Import custom modules.
+from .datamodel import YadOptArgs, replace
+from .dtypes    import Path
+from .errors    import YadOptErrorBase
+from .serialize import load
+from .yadopt    import parse_internal
+
+# Declare published functions and variables.
+__all__ = ["watch", "ArgsWatcher", "WATCH_INTERVAL"]
+
+# Default minimum interval between two checks of the watched file in seconds.
+WATCH_INTERVAL: float = 1.0
+
+# Type of the change callback. The callback receives the old and the new arguments.
+ChangeCallback = Callable[[YadOptArgs, YadOptArgs], Any]
+
+
+def watch(path: str | Path, docstr: str | None = None, argv: list[str] | None = None,
+          interval: float = WATCH_INTERVAL) -> ArgsWatcher:
+    """
+    Returns a watcher of the file written by "yadopt.save". See "ArgsWatcher" for details.
+
+    Args:
+        path     (str | Path)       : [IN] Path to the watched file.
+        docstr   (str | None)       : [IN] Docstring whose defaults are overwritten by the values in the file.
+                                           The values in the file are used as they are if None.
+        argv     (list[str] | None) : [IN] Argument vector parsed with the docstring. Empty if None.
+        interval (float)            : [IN] Minimum interval between two checks of the file in seconds.
+
+    Returns:
+        (ArgsWatcher): Watcher of the file.
+
+    Examples:
+        >>> watcher = watch("server.json", interval=5.0)  # doctest: +SKIP
+        >>> watcher.args.batch_size                       # doctest: +SKIP
+        32
+    """
+    return ArgsWatcher(path, docstr, argv, interval)
+
+
+class ArgsWatcher:  # pylint: disable=too-many-instance-attributes
+    """
+    Live-reloading parsed command line arguments backed by a watched file.
+    """
+    def __init__(self, path: str | Path, docstr: str | None = None, argv: list[str] | None = None,
+                 interval: float = WATCH_INTERVAL) -> None:
+        """
+        Constructor. The file is loaded once, and errors on the first load are raised.
+
+        Args:
+            path     (str | Path)       : [IN] Path to the watched file.
+            docstr   (str | None)       : [IN] Docstring whose defaults are overwritten by the values in the file.
+            argv     (list[str] | None) : [IN] Argument vector parsed with the docstring. Empty if None.
+            interval (float)            : [IN] Minimum interval between two checks of the file in seconds.
+        """
+        self.path     : Path                     = Path(path)
+        self.interval : float                    = interval
+        self.base     : YadOptArgs | None        = None if docstr is None else parse_internal(docstr, argv or [])
+        self.callbacks: list[ChangeCallback]     = []
+        self.error    : BaseException | None     = None
+        self.lock     : threading.Lock           = threading.Lock()
+        self.checked  : float                    = time.monotonic()
+        self.stat_key : tuple[int, int, int]     = stat_key(os.stat(self.path))
+        self.current  : YadOptArgs               = self.load()
+
+    @property
+    def args(self) -> YadOptArgs:
+        """
+        Returns the latest arguments. The file is checked if the interval has passed since the last check.
+        """
+        if time.monotonic() - self.checked >= self.interval:
+            self.poll()
+        return self.current
+
+    def on_change(self, callback: ChangeCallback) -> ChangeCallback:
+        """
+        Register a callback that is called with the old and the new arguments after they are swapped.
+        This method returns the callback as it is, so that it can be used as a decorator.
+
+        Args:
+            callback (ChangeCallback): [IN] Callback function.
+
+        Returns:
+            (ChangeCallback): The given callback.
+        """
+        self.callbacks.append(callback)
+        return callback
+
+    def poll(self) -> bool:
+        """
+        Check the watched file now, and reload it if its status changed. If the file cannot be
+        loaded, for example, while it is being written, the current arguments are kept, the error
+        is stored in "error", and the file is loaded again at the next check. Exceptions raised by
+        the change callbacks are also stored in "error", and the remaining callbacks are called.
+
+        Returns:
+            (bool): True if the arguments were updated.
+        """
+        # Only one thread checks the file, and the other threads use the current arguments.
+        # A thread that passes this check while another one is checking waits for it, and then
+        # finds that the status is unchanged.
+        if self.lock.locked():
+            return False
+
+        with self.lock:
+            self.checked = time.monotonic()
+
+            # Do nothing if the status of the file is unchanged.
+            try:
+                key: tuple[int, int, int] = stat_key(os.stat(self.path))
+            except OSError as error:
+                self.error = error
+                return False
+            if key == self.stat_key:
+                return False
+
+            try:
+                args_new: YadOptArgs = self.load()
+            except (YadOptErrorBase, OSError, ValueError, TypeError) as error:
+                self.error = error
+                return False
+
+            # Swap the arguments. The status is updated only after the successful load.
+            (args_old, self.current, self.stat_key, self.error) = (self.current, args_new, key, None)
+
+        # Errors in a callback are stored in "error" and do not stop the other callbacks, because
+        # the callbacks may run inside the "args" property of an unrelated reader.
+        for callback in self.callbacks:
+            try:
+                callback(args_old, args_new)
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                self.error = error
+
+        return True
+
+    def load(self) -> YadOptArgs:
+        """
+        Load the watched file, and overwrite the defaults of the docstring if given.
+        """
+        args_file: YadOptArgs = load(self.path)
+        if self.base is None:
+            return args_file
+
+        # Values in the file are converted by the type functions of the docstring if they are strings.
+        return replace(self.base, **{field.name: getattr(args_file, field.name)
+                                     for field in dataclasses.fields(args_file)})  # type: ignore[arg-type]
+
+
+def stat_key(stat: os.stat_result) -> tuple[int, int, int]:
+    """
+    Returns the modification time, the size, and the inode number of the file.
+    """
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+# vim: expandtab tabstop=4 shiftwidth=4 fdm=marker
@@ -10,6 +10,7 @@ import functools
 import inspect
 import sys
 import textwrap
+import threading
 import typing
 
 # For type hinting.
@@ -19,18 +20,26 @@ from typing          import Any
 # Import custom modules.
 from .argvec      import ArgVecParser, ParsedArgVec
 from .datacls     import dataclass_to_help_message
-from .datamodel   import YadOptArgs, make_yadoptargs_data
+from .datamodel   import YadOptArgs, make_yadoptargs_data, set_defaulted, untracked
 from .declaration import DeclarationContentsParser, ParsedDecls
 from .default     import DefaultValueResolver, DefaultResolvedArgVec
 from .dtypes      import Path
 from .errors      import YadOptError
+from .handoff     import parse_from_env, set_handoff_source
 from .helpmsg     import has_help_option_in_argv, print_help_message_and_exit
+from .journal     import journal_from_env
 from .section     import DeclarationContents, SectionLineSplitter
-from .typehint    import TypeAssigner, TypedArgVec
+from .typehint    import ConverterPlan, TypeAssigner, TypedArgVec
 
 # Declare published functions and variables.
 __all__ = ["parse", "wrap", "to_dict", "to_namedtuple", "get_group", "YadOptArgs"]
 
+# Cache of compiled docstrings, a map from dedented docstring to the parsed declarations,
+# the converter plan, and the group information.
+COMPILE_CACHE: dict[str, tuple[ParsedDecls, ConverterPlan, dict[str, list[str]]]] = {}
+COMPILE_CACHE_SIZE: int = 64
+COMPILE_CACHE_LOCK: threading.Lock = threading.Lock()
+
 
 # Type definition for yadopt.parse function.
 T = typing.TypeVar("T")
@@ -56,6 +65,30 @@ def parse(source: str | type[T] | None = None, argv: list[str] | None = None,
     Notes:
         This function relies heavily on the Design by Contract (DbC) paradigm.
     """
+    args: YadOptArgs | T = parse_internal(source, argv, exit_on_help, verbose)
+
+    # Record the parsed arguments to the run journal if enabled by the environment variable.
+    journal_from_env(args)  # type: ignore[arg-type]
+
+    return args
+
+
+def parse_internal(source: str | type[T] | None = None, argv: list[str] | None = None,
+                   exit_on_help: bool = True, verbose: bool = False) -> Any:
+    """
+    Same as "parse", but never records the run journal. This function is used by the internal
+    callers, for example, "yadopt.load" for legacy files and "yadopt.watch", so that only the
+    parsing by the user is recorded to the run journal.
+
+    Args:
+        source       (str | type[T] | None): [IN] Help message string or a dataclass type to be parsed.
+        argv         (list[str] | None)    : [IN] Argument vector.
+        exit_on_help (bool)                : [IN] If True, prints the help message and exits when "--help" is specified.
+        verbose      (bool)                : [IN] Displays verbose messages that are useful for debugging.
+
+    Returns:
+        (Any): Parsed command line arguments.
+    """
     # If the "source" is None, get the docstring of the caller module.
     if source is None:
 
@@ -81,27 +114,16 @@ def parse(source: str | type[T] | None = None, argv: list[str] | None = None,
     # Dedent the given docstring.
     docstr = textwrap.dedent(docstr)
 
-    # Parse the docstring and get declaration lines in target sections.
-    # Note: Automatic minimum validation will be performed for the "decl_conts" (in the context of DbC).
-    decl_conts: DeclarationContents = SectionLineSplitter(docstr, verbose).parse()
-
-    if verbose:
-
-        print(decl_conts)
-
-        # Run extra validation checks if "verbose" is True (in the context of DbC).
-        decl_conts.validate(len_docstr=len(docstr))
-
-    # Parse the declaration lines and get parsed declaration entries.
-    # Note: Automatic minimum validation will be performed for the "parsed_decl" (in the context of DbC).
-    parsed_decls: ParsedDecls = DeclarationContentsParser(docstr, decl_conts, verbose).parse()
+    # Determine the base class for the dynamically created YadOptArgs class.
+    base_cls: type = source if dataclasses.is_dataclass(source) else YadOptArgs
 
-    if verbose:
+    # Returns the arguments handed over by the launcher process if they were parsed from the same
+    # docstring and argument vector (see "yadopt.export_env"). Always parse if "verbose" is True.
+    if (not verbose) and (args_handoff := parse_from_env(docstr, argv, base_cls)) is not None:
+        return args_handoff
 
-        print(parsed_decls)
-
-        # Run extra validation checks if "verbose" is True (in the context of DbC).
-        parsed_decls.validate()
+    # Compile the docstring, that is, parse the declarations and precompute the type functions.
+    (parsed_decls, plan, groups) = compile_docstr(docstr, verbose)
 
     # Print help message and exit if --help is specified, or if the short option of help is specified.
     if has_help_option_in_argv(argv, parsed_decls.optargs):
@@ -118,7 +140,9 @@ def parse(source: str | type[T] | None = None, argv: list[str] | None = None,
         argvec.validate()
 
     # Resolve default values of options in the argument vector based on the option declarations.
-    argvec_default_resolved: DefaultResolvedArgVec = DefaultValueResolver(argvec, parsed_decls.optargs, verbose).resolve()
+    argvec_default_resolved: DefaultResolvedArgVec = DefaultValueResolver(argvec, parsed_decls.optargs, verbose,
+                                                                                parsed_decls.env_bindings,
+                                                                                parsed_decls.config_option).resolve()
 
     if verbose:
 
@@ -128,7 +152,7 @@ def parse(source: str | type[T] | None = None, argv: list[str] | None = None,
         argvec_default_resolved.validate(pos_args=parsed_decls.posargs, opt_args=parsed_decls.optargs)
 
     # Apply type hints. This function also fill default values.
-    typed_argvec: TypedArgVec = TypeAssigner(argvec_default_resolved, parsed_decls, verbose).assign_types()
+    typed_argvec: TypedArgVec = TypeAssigner(argvec_default_resolved, parsed_decls, verbose, plan).assign_types()
 
     if verbose:
 
@@ -137,6 +161,61 @@ def parse(source: str | type[T] | None = None, argv: list[str] | None = None,
         # Run extra validation checks if "verbose" is True (in the context of DbC).
         typed_argvec.validate(pos_args=parsed_decls.posargs, opt_args=parsed_decls.optargs)
 
+    # Create YadOptArgs instance.
+    args: YadOptArgs = make_yadoptargs_data(typed_argvec.pos_args | typed_argvec.opt_args, groups, base_cls,
+                                            plan.converters)
+
+    # Record the source of the arguments for "yadopt.export_env".
+    set_handoff_source(args, docstr, argv)
+
+    # Record the options filled with the declared default values, for example, for "yadopt.overlay".
+    set_defaulted(args, argvec_default_resolved.defaulted)
+
+    return args
+
+
+def compile_docstr(docstr: str, verbose: bool) -> tuple[ParsedDecls, ConverterPlan, dict[str, list[str]]]:
+    """
+    Parse the declarations in the given docstring, and precompute the type functions, the typed
+    default values, and the group information. The result is cached for each docstring, except
+    when "verbose" is True, because the verbose messages and the extra validation checks are
+    printed or run while parsing.
+
+    Args:
+        docstr  (str) : [IN] Dedented docstring.
+        verbose (bool): [IN] Displays verbose messages that are useful for debugging.
+
+    Returns:
+        (tuple[ParsedDecls, ConverterPlan, dict[str, list[str]]]): Parsed declarations, converter plan,
+                                                                   and group information.
+    """
+    if not verbose:
+        with COMPILE_CACHE_LOCK:
+            if docstr in COMPILE_CACHE:
+                return COMPILE_CACHE[docstr]
+
+    # Parse the docstring and get declaration lines in target sections.
+    # Note: Automatic minimum validation will be performed for the "decl_conts" (in the context of DbC).
+    decl_conts: DeclarationContents = SectionLineSplitter(docstr, verbose).parse()
+
+    if verbose:
+
+        print(decl_conts)
+
+        # Run extra validation checks if "verbose" is True (in the context of DbC).
+        decl_conts.validate(len_docstr=len(docstr))
+
+    # Parse the declaration lines and get parsed declaration entries.
+    # Note: Automatic minimum validation will be performed for the "parsed_decl" (in the context of DbC).
+    parsed_decls: ParsedDecls = DeclarationContentsParser(docstr, decl_conts, verbose).parse()
+
+    if verbose:
+
+        print(parsed_decls)
+
+        # Run extra validation checks if "verbose" is True (in the context of DbC).
+        parsed_decls.validate()
+
     # Get group information.
     groups: dict[str, list[str]] = {}
     for pos_arg_decl in parsed_decls.posargs:
@@ -146,11 +225,18 @@ def parse(source: str | type[T] | None = None, argv: list[str] | None = None,
         if opt_arg_decl.spec.name_alt is not None:
             groups.setdefault(opt_arg_decl.group, []).append(opt_arg_decl.spec.name_alt)
 
-    # Determine the base class for the dynamically created YadOptArgs class.
-    base_cls: type = source if dataclasses.is_dataclass(source) else YadOptArgs
+    # Type functions and typed default values are computed lazily by the plan.
+    compiled: tuple[ParsedDecls, ConverterPlan, dict[str, list[str]]] = (parsed_decls, ConverterPlan(parsed_decls),
+                                                                         groups)
+
+    # Store the compiled result. The oldest entry is removed if the cache is full.
+    if not verbose:
+        with COMPILE_CACHE_LOCK:
+            if len(COMPILE_CACHE) >= COMPILE_CACHE_SIZE:
+                del COMPILE_CACHE[next(iter(COMPILE_CACHE))]
+            COMPILE_CACHE[docstr] = compiled
 
-    # Returns YadOptArgs instance.
-    return make_yadoptargs_data(typed_argvec.pos_args | typed_argvec.opt_args, groups, base_cls)
+    return compiled
 
 
 def wrap(*pargs: Any, **kwargs: Any) -> Callable:
@@ -193,7 +279,7 @@ def to_dict(args: YadOptArgs) -> dict[str, Any]:
         (dict[str, Any]): Dictionary of the given parsed arguments.
     """
     if dataclasses.is_dataclass(args):
-        return dataclasses.asdict(args)
+        return dataclasses.asdict(untracked(args))
     raise NotImplementedError
 
 